@@ -4,7 +4,9 @@
 This shows how to use the logging utilities to prevent duplicate log messages.
 """
 
-from your_package.logging import get_logger
+import logging
+
+from dmx_analyzer.logging import get_logger
 
 # Module-level logger - will be created only once
 logger = get_logger(__name__)
@@ -74,8 +76,11 @@ if __name__ == "__main__":
 
     print("\n=== No Duplicate Messages ===")
     # Even with repeated logger creation, no duplicates
-    for i in range(5):
-        temp_logger = get_logger("temp.example")
-        temp_logger.info(
-            "Iteration %d - this should appear only once per iteration", i + 1
-        )
+    temp_logger = get_logger("temp.example")
+    # Check the level once instead of building a record per iteration
+    if temp_logger.isEnabledFor(logging.INFO):
+        for i in range(5):
+            temp_logger = get_logger("temp.example")
+            temp_logger.info(
+                "Iteration %d - this should appear only once per iteration", i + 1
+            )
@@ -1,14 +1,33 @@
 """DMX Music Analyzer - A tool for generating DMX lighting timelines from music analysis."""
 
-__version__ = "0.1.0"
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from ._lazy import lazy_exports
+
+# The redundant alias marks the version as a deliberate re-export
+from ._version import __version__ as __version__
+
 __author__ = "Jarda"
 __email__ = "jarda@example.com"
 
-from .models import AudioAnalysis
-from .models import DMXEvent
-from .models import DMXTimeline
-from .music_analyzer import MusicAnalyzer
-from .timeline_generator import TimelineGenerator
+if TYPE_CHECKING:
+    from .models import AudioAnalysis
+    from .models import DMXEvent
+    from .models import DMXTimeline
+    from .music_analyzer import MusicAnalyzer
+    from .timeline_generator import TimelineGenerator
+
+# Public names resolved on first access (PEP 562) so that importing the
+# package does not pull in librosa/numpy until they are actually needed
+_LAZY_ATTRS = {
+    "AudioAnalysis": ".models",
+    "DMXEvent": ".models",
+    "DMXTimeline": ".models",
+    "MusicAnalyzer": ".music_analyzer",
+    "TimelineGenerator": ".timeline_generator",
+}
 
 __all__ = [
     "AudioAnalysis",
@@ -17,3 +36,5 @@ __all__ = [
     "MusicAnalyzer",
     "TimelineGenerator",
 ]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
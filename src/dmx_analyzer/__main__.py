@@ -1,29 +1,152 @@
 """Main CLI entry point."""
 
+import logging
+import os
+import stat
 import sys
 from pathlib import Path
+from typing import NoReturn
 
 import click
 
-from dmx_analyzer import __version__
+from dmx_analyzer._version import __version__
+from dmx_analyzer.logging import flush_logs
 from dmx_analyzer.logging import get_logger
 
+# ``python -m dmx_analyzer`` runs this file as ``__main__``; importing it again
+# as ``dmx_analyzer.__main__`` would register every Click command a second time
+_main_spec = getattr(sys.modules.get("__main__"), "__spec__", None)
+if (
+    __name__ != "__main__"
+    and _main_spec is not None
+    and _main_spec.name == __spec__.name
+):
+    msg = f"{__spec__.name} is already running as __main__"
+    raise ImportError(msg)
+
 # Get logger for this module - will be created only once
 logger = get_logger(__name__)
 
 
+class StatPath(click.Path):
+    """Existing-file parameter type that keeps the ``stat()`` from validation.
+
+    The result is stored on ``ctx.obj`` as ``"<param name>_stat"`` so commands
+    can hand it downstream instead of checking the same file again.
+    """
+
+    def __init__(self) -> None:
+        """Initialize as an existing-file type returning ``Path`` objects."""
+        super().__init__(exists=True, dir_okay=False, path_type=Path)
+
+    def convert(
+        self,
+        value: str | os.PathLike[str],
+        param: click.Parameter | None,
+        ctx: click.Context | None,
+    ) -> Path:
+        """Validate like ``click.Path``, with one ``stat()`` for a valid file."""
+        path = Path(value)
+        try:
+            stat_result = path.stat()
+        except OSError:
+            stat_result = None
+
+        if (
+            stat_result is None
+            or not stat.S_ISREG(stat_result.st_mode)
+            or not os.access(path, os.R_OK)
+        ):
+            # Anything but a readable regular file gets Click's own checks
+            # and error messages
+            return super().convert(value, param, ctx)
+
+        if ctx is not None and param is not None:
+            ctx.ensure_object(dict)[f"{param.name}_stat"] = stat_result
+
+        return path
+
+
+# Parameter types are stateless, so every command shares the same instances;
+# only analyze's audio file passes its stat() on, the others need none
+_STAT_FILE = StatPath()
+_EXISTING_FILE = click.Path(exists=True, dir_okay=False, path_type=Path)
+_OUTPUT_PATH = click.Path(path_type=Path)
+
+# Errors the commands expect from bad input; anything else reaches main()
+_USER_ERRORS = (OSError, ValueError, RuntimeError)
+
+# Checked once at import; banners are skipped when stdout is piped
+_TTY = sys.stdout.isatty()
+
+# Options shared by the timeline-producing commands
+_output_option = click.option(
+    "--output", "-o", type=_OUTPUT_PATH, help="Output timeline file path"
+)
+_dry_run_option = click.option(
+    "--dry-run", is_flag=True, help="Show what would be done without making changes"
+)
+_cache_option = click.option(
+    "--cache",
+    is_flag=True,
+    help="Reuse analyses stored in ~/.dmx_analyzer/cache and store new ones",
+)
+
+
+def emit(fmt: str, *args: object) -> None:
+    """Echo a %-style progress message unless ``--quiet`` was given.
+
+    Formatting is deferred until we know the message will be shown.
+    """
+    ctx = click.get_current_context(silent=True)
+    if ctx is not None and ctx.obj and ctx.obj.get("quiet"):
+        return
+    click.echo(fmt % args if args else fmt)
+
+
+def fail(message: str, log_message: str, exc: Exception) -> NoReturn:
+    """Report an expected error and exit with status 1.
+
+    Args:
+        message: Text echoed to stderr
+        log_message: Prefix for the logged error
+        exc: The error being reported
+    """
+    click.echo(message, err=True)
+    logger.error("%s: %s", log_message, exc)
+    sys.exit(1)
+
+
+def banner(fmt: str, *args: object) -> None:
+    """Emit a decorative progress banner, only for interactive terminals.
+
+    Piped or redirected runs keep just the summaries, which callers parse.
+    """
+    if _TTY:
+        emit(fmt, *args)
+
+
 @click.group()
 @click.version_option(__version__)
-@click.option("-v", "--verbose", is_flag=True, help="Enable verbose logging")
+@click.option(
+    "-v",
+    "--verbose",
+    is_flag=True,
+    envvar="DMX_VERBOSE",
+    help="Enable verbose logging",
+)
+@click.option("-q", "--quiet", is_flag=True, help="Suppress progress output")
 @click.option(
     "--config",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_FILE,
     help="Configuration file path",
 )
 @click.pass_context
-def cli(ctx: click.Context, *, verbose: bool, config: Path | None) -> None:
+def cli(ctx: click.Context, *, verbose: bool, quiet: bool, config: Path | None) -> None:
     """DMX lighting control system with music analysis for sauna environments."""
     ctx.ensure_object(dict)
+    ctx.obj["quiet"] = quiet
+    ctx.obj["verbose"] = verbose
 
     # Set up logging based on verbosity
     if verbose:
@@ -31,156 +154,176 @@ def cli(ctx: click.Context, *, verbose: bool, config: Path | None) -> None:
         debug_logger = get_logger(__name__, level="DEBUG")
         debug_logger.debug("Verbose logging enabled")
 
-    if config:
+    if config and logger.isEnabledFor(logging.INFO):
         logger.info("Using config file: %s", config)
         # Load custom config here
 
 
 @cli.command()
-@click.argument("audio_file", type=click.Path(exists=True, path_type=Path))
-@click.option(
-    "--output", "-o", type=click.Path(path_type=Path), help="Output timeline file path"
-)
+@click.argument("audio_file", type=_STAT_FILE)
+@_output_option
 @click.option(
     "--dmx-config",
-    type=click.Path(exists=True, path_type=Path),
+    type=_EXISTING_FILE,
     help="DMX fixtures configuration file",
 )
 @click.option("--bpm", type=float, help="Override detected BPM")
-@click.option(
-    "--dry-run", is_flag=True, help="Show what would be done without making changes"
-)
+@_cache_option
+@_dry_run_option
+@click.pass_context
 def analyze(
+    ctx: click.Context,
     audio_file: Path,
     output: Path | None,
     dmx_config: Path | None,
     bpm: float | None,
     *,
+    cache: bool,
     dry_run: bool,
 ) -> None:
     """Analyze audio file and generate DMX timeline."""
     if dry_run:
-        click.echo(f"Would analyze {audio_file} -> {output or 'auto-generated'}")
-        logger.info("Dry run mode: analyzing %s", audio_file)
+        emit("Would analyze %s -> %s", audio_file, output or "auto-generated")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Dry run mode: analyzing %s", audio_file)
         return
 
     # Standard analysis
     from .music_analyzer import MusicAnalyzer
     from .timeline_generator import TimelineGenerator
 
-    try:
-        click.echo(f"🎵 Analyzing audio file: {audio_file}...")
-
-        # Create analyzer
-        analyzer = MusicAnalyzer()
-        analysis = analyzer.analyze_file(audio_file, bpm)
-
-        click.echo(f"✓ BPM detected: {analysis.features.bpm:.1f}")
-        click.echo(f"✓ Duration: {analysis.duration:.1f}s")
-        click.echo(f"✓ Energy: {analysis.features.energy:.2f}")
-        click.echo(f"✓ Valence: {analysis.features.valence:.2f}")
+    banner("🎵 Analyzing audio file: %s...", audio_file)
 
-        # Generate timeline
-        generator = TimelineGenerator()
+    # Create analyzer
+    analyzer = MusicAnalyzer(cache="default" if cache else None)
+    try:
+        analysis = analyzer.analyze_file(
+            audio_file, bpm, stat_result=ctx.obj.get("audio_file_stat")
+        )
+    except _USER_ERRORS as e:
+        fail(f"❌ Error: {e}", "Analysis failed", e)
+
+    # One write for the whole feature summary
+    emit(
+        "✓ BPM detected: %.1f\n✓ Duration: %.1fs\n✓ Energy: %.2f\n✓ Valence: %.2f",
+        analysis.features.bpm,
+        analysis.duration,
+        analysis.features.energy,
+        analysis.features.valence,
+    )
+
+    # Generate timeline
+    generator = TimelineGenerator()
+    try:
         if dmx_config:
             generator.load_fixtures(dmx_config)
 
         timeline = generator.generate_timeline(analysis, output)
+    except _USER_ERRORS as e:
+        fail(f"❌ Error: {e}", "Timeline generation failed", e)
 
-        click.echo(f"✓ Generated timeline with {len(timeline.events)} events")
-
-    except Exception as e:
-        click.echo(f"❌ Error: {e}", err=True)
-        logger.error("Analysis failed: %s", e)
-        sys.exit(1)
+    emit("✓ Generated timeline with %d events", len(timeline.events))
 
 
 @cli.command()
-@click.argument("audio_file", type=click.Path(exists=True, path_type=Path))
-@click.option(
-    "--output", "-o", type=click.Path(path_type=Path), help="Output timeline file path"
-)
-@click.option(
-    "--dry-run", is_flag=True, help="Show what would be done without making changes"
-)
+@click.argument("audio_file", type=_EXISTING_FILE)
+@_output_option
+@_cache_option
+@_dry_run_option
 def spectacular(
     audio_file: Path,
     output: Path | None,
     *,
+    cache: bool,
     dry_run: bool,
 ) -> None:
     """Generate spectacular lighting show with advanced analysis."""
     if dry_run:
-        click.echo(
-            f"Would create spectacular show for {audio_file} -> {output or 'auto-generated'}"
+        emit(
+            "Would create spectacular show for %s -> %s",
+            audio_file,
+            output or "auto-generated",
         )
         return
 
     from .spectacular_timeline_generator import create_spectacular_timeline
 
-    try:
-        click.echo(f"🎼 Creating spectacular lighting show for: {audio_file}...")
-        click.echo("🔬 Running advanced music analysis...")
-
-        # Generate output path if not provided
-        if not output:
-            output = audio_file.with_suffix(".tml")
+    banner("🎼 Creating spectacular lighting show for: %s...", audio_file)
+    banner("🔬 Running advanced music analysis...")
 
-        # Create spectacular timeline
-        timeline = create_spectacular_timeline(audio_file, output)
+    # Generate output path if not provided
+    if not output:
+        output = audio_file.with_suffix(".tml")
 
-        click.echo(
-            f"✨ Spectacular timeline created with {len(timeline.events)} effects!"
+    # Create spectacular timeline
+    try:
+        timeline = create_spectacular_timeline(
+            audio_file, output, cache="default" if cache else None
+        )
+    except _USER_ERRORS as e:
+        fail(
+            f"❌ Error creating spectacular show: {e}",
+            "Spectacular generation failed",
+            e,
         )
-        click.echo(f"💾 Saved to: {output}")
-
-        # Show analysis summary
-        click.echo("\n🎯 Analysis Summary:")
-        click.echo(f"   Duration: {timeline.audio_length}")
-        click.echo(f"   Events: {len(timeline.events)}")
-        click.echo(f"   Timelines: {timeline.light_timelines}")
 
-    except Exception as e:
-        click.echo(f"❌ Error creating spectacular show: {e}", err=True)
-        logger.error("Spectacular generation failed: %s", e)
-        sys.exit(1)
+    # Result and analysis summary in a single write
+    emit(
+        "✨ Spectacular timeline created with %d effects!\n"
+        "💾 Saved to: %s\n"
+        "\n🎯 Analysis Summary:\n"
+        "   Duration: %s\n"
+        "   Events: %d\n"
+        "   Timelines: %d",
+        len(timeline.events),
+        output,
+        timeline.audio_length,
+        len(timeline.events),
+        timeline.light_timelines,
+    )
 
 
 @cli.command()
-@click.argument("timeline_file", type=click.Path(exists=True, path_type=Path))
-@click.argument("audio_file", type=click.Path(exists=True, path_type=Path))
+@click.argument("timeline_file", type=_EXISTING_FILE)
+@click.argument("audio_file", type=_EXISTING_FILE)
 def visualize(timeline_file: Path, audio_file: Path) -> None:
     """Real-time visualization of DMX timeline with audio playback."""
     try:
         from .visualizer.visualizer_app import run_visualizer
-
-        click.echo("🎥 Starting real-time visualizer...")
-        click.echo(f"   Timeline: {timeline_file}")
-        click.echo(f"   Audio: {audio_file}")
-
-        run_visualizer(timeline_file, audio_file)
-
     except ImportError as e:
         click.echo("❌ Visualization requires pygame: pip install pygame", err=True)
         click.echo(f"   Error: {e}", err=True)
         sys.exit(1)
-    except Exception as e:
-        click.echo(f"❌ Visualization error: {e}", err=True)
-        logger.error("Visualization failed: %s", e)
-        sys.exit(1)
+
+    banner("🎥 Starting real-time visualizer...")
+    emit("   Timeline: %s", timeline_file)
+    emit("   Audio: %s", audio_file)
+
+    try:
+        run_visualizer(timeline_file, audio_file)
+    except _USER_ERRORS as e:
+        fail(f"❌ Visualization error: {e}", "Visualization failed", e)
 
 
 def main() -> None:
     """Main entry point."""
+    # Shared with the click context so the handlers below can see --verbose
+    state: dict[str, object] = {}
     try:
-        cli()
+        cli(obj=state)
     except KeyboardInterrupt:
         click.echo("\nOperation cancelled.", err=True)
-        logger.warning("Operation cancelled by user")
+        logger.debug("Operation cancelled by user")
+        flush_logs()
         sys.exit(1)
     except Exception as e:
         click.echo(f"Error: {e}", err=True)
-        logger.exception("Unexpected error occurred")
+        # Only pay for traceback formatting when the user asked for details
+        if state.get("verbose"):
+            logger.exception("Unexpected error occurred")
+        else:
+            logger.error("Unexpected error: %s", e)
+        flush_logs()
         sys.exit(1)
 
 
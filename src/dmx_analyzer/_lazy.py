@@ -0,0 +1,42 @@
+"""Lazy attribute exports (PEP 562) for the package ``__init__`` modules."""
+
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def lazy_exports(
+    package: str, namespace: dict[str, object], attrs: dict[str, str]
+) -> tuple[Callable[[str], object], Callable[[], list[str]]]:
+    """Build a package's ``__getattr__`` and ``__dir__`` for lazy exports.
+
+    Args:
+        package: ``__name__`` of the package
+        namespace: The package's ``globals()``; imported values are cached
+            there, so later lookups bypass ``__getattr__``
+        attrs: Public names mapped to the relative module defining each
+
+    Returns:
+        The ``__getattr__`` and ``__dir__`` functions for the package
+    """
+
+    def __getattr__(name: str) -> object:  # noqa: N807
+        """Import public classes lazily on first attribute access."""
+        module_name = attrs.get(name)
+        if module_name is None:
+            msg = f"module {package!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+
+        value = getattr(importlib.import_module(module_name, package), name)
+        namespace[name] = value
+        return value
+
+    def __dir__() -> list[str]:  # noqa: N807
+        """List lazy attributes alongside the regular module globals."""
+        return sorted({*namespace, *attrs})
+
+    return __getattr__, __dir__
@@ -0,0 +1,3 @@
+"""Package version, kept free of imports so it is cheap to load."""
+
+__version__ = "0.1.0"
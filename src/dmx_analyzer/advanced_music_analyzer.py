@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 import warnings
+from dataclasses import dataclass
+from enum import IntEnum
 from pathlib import Path
 from typing import NamedTuple
 
 import librosa
 import numpy as np
+from audioread import NoBackendError
+from joblib import Parallel
+from joblib import delayed
+from numba import njit
 from scipy.ndimage import gaussian_filter1d
+from scipy.ndimage import maximum_filter1d
+from soundfile import LibsndfileError
 
 from .logging import get_logger
 
@@ -18,6 +26,163 @@ logger = get_logger(__name__)
 warnings.filterwarnings("ignore", category=UserWarning, module="librosa")
 
 
+# Výchozí vzorkovací frekvence a hop analýzy (sdílené s klíčem cache)
+DEFAULT_SAMPLE_RATE = 22050
+DEFAULT_HOP_LENGTH = 512
+
+# Chyby librosa.load pro nečitelný nebo nedekódovatelný soubor (soundfile,
+# záložní audioread bez backendu, chybějící či useknutý soubor)
+_LOAD_ERRORS = (LibsndfileError, NoBackendError, OSError, EOFError)
+
+# Major and minor key templates (simplified)
+MAJOR_KEY_TEMPLATE = np.array([1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1])
+MINOR_KEY_TEMPLATE = np.array([1, 0, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0])
+
+
+def _zscore(values: np.ndarray) -> np.ndarray:
+    """Z-normalizace podél poslední osy (populační směrodatná odchylka)."""
+    mean = values.mean(axis=-1, keepdims=True)
+    return (values - mean) / values.std(axis=-1, keepdims=True)
+
+
+@njit(cache=True, fastmath=True)
+def _syncopation_kernel(
+    beat_frames: np.ndarray, onset_envelope: np.ndarray, out: np.ndarray
+) -> None:
+    """Poměr off-beat a on-beat energie pro každou dvojici po sobě jdoucích beatů."""
+    n_frames = len(onset_envelope)
+    for i in range(len(beat_frames) - 1):
+        start_frame = beat_frames[i]
+        end_frame = beat_frames[i + 1]
+
+        # Find off-beat positions
+        mid_frame = (start_frame + end_frame) // 2
+        quarter_frame = (start_frame + mid_frame) // 2
+        three_quarter_frame = (mid_frame + end_frame) // 2
+
+        # Measure energy at off-beat positions
+        off_beat_energy = 0.0
+        if 0 <= quarter_frame < n_frames:
+            off_beat_energy += onset_envelope[quarter_frame]
+        if 0 <= mid_frame < n_frames:
+            off_beat_energy += onset_envelope[mid_frame]
+        if 0 <= three_quarter_frame < n_frames:
+            off_beat_energy += onset_envelope[three_quarter_frame]
+
+        # Compare to on-beat energy
+        on_beat_energy = 0.0
+        if 0 <= start_frame < n_frames:
+            on_beat_energy = onset_envelope[start_frame]
+
+        # Syncopation ratio
+        if on_beat_energy > 0.0:
+            out[i] = off_beat_energy / (3 * on_beat_energy)
+        else:
+            out[i] = 0.0
+
+
+def _analyze_segment(
+    i: int,
+    start_time: float,
+    end_time: float,
+    y: np.ndarray,
+    sr: int,
+    *,
+    global_rms: float,
+    last_index: int,
+) -> dict | None:
+    """Analýza a klasifikace jednoho segmentu skladby."""
+    # Extract segment
+    start_sample = int(start_time * sr)
+    end_sample = int(end_time * sr)
+    segment = y[start_sample:end_sample]
+
+    if len(segment) == 0:
+        return None
+
+    # Analyze segment characteristics
+    rms_energy = np.mean(librosa.feature.rms(y=segment))
+    spectral_centroid = np.mean(librosa.feature.spectral_centroid(y=segment, sr=sr))
+
+    # Classify based on energy and spectral characteristics
+    if i == 0:
+        section_type = "intro"
+    elif i == last_index:
+        section_type = "outro"
+    elif rms_energy > global_rms:
+        section_type = "chorus"
+    else:
+        section_type = "verse"
+
+    return {
+        "start_time": start_time,
+        "end_time": end_time,
+        "duration": end_time - start_time,
+        "type": section_type,
+        "energy": float(rms_energy),
+        "brightness": float(spectral_centroid),
+    }
+
+
+class FeatureIndex(IntEnum):
+    """Řádky matice FrameFeatures.data (jeden příznak na řádek)."""
+
+    SUB_BASS = 0
+    BASS = 1
+    LOW_MID = 2
+    MID = 3
+    HIGH_MID = 4
+    PRESENCE = 5
+    BRILLIANCE = 6
+    SPECTRAL_CENTROID = 7
+    SPECTRAL_BANDWIDTH = 8
+    SPECTRAL_ROLLOFF = 9
+    ZERO_CROSSING_RATE = 10
+    RMS_ENERGY = 11
+    PEAK_ENERGY = 12
+    TEMPO = 13
+
+
+@dataclass
+class FrameFeatures:
+    """Snímkové příznaky se sdílenou časovou osou (structure of arrays).
+
+    Všechny křivky leží v jedné souvislé float32 matici tvaru
+    ``(len(FeatureIndex), n_frames)``; pole v NamedTuple výsledcích jsou
+    pohledy na její řádky.
+    """
+
+    data: np.ndarray
+    sr: int
+    hop: int
+
+    @classmethod
+    def empty(cls, n_frames: int, sr: int, hop: int) -> FrameFeatures:
+        """Alokuje matici pro ``n_frames`` snímků."""
+        return cls(np.zeros((len(FeatureIndex), n_frames), dtype=np.float32), sr, hop)
+
+    @property
+    def n_frames(self) -> int:
+        """Počet snímků na časové ose."""
+        return self.data.shape[1]
+
+    @property
+    def times(self) -> np.ndarray:
+        """Časy snímků v sekundách."""
+        return librosa.frames_to_time(
+            np.arange(self.n_frames), sr=self.sr, hop_length=self.hop
+        )
+
+    def __getitem__(self, index: FeatureIndex) -> np.ndarray:
+        """Pohled na řádek daného příznaku."""
+        return self.data[index]
+
+    def store(self, index: FeatureIndex, values: np.ndarray) -> np.ndarray:
+        """Uloží křivku příznaku do matice a vrátí pohled na její řádek."""
+        self.data[index] = values
+        return self.data[index]
+
+
 class FrequencyBands(NamedTuple):
     """Frequency band analysis results."""
 
@@ -52,6 +217,7 @@ class RhythmAnalysis(NamedTuple):
     tempo_curve: np.ndarray  # Změny tempa v čase
     rhythm_pattern: np.ndarray  # Rytmický vzor
     syncopation: np.ndarray  # Míra synkopace
+    tempo: float  # Globální tempo (BPM)
 
 
 class DynamicsAnalysis(NamedTuple):
@@ -68,16 +234,24 @@ class DynamicsAnalysis(NamedTuple):
 class AdvancedMusicAnalyzer:
     """Pokročilý analyzátor hudby pro spektakulární světelné efekty."""
 
-    def __init__(self, sample_rate: int = 44100, hop_length: int = 512):
+    def __init__(
+        self,
+        sample_rate: int = DEFAULT_SAMPLE_RATE,
+        hop_length: int = DEFAULT_HOP_LENGTH,
+    ):
         """Initialize advanced analyzer.
 
         Args:
-            sample_rate: Vyšší sample rate pro lepší kvalitu
-            hop_length: Menší hop pro vyšší časové rozlišení
+            sample_rate: Sample rate analýzy; 22 050 Hz pokrývá všechna
+                sledovaná pásma i beat tracking
+            hop_length: Posun snímků; výchozích 512 vzorků při 22,05 kHz
+                odpovídá mřížce beatů a onsetů, ``hi_res`` analýza používá
+                44,1 kHz s hopem 256
         """
         self.sample_rate = sample_rate
         self.hop_length = hop_length
         self.frame_length = hop_length * 4
+        self.n_fft = 4096  # Vyšší FFT pro lepší frekvenční rozlišení
 
         # Frekvenční pásma pro spektrální analýzu
         self.frequency_bands = {
@@ -89,6 +263,18 @@ class AdvancedMusicAnalyzer:
             "presence": (4000, 6000),
             "brilliance": (6000, 22050),
         }
+        self._band_slice_cache: dict[int, dict[str, slice]] = {}
+
+        # Durové a mollové šablony ve všech 12 transpozicích (řádky v pořadí
+        # C dur, C moll, C# dur, ...), z-normalizované pro korelaci násobením
+        key_templates = np.stack(
+            [
+                np.roll(template, shift)
+                for shift in range(12)
+                for template in (MAJOR_KEY_TEMPLATE, MINOR_KEY_TEMPLATE)
+            ]
+        )
+        self._key_templates = _zscore(key_templates)
 
     def analyze_comprehensive(self, audio_path: Path) -> dict:
         """Kompletní analýza pro maximální efekt.
@@ -98,86 +284,164 @@ class AdvancedMusicAnalyzer:
 
         Returns:
             Slovník s kompletní analýzou
+
+        Raises:
+            ValueError: Pokud soubor nelze načíst nebo dekódovat
         """
         logger.info(f"Spouštím pokročilou analýzu: {audio_path}")
 
-        # Load audio with high quality
-        y, sr = librosa.load(str(audio_path), sr=self.sample_rate, mono=True)
+        # Load audio; rychlé převzorkování stačí pro analytické příznaky.
+        # Celý řetězec běží ve float32 (STFT je pak complex64).
+        try:
+            y, sr = librosa.load(
+                str(audio_path),
+                sr=self.sample_rate,
+                mono=True,
+                res_type="soxr_lq",
+                dtype=np.float32,
+            )
+        except _LOAD_ERRORS as e:
+            # NoBackendError nemá text, ukaž aspoň typ chyby
+            msg = f"Could not load audio file: {str(e) or type(e).__name__}"
+            raise ValueError(msg) from e
 
         logger.debug(f"Loaded: {len(y) / sr:.2f}s at {sr}Hz")
 
+        # Jedno STFT sdílené všemi spektrálními analýzami: amplitudu čtou
+        # spektrální příznaky a pásma, výkon jen chroma a mel spectrogram
+        stft = librosa.stft(y, hop_length=self.hop_length, n_fft=self.n_fft)
+        magnitude = np.abs(stft).astype(np.float32, copy=False)
+        power_spec = magnitude**2
+        chroma = librosa.feature.chroma_stft(S=power_spec, sr=sr)
+
+        # Snímkové křivky všech analýz se zapisují do jedné float32 matice
+        frames = FrameFeatures.empty(magnitude.shape[1], sr, self.hop_length)
+
+        # Onset envelope sdílená beat trackingem a křivkou tempa
+        onset_envelope = librosa.onset.onset_strength(
+            y=y, sr=sr, hop_length=self.hop_length
+        ).astype(np.float32, copy=False)
+
+        spectral_features = self._extract_spectral_features(
+            y, sr, magnitude, power_spec=power_spec, chroma=chroma, frames=frames
+        )
+        rhythm = self._analyze_rhythm(onset_envelope, sr, frames)
+        dynamics = self._analyze_dynamics(y, sr, frames)
+
         analysis = {
             "duration": len(y) / sr,
             "sample_rate": sr,
-            "frequency_bands": self._analyze_frequency_bands(y, sr),
-            "spectral_features": self._extract_spectral_features(y, sr),
-            "rhythm": self._analyze_rhythm(y, sr),
-            "dynamics": self._analyze_dynamics(y, sr),
-            "harmonic": self._analyze_harmonic_content(y, sr),
-            "structure": self._detect_musical_structure(y, sr),
-            "emotional_content": self._analyze_emotional_content(y, sr),
+            "frequency_bands": self._analyze_frequency_bands(magnitude, sr, frames),
+            "spectral_features": spectral_features,
+            "rhythm": rhythm,
+            "dynamics": dynamics,
+            "harmonic": self._analyze_harmonic_content(stft, power_spec, sr),
+            "structure": self._detect_musical_structure(y, sr, chroma),
+            "emotional_content": self._analyze_emotional_content(
+                spectral_features.spectral_centroid,
+                dynamics.rms_energy,
+                rhythm.tempo,
+                sr,
+            ),
+            "frame_features": frames,
         }
 
         logger.info("Pokročilá analýza dokončena")
         return analysis
 
-    def _analyze_frequency_bands(self, y: np.ndarray, sr: int) -> FrequencyBands:
-        """Analýza frekvenčních pásem pro cílené světelné efekty."""
-        # Výpočet spectrogramu s vysokým rozlišením
-        S = np.abs(
-            librosa.stft(y, hop_length=self.hop_length, n_fft=4096)
-        )  # Vyšší FFT pro lepší frekvenční rozlišení
-
-        freqs = librosa.fft_frequencies(sr=sr, n_fft=4096)
-        times = librosa.frames_to_time(
-            np.arange(S.shape[1]), sr=sr, hop_length=self.hop_length
+    def _analyze_frequency_bands(
+        self, magnitude: np.ndarray, sr: int, frames: FrameFeatures
+    ) -> FrequencyBands:
+        """Analýza frekvenčních pásem ze sdíleného amplitudového spectrogramu."""
+        band_slices = self._band_slices(sr)
+
+        # Průměrná energie v pásmu (souvislý řez, bez kopie přes masku)
+        band_rows = np.stack(
+            [
+                magnitude[band_slice, :].mean(axis=0, dtype=np.float32)
+                for band_slice in band_slices.values()
+            ]
         )
 
-        bands = {}
-        for band_name, (low_freq, high_freq) in self.frequency_bands.items():
-            # Najdi indexy pro dané frekvenční pásmo
-            freq_mask = (freqs >= low_freq) & (freqs <= high_freq)
-
-            # Průměrná energie v pásmu
-            band_energy = np.mean(S[freq_mask, :], axis=0)
-
-            # Vyhlazení pro plynulejší přechody
-            band_energy = gaussian_filter1d(band_energy, sigma=1.0)
-
-            bands[band_name] = band_energy
+        # Vyhlazení pro plynulejší přechody, všechna pásma jedním voláním
+        # přímo do float32 řádků snímkové matice
+        gaussian_filter1d(
+            band_rows,
+            sigma=1.0,
+            axis=1,
+            output=frames.data[FeatureIndex.SUB_BASS : FeatureIndex.BRILLIANCE + 1],
+        )
 
-        return FrequencyBands(**bands)
+        return FrequencyBands(
+            **{
+                band_name: frames[FeatureIndex[band_name.upper()]]
+                for band_name in band_slices
+            }
+        )
 
-    def _extract_spectral_features(self, y: np.ndarray, sr: int) -> SpectralFeatures:
-        """Extrakce pokročilých spektrálních charakteristik."""
+    def _band_slices(self, sr: int) -> dict[str, slice]:
+        """Řezy FFT binů pro každé frekvenční pásmo, počítané jednou pro sr."""
+        slices = self._band_slice_cache.get(sr)
+        if slices is None:
+            freqs = librosa.fft_frequencies(sr=sr, n_fft=self.n_fft)
+            # Stejné hranice jako maska (freqs >= low) & (freqs <= high)
+            slices = {
+                band_name: slice(
+                    int(np.searchsorted(freqs, low_freq)),
+                    int(np.searchsorted(freqs, high_freq, side="right")),
+                )
+                for band_name, (low_freq, high_freq) in self.frequency_bands.items()
+            }
+            self._band_slice_cache[sr] = slices
+        return slices
+
+    def _extract_spectral_features(
+        self,
+        y: np.ndarray,
+        sr: int,
+        magnitude: np.ndarray,
+        *,
+        power_spec: np.ndarray,
+        chroma: np.ndarray,
+        frames: FrameFeatures,
+    ) -> SpectralFeatures:
+        """Extrakce pokročilých spektrálních charakteristik.
+
+        Centroid, bandwidth, kontrast a rolloff se počítají z amplitudy jako
+        ``librosa.feature.*(y=...)``, mel spectrogram pro MFCC z výkonu.
+        """
         # Spektrální centroid (jas zvuku)
-        centroid = librosa.feature.spectral_centroid(
-            y=y, sr=sr, hop_length=self.hop_length
-        )[0]
+        centroid = frames.store(
+            FeatureIndex.SPECTRAL_CENTROID,
+            librosa.feature.spectral_centroid(S=magnitude, sr=sr)[0],
+        )
 
         # Spektrální bandwidth (šířka zvuku)
-        bandwidth = librosa.feature.spectral_bandwidth(
-            y=y, sr=sr, hop_length=self.hop_length
-        )[0]
+        bandwidth = frames.store(
+            FeatureIndex.SPECTRAL_BANDWIDTH,
+            librosa.feature.spectral_bandwidth(S=magnitude, sr=sr)[0],
+        )
 
         # Spektrální kontrast (peak vs valley)
-        contrast = librosa.feature.spectral_contrast(
-            y=y, sr=sr, hop_length=self.hop_length
-        )
+        contrast = librosa.feature.spectral_contrast(S=magnitude, sr=sr)
 
         # Spektrální rolloff (kde je 85% energie)
-        rolloff = librosa.feature.spectral_rolloff(
-            y=y, sr=sr, hop_length=self.hop_length
-        )[0]
+        rolloff = frames.store(
+            FeatureIndex.SPECTRAL_ROLLOFF,
+            librosa.feature.spectral_rolloff(S=magnitude, sr=sr)[0],
+        )
 
         # Zero crossing rate (hrubost zvuku)
-        zcr = librosa.feature.zero_crossing_rate(y=y, hop_length=self.hop_length)[0]
-
-        # MFCC pro timbre
-        mfcc = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13, hop_length=self.hop_length)
+        zcr = frames.store(
+            FeatureIndex.ZERO_CROSSING_RATE,
+            librosa.feature.zero_crossing_rate(y=y, hop_length=self.hop_length)[0],
+        )
 
-        # Chroma pro harmonický obsah
-        chroma = librosa.feature.chroma_stft(y=y, sr=sr, hop_length=self.hop_length)
+        # MFCC pro timbre, z mel spectrogramu sdíleného STFT
+        mfcc = librosa.feature.mfcc(
+            S=librosa.power_to_db(librosa.feature.melspectrogram(S=power_spec, sr=sr)),
+            n_mfcc=13,
+        )
 
         # Tonnetz pro harmonické vztahy
         tonnetz = librosa.feature.tonnetz(y=y, sr=sr)
@@ -193,34 +457,30 @@ class AdvancedMusicAnalyzer:
             tonnetz=tonnetz,
         )
 
-    def _analyze_rhythm(self, y: np.ndarray, sr: int) -> RhythmAnalysis:
-        """Pokročilá rytmická analýza."""
+    def _analyze_rhythm(
+        self, onset_envelope: np.ndarray, sr: int, frames: FrameFeatures
+    ) -> RhythmAnalysis:
+        """Pokročilá rytmická analýza nad sdílenou onset envelope."""
         # Beat tracking s vysokou přesností
         tempo, beats = librosa.beat.beat_track(
-            y=y, sr=sr, hop_length=self.hop_length, trim=False
+            onset_envelope=onset_envelope,
+            sr=sr,
+            hop_length=self.hop_length,
+            trim=False,
         )
 
         beat_times = librosa.frames_to_time(beats, sr=sr, hop_length=self.hop_length)
 
         # Síla beatů
-        onset_envelope = librosa.onset.onset_strength(
-            y=y, sr=sr, hop_length=self.hop_length
-        )
         beat_strength = onset_envelope[beats] if len(beats) > 0 else np.array([])
 
-        # Detekce downbeatů (hlavní doby)
-        try:
-            _, downbeats = librosa.beat.beat_track(
-                y=y, sr=sr, hop_length=self.hop_length, trim=False
-            )
-            downbeat_times = librosa.frames_to_time(
-                downbeats, sr=sr, hop_length=self.hop_length
-            )
-        except:
-            downbeat_times = beat_times[::4] if len(beat_times) > 0 else np.array([])
+        # Downbeaty (hlavní doby) - každý čtvrtý beat ve 4/4
+        downbeat_times = beat_times[::4]
 
         # Tempo curve (změny tempa)
-        tempo_curve = self._estimate_tempo_curve(y, sr)
+        tempo_curve = frames.store(
+            FeatureIndex.TEMPO, self._estimate_tempo_curve(onset_envelope, sr)
+        )
 
         # Rytmický vzor
         rhythm_pattern = self._extract_rhythm_pattern(onset_envelope, beats)
@@ -235,16 +495,23 @@ class AdvancedMusicAnalyzer:
             tempo_curve=tempo_curve,
             rhythm_pattern=rhythm_pattern,
             syncopation=syncopation,
+            tempo=float(np.atleast_1d(tempo)[0]),
         )
 
-    def _analyze_dynamics(self, y: np.ndarray, sr: int) -> DynamicsAnalysis:
+    def _analyze_dynamics(
+        self, y: np.ndarray, sr: int, frames: FrameFeatures
+    ) -> DynamicsAnalysis:
         """Analýza dynamiky a energie."""
         # RMS energie
-        rms = librosa.feature.rms(y=y, hop_length=self.hop_length)[0]
+        rms = frames.store(
+            FeatureIndex.RMS_ENERGY,
+            librosa.feature.rms(y=y, hop_length=self.hop_length)[0],
+        )
 
-        # Peak energie (lokální maxima)
-        peak_energy = np.maximum(rms, np.roll(rms, 1))
-        peak_energy = np.maximum(peak_energy, np.roll(peak_energy, -1))
+        # Peak energie (lokální maxima), bez přetékání přes okraje signálu
+        peak_energy = frames.store(
+            FeatureIndex.PEAK_ENERGY, maximum_filter1d(rms, size=3, mode="nearest")
+        )
 
         # Dynamický rozsah
         dynamic_range = np.max(rms) - np.min(rms[rms > 0]) if np.any(rms > 0) else 0
@@ -268,51 +535,63 @@ class AdvancedMusicAnalyzer:
             silence_regions=silence_regions,
         )
 
-    def _analyze_harmonic_content(self, y: np.ndarray, sr: int) -> dict:
-        """Analýza harmonického obsahu."""
-        # Harmonic vs percussive separation
-        y_harmonic, y_percussive = librosa.effects.hpss(y)
+    def _analyze_harmonic_content(
+        self, stft: np.ndarray, power_spec: np.ndarray, sr: int
+    ) -> dict:
+        """Analýza harmonického obsahu ze sdíleného komplexního STFT.
+
+        ``harmonic_strength`` a ``percussive_strength`` jsou odmocniny podílu
+        spektrální energie složky a celého signálu (poměr RMS ve spektru), ne
+        poměry průměrných absolutních amplitud v čase jako dřív.
+        Časové průběhy složek (``harmonic_component``, ``percussive_component``)
+        se nevracejí, bez nich odpadá zpětná iSTFT.
+        """
+        # Harmonic vs percussive separation přímo ve spektrální oblasti,
+        # bez dalšího STFT a zpětné iSTFT
+        harmonic, percussive = librosa.decompose.hpss(stft)
+        harmonic_power = harmonic.real**2 + harmonic.imag**2
 
         # Chroma features pro harmonický obsah
-        chroma = librosa.feature.chroma_stft(
-            y=y_harmonic, sr=sr, hop_length=self.hop_length
-        )
+        chroma = librosa.feature.chroma_stft(S=harmonic_power, sr=sr)
 
         # Key detection
         key_profile = np.mean(chroma, axis=1)
-        key_correlations = []
 
-        # Major and minor key templates (simplified)
-        major_template = np.array([1, 0, 1, 0, 1, 1, 0, 1, 0, 1, 0, 1])
-        minor_template = np.array([1, 0, 1, 1, 0, 1, 0, 1, 1, 0, 1, 0])
+        # Pearsonova korelace se všemi 24 šablonami jedním maticovým součinem
+        # (profil se normalizuje jen jednou, odchylka slouží i jako test)
+        centered_profile = key_profile - key_profile.mean()
+        profile_std = centered_profile.std()
+        if profile_std > 0:
+            key_correlations = self._key_templates @ (centered_profile / profile_std)
+            best = int(np.argmax(key_correlations))
+            best_key = (
+                best // 2,
+                ("major", "minor")[best % 2],
+                float(key_correlations[best]) / 12,
+            )
+        else:
+            # Konstantní profil nekoreluje s žádnou tóninou
+            best_key = (0, "major", np.nan)
 
-        for shift in range(12):
-            major_corr = np.corrcoef(key_profile, np.roll(major_template, shift))[0, 1]
-            minor_corr = np.corrcoef(key_profile, np.roll(minor_template, shift))[0, 1]
-            key_correlations.append((shift, "major", major_corr))
-            key_correlations.append((shift, "minor", minor_corr))
-
-        # Best key match
-        best_key = max(
-            key_correlations, key=lambda x: x[2] if not np.isnan(x[2]) else -1
-        )
+        # Podíl složek jako poměr RMS, přímo ze spektrální energie bez návratu
+        # do času (zpětná iSTFT maskovaného spektra by energii mírně změnila)
+        total_energy = np.sum(power_spec)
+        # vdot(P, P) = Σ|P|² jedním průchodem bez dočasného pole výkonu
+        percussive_energy = np.vdot(percussive, percussive).real
 
         return {
-            "harmonic_component": y_harmonic,
-            "percussive_component": y_percussive,
             "chroma": chroma,
             "key_profile": key_profile,
             "estimated_key": best_key,
-            "harmonic_strength": np.mean(np.abs(y_harmonic)) / np.mean(np.abs(y)),
-            "percussive_strength": np.mean(np.abs(y_percussive)) / np.mean(np.abs(y)),
+            "harmonic_strength": np.sqrt(np.sum(harmonic_power) / total_energy),
+            "percussive_strength": np.sqrt(percussive_energy / total_energy),
         }
 
-    def _detect_musical_structure(self, y: np.ndarray, sr: int) -> dict:
+    def _detect_musical_structure(
+        self, y: np.ndarray, sr: int, chroma: np.ndarray
+    ) -> dict:
         """Detekce struktury skladby (intro, verse, chorus, outro)."""
-        # Self-similarity matrix
-        chroma = librosa.feature.chroma_stft(y=y, sr=sr, hop_length=self.hop_length)
-
-        # Compute self-similarity
+        # Self-similarity matrix ze sdílené chroma
         similarity_matrix = np.dot(chroma.T, chroma)
         similarity_matrix = (similarity_matrix + similarity_matrix.T) / 2
 
@@ -336,19 +615,17 @@ class AdvancedMusicAnalyzer:
             "similarity_matrix": similarity_matrix,
         }
 
-    def _analyze_emotional_content(self, y: np.ndarray, sr: int) -> dict:
-        """Analýza emocionálního obsahu hudby."""
+    def _analyze_emotional_content(
+        self, centroid: np.ndarray, rms: np.ndarray, tempo: float, sr: int
+    ) -> dict:
+        """Analýza emocionálního obsahu z již spočtených příznaků."""
         # Valence (pozitivita/negativita)
         # Vyšší centroid + vyšší energia = pozitivnější
-        centroid = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        rms = librosa.feature.rms(y=y)[0]
-
         valence = (np.mean(centroid) / (sr / 2) + np.mean(rms)) / 2
         valence = np.clip(valence, 0, 1)
 
         # Arousal (vzrušení/klid)
         # Vyšší tempo + vyšší energie = vyšší arousal
-        tempo, _ = librosa.beat.beat_track(y=y, sr=sr)
         arousal = (tempo / 200 + np.mean(rms)) / 2
         arousal = np.clip(arousal, 0, 1)
 
@@ -366,25 +643,19 @@ class AdvancedMusicAnalyzer:
             "valence": valence,
             "arousal": arousal,
             "emotion_category": emotion,
-            "tempo": float(tempo),
+            "tempo": tempo,
         }
 
-    def _estimate_tempo_curve(self, y: np.ndarray, sr: int) -> np.ndarray:
-        """Odhad změn tempa v čase."""
-        # Sliding window tempo analysis
-        window_length = sr * 4  # 4 second windows
-        hop_length = sr * 1  # 1 second hop
-
-        tempo_curve = []
-        for start in range(0, len(y) - window_length, hop_length):
-            window = y[start : start + window_length]
-            try:
-                tempo, _ = librosa.beat.beat_track(y=window, sr=sr)
-                tempo_curve.append(float(tempo))
-            except:
-                tempo_curve.append(120.0)  # Default tempo
-
-        return np.array(tempo_curve)
+    def _estimate_tempo_curve(self, onset_envelope: np.ndarray, sr: int) -> np.ndarray:
+        """Odhad změn tempa v čase (jedna hodnota na frame)."""
+        # Lokální autokorelace přes 4s okna místo beat trackingu v každém okně
+        return librosa.feature.tempo(
+            onset_envelope=onset_envelope,
+            sr=sr,
+            hop_length=self.hop_length,
+            aggregate=None,
+            ac_size=4.0,
+        )
 
     def _extract_rhythm_pattern(
         self, onset_envelope: np.ndarray, beats: np.ndarray
@@ -399,16 +670,14 @@ class AdvancedMusicAnalyzer:
         # Pattern length (one measure)
         pattern_length = int(beat_interval * 4)
 
-        # Extract pattern around strong beats
-        patterns = []
-        for beat in beats[::4]:  # Every 4th beat (downbeat)
-            if beat + pattern_length < len(onset_envelope):
-                pattern = onset_envelope[beat : beat + pattern_length]
-                patterns.append(pattern)
+        # Extract pattern around strong beats (every 4th beat = downbeat)
+        starts = beats[::4].astype(np.int64, copy=False)
+        starts = starts[starts + pattern_length < len(onset_envelope)]
+        if not len(starts):
+            return np.array([])
 
-        if patterns:
-            return np.mean(patterns, axis=0)
-        return np.array([])
+        # Jeden gather (takty x délka vzoru) místo smyčky přes Python list
+        return onset_envelope[starts[:, None] + np.arange(pattern_length)].mean(axis=0)
 
     def _measure_syncopation(
         self, beat_times: np.ndarray, onset_envelope: np.ndarray, sr: int
@@ -420,38 +689,11 @@ class AdvancedMusicAnalyzer:
         # Convert beat times to frames
         beat_frames = librosa.time_to_frames(
             beat_times, sr=sr, hop_length=self.hop_length
-        )
+        ).astype(np.int64)
 
-        syncopation = []
-        for i in range(len(beat_frames) - 1):
-            start_frame = beat_frames[i]
-            end_frame = beat_frames[i + 1]
-
-            # Find off-beat positions
-            mid_frame = (start_frame + end_frame) // 2
-            quarter_frame = (start_frame + mid_frame) // 2
-            three_quarter_frame = (mid_frame + end_frame) // 2
-
-            # Measure energy at off-beat positions
-            off_beat_energy = 0
-            for frame in [quarter_frame, mid_frame, three_quarter_frame]:
-                if 0 <= frame < len(onset_envelope):
-                    off_beat_energy += onset_envelope[frame]
-
-            # Compare to on-beat energy
-            on_beat_energy = (
-                onset_envelope[start_frame] if start_frame < len(onset_envelope) else 0
-            )
-
-            # Syncopation ratio
-            if on_beat_energy > 0:
-                sync_ratio = off_beat_energy / (3 * on_beat_energy)
-            else:
-                sync_ratio = 0
-
-            syncopation.append(sync_ratio)
-
-        return np.array(syncopation)
+        syncopation = np.empty(len(beat_frames) - 1, dtype=np.float32)
+        _syncopation_kernel(beat_frames, onset_envelope, syncopation)
+        return syncopation
 
     def _detect_transients(self, y: np.ndarray, sr: int) -> np.ndarray:
         """Detekce transientů (náhlých změn)."""
@@ -465,73 +707,57 @@ class AdvancedMusicAnalyzer:
     def _detect_sustain_regions(self, rms: np.ndarray) -> np.ndarray:
         """Detekce sustain regionů."""
         # Smooth RMS
-        smooth_rms = gaussian_filter1d(rms, sigma=3.0)
-
-        # Find regions with stable energy
-        energy_diff = np.abs(np.diff(smooth_rms))
-        stable_threshold = np.percentile(energy_diff, 25)
+        smooth_rms = gaussian_filter1d(rms, sigma=3.0, output=np.empty_like(rms))
 
-        sustain_mask = np.zeros_like(rms, dtype=bool)
-        sustain_mask[1:] = energy_diff < stable_threshold
+        # Find regions with stable energy; the infinite leading difference
+        # keeps the first frame out of the mask without a separate pass
+        energy_diff = np.diff(smooth_rms, prepend=np.inf)
+        np.abs(energy_diff, out=energy_diff)
+        stable_threshold = np.percentile(energy_diff[1:], 25)
 
-        return sustain_mask
+        return energy_diff < stable_threshold
 
     def _classify_sections(
         self, y: np.ndarray, sr: int, boundary_times: np.ndarray
     ) -> list[dict]:
         """Klasifikace hudebních sekcí."""
-        sections = []
-
-        for i in range(len(boundary_times) - 1):
-            start_time = boundary_times[i]
-            end_time = boundary_times[i + 1]
-
-            # Extract segment
-            start_sample = int(start_time * sr)
-            end_sample = int(end_time * sr)
-            segment = y[start_sample:end_sample]
-
-            if len(segment) == 0:
-                continue
-
-            # Analyze segment characteristics
-            rms_energy = np.mean(librosa.feature.rms(y=segment))
-            spectral_centroid = np.mean(
-                librosa.feature.spectral_centroid(y=segment, sr=sr)
-            )
-
-            # Classify based on energy and spectral characteristics
-            if i == 0:
-                section_type = "intro"
-            elif i == len(boundary_times) - 2:
-                section_type = "outro"
-            elif rms_energy > np.percentile([np.mean(librosa.feature.rms(y=y))], 75):
-                section_type = "chorus"
-            else:
-                section_type = "verse"
-
-            sections.append(
-                {
-                    "start_time": start_time,
-                    "end_time": end_time,
-                    "duration": end_time - start_time,
-                    "type": section_type,
-                    "energy": float(rms_energy),
-                    "brightness": float(spectral_centroid),
-                }
+        # Průměrná energie celé skladby, spočtená jednou pro všechny segmenty
+        global_rms = np.mean(librosa.feature.rms(y=y))
+        last_index = len(boundary_times) - 2
+
+        # librosa uvolňuje GIL, segmenty se tak analyzují paralelně ve vláknech
+        sections = Parallel(n_jobs=-1, prefer="threads")(
+            delayed(_analyze_segment)(
+                i,
+                boundary_times[i],
+                boundary_times[i + 1],
+                y,
+                sr,
+                global_rms=global_rms,
+                last_index=last_index,
             )
+            for i in range(len(boundary_times) - 1)
+        )
 
-        return sections
+        return [section for section in sections if section is not None]
 
 
-def analyze_for_lighting(audio_path: Path) -> dict:
+def analyze_for_lighting(audio_path: Path, *, hi_res: bool = False) -> dict:
     """Hlavní funkce pro analýzu hudby pro světelné efekty.
 
     Args:
         audio_path: Cesta k MP3 nebo WAV souboru
+        hi_res: Analyzovat při 44,1 kHz s hopem 256 místo 22 050 Hz a 512
 
     Returns:
         Kompletní analýza optimalizovaná pro světelné efekty
+
+    Raises:
+        ValueError: Pokud soubor nelze načíst nebo dekódovat
     """
-    analyzer = AdvancedMusicAnalyzer(sample_rate=44100, hop_length=256)
+    if hi_res:
+        analyzer = AdvancedMusicAnalyzer(sample_rate=44100, hop_length=256)
+    else:
+        analyzer = AdvancedMusicAnalyzer()
+
     return analyzer.analyze_comprehensive(audio_path)
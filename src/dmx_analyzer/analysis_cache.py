@@ -0,0 +1,125 @@
+"""Cache of audio analyses, keyed by the analyzed file's contents.
+
+Analyses are kept in memory for the rest of the process and, when a cache
+directory is given, on disk for later runs.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import TypeVar
+
+import joblib
+
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Number of analyses kept in memory, least recently used dropped first
+MEMORY_CACHE_SIZE = 16
+
+_memory: OrderedDict[str, object] = OrderedDict()
+
+
+def resolve_cache_dir(cache: str | Path | None) -> Path | None:
+    """Map an analyzer's ``cache`` argument to a cache directory.
+
+    Args:
+        cache: ``"default"`` for ``~/.dmx_analyzer/cache``, a directory path,
+            or ``None`` to keep analyses in memory only
+
+    Returns:
+        Cache directory, or ``None`` when nothing is stored on disk
+    """
+    if cache == "default":
+        # Resolved on use, so importing never depends on a home directory
+        return Path.home() / ".dmx_analyzer" / "cache"
+    return Path(cache) if cache is not None else None
+
+
+def file_digest(path: Path) -> str:
+    """Return a short content hash of a file, used in cache keys."""
+    with path.open("rb") as f:
+        return hashlib.file_digest(
+            f, lambda: hashlib.blake2b(digest_size=16)
+        ).hexdigest()
+
+
+# A TypeVar rather than PEP 695 syntax keeps the module importable on 3.11
+def cached_analysis(  # noqa: UP047
+    cache_dir: Path | None, key: str, compute: Callable[[], T]
+) -> T:
+    """Return the analysis stored under ``key``, computing it on a miss.
+
+    The last ``MEMORY_CACHE_SIZE`` analyses are served from memory; repeated
+    hits return the same object, so callers must not modify it. Unreadable
+    disk entries are recomputed. Storing on disk is best-effort: the cache
+    only saves time, so an unwritable directory is logged and the fresh
+    analysis is returned anyway.
+
+    Args:
+        cache_dir: Cache directory; ``None`` keeps the analysis in memory only
+        key: Cache key, unique for the file contents and analysis settings
+        compute: Callable running the analysis
+
+    Returns:
+        Cached or freshly computed analysis
+    """
+    if key in _memory:
+        _memory.move_to_end(key)
+        return _memory[key]
+
+    if cache_dir is None:
+        analysis = compute()
+    else:
+        analysis = _cached_on_disk(cache_dir / f"{key}.joblib", compute)
+
+    _memory[key] = analysis
+    if len(_memory) > MEMORY_CACHE_SIZE:
+        _memory.popitem(last=False)
+    return analysis
+
+
+def _cached_on_disk(cache_path: Path, compute: Callable[[], T]) -> T:  # noqa: UP047
+    """Load the analysis stored at ``cache_path``, or compute and store it."""
+    if cache_path.exists():
+        try:
+            analysis = joblib.load(cache_path)
+        except Exception as e:  # noqa: BLE001 - a broken entry is recomputed
+            logger.debug("Ignoring unreadable cache entry %s: %s", cache_path, e)
+        else:
+            logger.info("Analysis loaded from cache: %s", cache_path)
+            return analysis
+
+    analysis = compute()
+
+    # Write through a temporary file of our own so concurrent writers never
+    # collide and readers never see half an entry
+    tmp_path = None
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, suffix=".tmp", delete=False
+        ) as f:
+            tmp_path = Path(f.name)
+            joblib.dump(analysis, f)
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning("Could not store analysis in cache %s: %s", cache_path, e)
+        if tmp_path is not None:
+            tmp_path.unlink(missing_ok=True)
+    return analysis
+
+
+def clear_memory_cache() -> None:
+    """Forget the analyses kept in memory - useful for testing."""
+    _memory.clear()
@@ -0,0 +1,19 @@
+"""Programmatic API of the DMX Music Analyzer.
+
+Library users can import from here to get the analysis and timeline classes
+without touching the command-line interface or its Click dependency.
+"""
+
+from .models import AudioAnalysis
+from .models import DMXEvent
+from .models import DMXTimeline
+from .music_analyzer import MusicAnalyzer
+from .timeline_generator import TimelineGenerator
+
+__all__ = [
+    "AudioAnalysis",
+    "DMXEvent",
+    "DMXTimeline",
+    "MusicAnalyzer",
+    "TimelineGenerator",
+]
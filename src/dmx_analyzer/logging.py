@@ -2,31 +2,129 @@
 
 import logging
 import sys
+from collections.abc import Callable
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
-from rich.logging import RichHandler
+# Number of records held in memory before a batched write to the real handlers
+BUFFER_CAPACITY = 256
 
-# Keep track of configured loggers to prevent duplicates
-_configured_loggers = set()
+# Records at this level or above write out the buffer (and themselves) at once
+BUFFER_FLUSH_LEVEL = logging.ERROR
+
+# Output settings (log file, Rich console, buffering) each logger was built with
+_configured: dict[str, tuple[Path | None, bool, bool]] = {}
+
+# Handlers built for each output setting; loggers with the same settings share
+# them, so one buffer keeps the order of records across loggers
+_handlers: dict[tuple[Path | None, bool, bool], list[logging.Handler]] = {}
+
+# Levels whose isEnabledFor() answer is cached right after configuration
+_PREWARM_LEVELS = (logging.DEBUG, logging.INFO, logging.WARNING)
+
+
+class _DeferredHandler(logging.Handler):
+    """Handler that creates its real handler when the first record arrives.
+
+    Console handlers are only needed once something is actually logged, so
+    runs that never emit (``--help``, ``--version``, quiet levels) skip
+    importing Rich and building its console.
+    """
+
+    def __init__(self, factory: Callable[[], logging.Handler]) -> None:
+        """Initialize the deferred handler.
+
+        Args:
+            factory: Callable building the real handler on first use
+        """
+        super().__init__()
+        self._factory = factory
+        self._handler: logging.Handler | None = None
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Forward the record, building the real handler if needed."""
+        if self._handler is None:
+            self._handler = self._factory()
+            self._handler.setFormatter(self.formatter)
+        self._handler.handle(record)
+
+    def flush(self) -> None:
+        """Flush the real handler if it was created."""
+        if self._handler is not None:
+            self._handler.flush()
+
+    def close(self) -> None:
+        """Close the real handler if it was created."""
+        if self._handler is not None:
+            self._handler.close()
+        super().close()
+
+
+def _rich_handler() -> logging.Handler:
+    """Build the Rich console handler, importing Rich only when called."""
+    from rich.logging import RichHandler  # noqa: PLC0415
+
+    return RichHandler(rich_tracebacks=True, show_path=False, show_time=True)
+
+
+def validate_log_level(level: str | int) -> int:
+    """Convert a logging level name or number to its numeric value.
+
+    Unlike ``logging.getLevelName``, unknown names are rejected instead of
+    being mapped to a ``"Level X"`` string.
+
+    Args:
+        level: Level name (case-insensitive) or non-negative level number
+
+    Returns:
+        Numeric logging level
+
+    Raises:
+        ValueError: If the level is not a known name or is negative
+
+    Example:
+        >>> validate_log_level("debug")
+        10
+        >>> validate_log_level(30)
+        30
+    """
+    if isinstance(level, int):
+        if level < 0:
+            msg = f"Invalid log level: {level}"
+            raise ValueError(msg)
+        return level
+
+    try:
+        return logging.getLevelNamesMapping()[level.upper()]
+    except KeyError as e:
+        msg = f"Invalid log level: {level!r}"
+        raise ValueError(msg) from e
 
 
 def get_logger(
     name: str,
-    level: str = "INFO",
+    level: str | int | None = None,
     log_file: Path | None = None,
     *,
     rich_console: bool = True,
+    buffered: bool = True,
 ) -> logging.Logger:
     """Get a logger instance - configured only once per name.
 
     This prevents duplicate log messages that occur when loggers are configured
-    multiple times.
+    multiple times. ``logging.getLogger`` already returns one instance per name,
+    so handlers are only built when a logger is first seen or its output
+    settings change; later calls just return it.
 
     Args:
         name: Logger name (use __name__ or module path)
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        level: Logging level name (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            or number; ``None`` keeps the current level (INFO when new)
         log_file: Optional file path for file logging
         rich_console: Whether to use Rich formatting for console output
+        buffered: Whether to batch records in a ``MemoryHandler``; it is
+            written out when full, on ERROR and above, by flush_logs() and
+            at interpreter exit
 
     Returns:
         Configured logger instance
@@ -42,56 +140,101 @@ def get_logger(
         logger2 = get_logger(__name__)  # Same instance as logger
         ```
     """
+    # Resolve the level once; everything downstream compares plain ints
+    numeric_level = None if level is None else validate_log_level(level)
+
     logger = logging.getLogger(name)
 
-    # Create unique key for this configuration
-    config_key = f"{name}:{level}:{log_file}:{rich_console}"
-
-    # Only configure if not already configured with same parameters
-    if config_key not in _configured_loggers:
-        # Remove existing handlers to avoid duplicates
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
-
-        logger.setLevel(getattr(logging, level.upper()))
-
-        handlers = []
-
-        # Console handler with Rich formatting
-        if rich_console:
-            handlers.append(
-                RichHandler(rich_tracebacks=True, show_path=False, show_time=True)
-            )
-        else:
-            console_handler = logging.StreamHandler(sys.stdout)
-            handlers.append(console_handler)
-
-        # Optional file handler
-        if log_file:
-            log_file.parent.mkdir(parents=True, exist_ok=True)
-            file_handler = logging.FileHandler(log_file)
-            handlers.append(file_handler)
-
-        # Set formatter for all handlers
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    output = (log_file, rich_console, buffered)
+    configured = _configured.get(name)
+    if configured != output:
+        _configure_handlers(
+            logger, log_file, rich_console=rich_console, buffered=buffered
         )
+        _configured[name] = output
+        if configured is None and numeric_level is None:
+            numeric_level = logging.INFO
 
-        for handler in handlers:
-            handler.setFormatter(formatter)
-            logger.addHandler(handler)
+    if numeric_level is not None and logger.level != numeric_level:
+        logger.setLevel(numeric_level)
+        # setLevel() cleared the manager's isEnabledFor cache; fill it again so
+        # the first emit at each common level skips the getEffectiveLevel() walk
+        for prewarm_level in _PREWARM_LEVELS:
+            logger.isEnabledFor(prewarm_level)
 
-        # Prevent propagation to avoid duplicate messages
-        logger.propagate = False
+    return logger
 
-        # Mark as configured
-        _configured_loggers.add(config_key)
 
-    return logger
+def _configure_handlers(
+    logger: logging.Logger,
+    log_file: Path | None,
+    *,
+    rich_console: bool,
+    buffered: bool,
+) -> None:
+    """Replace a logger's handlers with the ones for the given output settings."""
+    _remove_handlers(logger)
+
+    # Prevent propagation so ancestor handlers never emit the same record
+    logger.propagate = False
+
+    output = (log_file, rich_console, buffered)
+    if output not in _handlers:
+        _handlers[output] = _build_handlers(
+            log_file, rich_console=rich_console, buffered=buffered
+        )
+    for handler in _handlers[output]:
+        logger.addHandler(handler)
+
+
+def _build_handlers(
+    log_file: Path | None, *, rich_console: bool, buffered: bool
+) -> list[logging.Handler]:
+    """Build the handlers writing to the given outputs."""
+    handlers = []
+
+    # Console handler with Rich formatting, created on the first record
+    if rich_console:
+        handlers.append(_DeferredHandler(_rich_handler))
+    else:
+        console_handler = logging.StreamHandler(sys.stdout)
+        handlers.append(console_handler)
+
+    # Optional file handler
+    if log_file:
+        log_file.parent.mkdir(parents=True, exist_ok=True)
+        file_handler = logging.FileHandler(log_file)
+        handlers.append(file_handler)
+
+    # Set formatter for all handlers
+    formatter = logging.Formatter(
+        "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
+
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    if not buffered:
+        return handlers
+    return [
+        MemoryHandler(BUFFER_CAPACITY, flushLevel=BUFFER_FLUSH_LEVEL, target=handler)
+        for handler in handlers
+    ]
+
+
+def _remove_handlers(logger: logging.Logger) -> None:
+    """Detach a logger's handlers, writing out records they buffered."""
+    for handler in logger.handlers[:]:
+        logger.removeHandler(handler)
+        handler.flush()
 
 
 def setup_logging(
-    level: str = "INFO", log_file: Path | None = None, *, rich_console: bool = True
+    level: str | int = "INFO",
+    log_file: Path | None = None,
+    *,
+    rich_console: bool = True,
+    buffered: bool = True,
 ) -> logging.Logger:
     """Set up root logger configuration.
 
@@ -102,19 +245,36 @@ def setup_logging(
         level: Logging level
         log_file: Optional file path for file logging
         rich_console: Whether to use Rich formatting
+        buffered: Whether to batch records in a ``MemoryHandler``
 
     Returns:
         Configured root logger
     """
-    return get_logger("root", level, log_file, rich_console=rich_console)
+    return get_logger(
+        "root", level, log_file, rich_console=rich_console, buffered=buffered
+    )
+
+
+def flush_logs() -> None:
+    """Write out records buffered by any configured logger."""
+    for handlers in _handlers.values():
+        for handler in handlers:
+            handler.flush()
 
 
 def clear_logger_cache() -> None:
-    """Clear the logger cache - useful for testing."""
-    _configured_loggers.clear()
+    """Forget logger configurations - useful for testing."""
+    _configured.clear()
 
     # Also remove all handlers from all loggers
     for logger_name in list(logging.Logger.manager.loggerDict.keys()):
-        logger = logging.getLogger(logger_name)
-        for handler in logger.handlers[:]:
-            logger.removeHandler(handler)
+        _remove_handlers(logging.getLogger(logger_name))
+
+    # Closing a MemoryHandler leaves its target open
+    for handlers in _handlers.values():
+        for handler in handlers:
+            target = getattr(handler, "target", None)
+            handler.close()
+            if target is not None:
+                target.close()
+    _handlers.clear()
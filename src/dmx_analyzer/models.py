@@ -2,13 +2,25 @@
 
 from __future__ import annotations
 
+import re
 from enum import Enum
 from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
 
 from pydantic import BaseModel
 from pydantic import Field
+from pydantic import PrivateAttr
 from pydantic import validator
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# H:MM:SS.f with hours 0-23, minutes/seconds 0-59 and up to 3 fraction digits;
+# the character classes enforce the ranges, so no int() parsing is needed
+_START_TIME_RE = re.compile(r"(?:[01]?\d|2[0-3]):[0-5]?\d:[0-5]?\d(?:\.\d{1,3})?")
+
 
 class SpeedType(Enum):
     """DMX timeline speed types."""
@@ -51,12 +63,26 @@ class DMXFixture(BaseModel):
     group: str = Field(..., description="Fixture group")
     channels: int = Field(..., gt=0, description="Number of DMX channels")
 
+    # Number of attribute assignments on any fixture; fixture selections made
+    # before the latest assignment are stale
+    edits: ClassVar[int] = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute, counting fixture edits."""
+        super().__setattr__(name, value)
+        DMXFixture.edits += 1
+
 
 class DMXEvent(BaseModel):
     """Individual DMX timeline event."""
 
     timeline_index: int = Field(..., description="Timeline track number")
     start_time: str = Field(..., description="Start time (H:MM:SS.f format)")
+    start_seconds: float | None = Field(
+        None,
+        exclude=True,
+        description="Unrounded start time in seconds, if known (used for sorting)",
+    )
     path: str = Field(..., description="Scene file path or command")
     length: str | None = Field(None, description="Event duration")
     speed: int = Field(100, ge=1, le=100, description="Effect speed percentage")
@@ -68,38 +94,63 @@ class DMXEvent(BaseModel):
     bpm: int | None = Field(None, description="BPM for beat-synced events")
     volume: int | None = Field(None, description="Volume level")
 
+    # Number of start_time assignments on any event; timeline indexes built
+    # before the latest assignment are stale
+    start_time_edits: ClassVar[int] = 0
+
     @validator("start_time")
     def validate_start_time(cls, v: str) -> str:
         """Validate time format."""
-        try:
-            # Parse H:MM:SS.f format
-            parts = v.split(":")
-            if len(parts) != 3:
-                raise ValueError("Invalid time format")
+        if _START_TIME_RE.fullmatch(v) is None:
+            msg = f"Invalid time format: {v}"
+            raise ValueError(msg)
+        return v
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute, counting start time edits."""
+        super().__setattr__(name, value)
+        if name == "start_time":
+            DMXEvent.start_time_edits += 1
+
+
+class TrackedList(list):
+    """List that counts its own changes.
+
+    ``version`` grows with every mutating call, so a value derived from the
+    list can tell in O(1) whether it is still current.
+    """
 
-            hours = int(parts[0])
-            minutes = int(parts[1])
+    version = 0
 
-            # Handle seconds with milliseconds
-            sec_parts = parts[2].split(".")
-            seconds = int(sec_parts[0])
 
-            if len(sec_parts) == 2:
-                milliseconds = int(sec_parts[1])
-            else:
-                milliseconds = 0
+def _counting(name: str) -> Any:  # noqa: ANN401
+    """Wrap a mutating list method to bump ``TrackedList.version``."""
+    method = getattr(list, name)
 
-            if not (
-                0 <= hours <= 23
-                and 0 <= minutes <= 59
-                and 0 <= seconds <= 59
-                and 0 <= milliseconds <= 999
-            ):
-                raise ValueError("Time values out of range")
+    def wrapper(self: TrackedList, *args: Any, **kwargs: Any) -> Any:  # noqa: ANN401
+        self.version += 1
+        return method(self, *args, **kwargs)
 
-            return v
-        except (ValueError, IndexError) as e:
-            raise ValueError(f"Invalid time format: {v}") from e
+    wrapper.__name__ = name
+    wrapper.__doc__ = method.__doc__
+    return wrapper
+
+
+for _name in (
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+):
+    setattr(TrackedList, _name, _counting(_name))
 
 
 class DMXTimeline(BaseModel):
@@ -117,66 +168,123 @@ class DMXTimeline(BaseModel):
     events: list[DMXEvent] = Field(default_factory=list, description="Timeline events")
     fixtures: list[DMXFixture] = Field(default_factory=list, description="DMX fixtures")
 
+    # Events grouped by start time, built on the first lookup, and the
+    # (events list, list version, start time edits) it was built from
+    _events_by_time: dict[str, list[DMXEvent]] | None = PrivateAttr(default=None)
+    _index_state: tuple[object, int | None, int] | None = PrivateAttr(default=None)
+
+    @validator("events")
+    def track_events(cls, v: list[DMXEvent]) -> list[DMXEvent]:
+        """Hold the events in a list that records its changes."""
+        return TrackedList(v)
+
+    def __setattr__(self, name: str, value: Any) -> None:  # noqa: ANN401
+        """Set an attribute, keeping an assigned events list tracked."""
+        if name == "events" and not isinstance(value, TrackedList):
+            value = TrackedList(value)
+        super().__setattr__(name, value)
+
+    def _current_index_state(self) -> tuple[object, int | None, int]:
+        """Return the state an up-to-date index must have been built from."""
+        # Lists not created through validation or assignment have no version
+        # and are re-indexed on every lookup
+        version = getattr(self.events, "version", None)
+        return self.events, version, DMXEvent.start_time_edits
+
+    def _index_is_current(self) -> bool:
+        """Check whether the start time index reflects the events."""
+        state = self._index_state
+        if state is None or self._events_by_time is None:
+            return False
+        events, version, edits = self._current_index_state()
+        return (
+            state[0] is events and version is not None and state[1:] == (version, edits)
+        )
+
     def add_event(self, event: DMXEvent) -> None:
         """Add an event to the timeline."""
+        index_is_current = self._index_is_current()
         self.events.append(event)
+        if index_is_current:
+            self._events_by_time.setdefault(event.start_time, []).append(event)
+            self._index_state = self._current_index_state()
 
     def get_events_at_time(self, time_str: str) -> list[DMXEvent]:
         """Get all events starting at a specific time."""
-        return [event for event in self.events if event.start_time == time_str]
+        if not self._index_is_current():
+            events_by_time: dict[str, list[DMXEvent]] = {}
+            for event in self.events:
+                events_by_time.setdefault(event.start_time, []).append(event)
+            self._events_by_time = events_by_time
+            self._index_state = self._current_index_state()
+
+        return list(self._events_by_time.get(time_str, ()))
 
     def to_tml_format(self) -> str:
         """Convert timeline to .tml file format."""
-        lines = []
+        return "".join(self.iter_tml_blocks())
+
+    def iter_tml_blocks(self) -> Iterator[str]:
+        """Yield the .tml file text block by block.
 
+        Joining the blocks gives exactly ``to_tml_format()``; writing them one
+        by one avoids holding the whole file in memory.
+        """
         # Header section
-        lines.append("[Params]")
-        lines.append(f"Version = {self.version}")
-        lines.append("CommentTimeLine = 0")
-        lines.append(f"LightTimeLines = {self.light_timelines}")
-        lines.append(f"MediaTimeLines = {self.media_timelines}")
-        lines.append(f"ShowWaveForm = {1 if self.show_waveform else 0}")
-        lines.append(f"MaxTime = {self.max_time}")
-        lines.append("Zoom = 0")
+        yield (
+            "[Params]\n"
+            f"Version = {self.version}\n"
+            "CommentTimeLine = 0\n"
+            f"LightTimeLines = {self.light_timelines}\n"
+            f"MediaTimeLines = {self.media_timelines}\n"
+            f"ShowWaveForm = {1 if self.show_waveform else 0}\n"
+            f"MaxTime = {self.max_time}\n"
+            "Zoom = 0\n"
+        )
 
         # Timeline labels
-        lines.append("TimeLine_1 = V I D E O   P I C T U R E   T I M E L I N E")
-        lines.append("TimeLine_2 = A U D I O   T I M E L I N E")
+        yield "TimeLine_1 = V I D E O   P I C T U R E   T I M E L I N E\n"
+        yield "TimeLine_2 = A U D I O   T I M E L I N E"
         for i in range(self.light_timelines):
-            lines.append(
-                f"TimeLine_{i + 3} = L I G H T   S C E N E   T I M E L I N E   #   {i + 1}"
+            yield (
+                f"\nTimeLine_{i + 3} = "
+                f"L I G H T   S C E N E   T I M E L I N E   #   {i + 1}"
             )
 
         # Audio event (if present)
         if self.audio_file and self.audio_length:
-            lines.append("[Event_0]")
-            lines.append("TimeLineIndex = 2")
-            lines.append("StartTime = 0:00:00.0")
-            lines.append(f"Path = {self.audio_file}")
-            lines.append(f"Length = {self.audio_length}")
+            yield (
+                "\n[Event_0]\n"
+                "TimeLineIndex = 2\n"
+                "StartTime = 0:00:00.0\n"
+                f"Path = {self.audio_file}\n"
+                f"Length = {self.audio_length}"
+            )
 
-        # DMX events
+        # DMX events, one block per event; every block starts with its own
+        # newline so the output has no trailing newline
         for i, event in enumerate(self.events, 1):
-            lines.append(f"[Event_{i}]")
-            lines.append(f"TimeLineIndex = {event.timeline_index}")
-            lines.append(f"StartTime = {event.start_time}")
-            lines.append(f"Path = {event.path}")
-
+            optional = ""
             if event.length:
-                lines.append(f"Length = {event.length}")
+                optional += f"Length = {event.length}\n"
             if event.fade_in:
-                lines.append(f"FadeIn = {event.fade_in}")
+                optional += f"FadeIn = {event.fade_in}\n"
             if event.fade_out:
-                lines.append(f"FadeOut = {event.fade_out}")
+                optional += f"FadeOut = {event.fade_out}\n"
             if event.bpm:
-                lines.append(f"BPM = {event.bpm}")
+                optional += f"BPM = {event.bpm}\n"
             if event.volume is not None:
-                lines.append(f"Volume = {event.volume}")
-
-            lines.append(f"Speed = {event.speed}")
-            lines.append(f"SpeedType = {event.speed_type.value}")
-
-        return "\n".join(lines)
+                optional += f"Volume = {event.volume}\n"
+
+            yield (
+                f"\n[Event_{i}]\n"
+                f"TimeLineIndex = {event.timeline_index}\n"
+                f"StartTime = {event.start_time}\n"
+                f"Path = {event.path}\n"
+                f"{optional}"
+                f"Speed = {event.speed}\n"
+                f"SpeedType = {event.speed_type.value}"
+            )
 
 
 class GenerationConfig(BaseModel):
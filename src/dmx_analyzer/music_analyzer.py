@@ -4,15 +4,23 @@ from __future__ import annotations
 
 import warnings
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import librosa
 import numpy as np
 from mutagen import File as MutagenFile
 
+from ._version import __version__
+from .analysis_cache import cached_analysis
+from .analysis_cache import file_digest
+from .analysis_cache import resolve_cache_dir
 from .logging import get_logger
 from .models import AudioAnalysis
 from .models import AudioFeatures
 
+if TYPE_CHECKING:
+    import os
+
 logger = get_logger(__name__)
 
 # Suppress librosa warnings
@@ -22,49 +30,122 @@ warnings.filterwarnings("ignore", category=UserWarning, module="librosa")
 class MusicAnalyzer:
     """Analyzes audio files to extract musical features and timing information."""
 
-    def __init__(self, sample_rate: int = 22050):
+    def __init__(self, sample_rate: int = 22050, *, cache: str | Path | None = None):
         """Initialize the music analyzer.
 
         Args:
             sample_rate: Target sample rate for audio analysis
+            cache: Directory keeping analyses across runs; ``"default"`` uses
+                ``~/.dmx_analyzer/cache``, ``None`` keeps them in memory only
         """
         self.sample_rate = sample_rate
+        self.cache_dir = resolve_cache_dir(cache)
+        # Frame grid shared by the STFT, onset envelope and all frame features
+        self.n_fft = 2048
+        self.hop_length = 512
 
     def analyze_file(
-        self, audio_path: Path, override_bpm: float | None = None
+        self,
+        audio_path: Path,
+        override_bpm: float | None = None,
+        *,
+        stat_result: os.stat_result | None = None,
     ) -> AudioAnalysis:
         """Analyze an audio file and extract all relevant features.
 
         Args:
             audio_path: Path to the audio file
             override_bpm: If provided, use this BPM instead of detecting it
+            stat_result: Result of an earlier ``stat()`` of ``audio_path``;
+                when given, the existence check is skipped
 
         Returns:
-            Complete audio analysis results
+            Complete audio analysis results; a file whose contents were
+            analyzed before with the same settings is loaded from the cache
 
         Raises:
             ValueError: If audio file cannot be loaded
             FileNotFoundError: If audio file doesn't exist
         """
-        if not audio_path.exists():
-            raise FileNotFoundError(f"Audio file not found: {audio_path}")
+        if stat_result is None:
+            try:
+                audio_path.stat()
+            except FileNotFoundError as e:
+                msg = f"Audio file not found: {audio_path}"
+                raise FileNotFoundError(msg) from e
+
+        key = (
+            f"music-{file_digest(audio_path)}-{self.sample_rate}-{self.n_fft}"
+            f"-{self.hop_length}-{override_bpm}-{__version__}"
+        )
+        analysis = cached_analysis(
+            self.cache_dir, key, lambda: self._analyze(audio_path, override_bpm)
+        )
+        # The key follows the contents, so a hit may come from a copy elsewhere;
+        # the cached analysis itself is shared and stays untouched
+        return analysis.model_copy(update={"file_path": audio_path})
 
+    def _analyze(self, audio_path: Path, override_bpm: float | None) -> AudioAnalysis:
+        """Run the full analysis of an audio file.
+
+        Args:
+            audio_path: Path to the audio file
+            override_bpm: If provided, use this BPM instead of detecting it
+
+        Returns:
+            Complete audio analysis results
+
+        Raises:
+            ValueError: If audio file cannot be loaded
+        """
         logger.info(f"Starting analysis of: {audio_path}")
 
         try:
-            # Load audio file
-            y, sr = librosa.load(str(audio_path), sr=self.sample_rate)
+            # Load audio file; librosa decodes through soundfile (audioread is
+            # only a fallback) and resamples with the SIMD soxr resampler.
+            # Mono float32 throughout, so the STFT is complex64
+            y, sr = librosa.load(
+                str(audio_path),
+                sr=self.sample_rate,
+                mono=True,
+                res_type="soxr_hq",
+                dtype=np.float32,
+            )
             duration = len(y) / sr
 
             logger.debug(f"Loaded audio: {duration:.2f}s at {sr}Hz")
 
+            # Shared intermediates: one STFT magnitude for all spectral
+            # features, one onset envelope for beats and onsets
+            magnitude = np.abs(
+                librosa.stft(y, n_fft=self.n_fft, hop_length=self.hop_length)
+            ).astype(np.float32, copy=False)
+            onset_envelope = librosa.onset.onset_strength(
+                y=y, sr=sr, hop_length=self.hop_length
+            )
+            centroids = librosa.feature.spectral_centroid(S=magnitude, sr=sr)[0]
+            tempo, beat_frames = librosa.beat.beat_track(
+                onset_envelope=onset_envelope,
+                sr=sr,
+                hop_length=self.hop_length,
+                bpm=override_bpm,
+            )
+
             # Extract features
-            features = self._extract_features(y, sr, override_bpm)
+            features = self._extract_features(
+                y,
+                sr,
+                override_bpm,
+                magnitude=magnitude,
+                tempo=tempo,
+                beat_frames=beat_frames,
+                spectral_centroids=centroids,
+            )
 
             # Extract timing information
-            beats = self._extract_beats(y, sr, features.bpm)
-            onset_times = self._extract_onsets(y, sr)
-            spectral_centroids = self._extract_spectral_centroids(y, sr)
+            beats = self._extract_beats(beat_frames, sr)
+            onset_times = self._extract_onsets(onset_envelope, sr)
+            spectral_centroids = self._extract_spectral_centroids(centroids)
 
             analysis = AudioAnalysis(
                 file_path=audio_path,
@@ -85,7 +166,15 @@ class MusicAnalyzer:
             raise ValueError(f"Could not analyze audio file: {e}") from e
 
     def _extract_features(
-        self, y: np.ndarray, sr: int, override_bpm: float | None
+        self,
+        y: np.ndarray,
+        sr: int,
+        override_bpm: float | None,
+        *,
+        magnitude: np.ndarray,
+        tempo: np.ndarray | float,
+        beat_frames: np.ndarray,
+        spectral_centroids: np.ndarray,
     ) -> AudioFeatures:
         """Extract musical features from audio signal.
 
@@ -93,6 +182,10 @@ class MusicAnalyzer:
             y: Audio time series
             sr: Sample rate
             override_bpm: Override detected BPM if provided
+            magnitude: STFT magnitude of the audio on the shared frame grid
+            tempo: Tempo estimated by beat tracking
+            beat_frames: Beat positions in frames from beat tracking
+            spectral_centroids: Spectral centroid per frame
 
         Returns:
             Extracted audio features
@@ -103,11 +196,11 @@ class MusicAnalyzer:
             tempo_stability = 1.0  # Assume perfect stability for override
             logger.debug(f"Using override BPM: {bpm}")
         else:
-            tempo, beats = librosa.beat.beat_track(y=y, sr=sr)
-            bpm = float(tempo)
+            # beat_track returns the tempo as a 1-element array
+            bpm = float(np.atleast_1d(tempo)[0])
 
             # Calculate tempo stability
-            beat_intervals = np.diff(beats) * (60.0 / sr)
+            beat_intervals = np.diff(beat_frames) * (60.0 / sr)
             if len(beat_intervals) > 1:
                 tempo_stability = 1.0 - (
                     np.std(beat_intervals) / np.mean(beat_intervals)
@@ -119,11 +212,13 @@ class MusicAnalyzer:
             logger.debug(f"Detected BPM: {bpm:.1f}, stability: {tempo_stability:.2f}")
 
         # Spectral features
-        spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
-        spectral_rolloff = librosa.feature.spectral_rolloff(y=y, sr=sr)[0]
+        spectral_rolloff = librosa.feature.spectral_rolloff(S=magnitude, sr=sr)[0]
 
-        # Energy (RMS)
-        rms = librosa.feature.rms(y=y)[0]
+        # Energy (RMS); framed directly from the signal, no STFT involved, so
+        # the level is not scaled by the analysis window
+        rms = librosa.feature.rms(
+            y=y, frame_length=self.n_fft, hop_length=self.hop_length
+        )[0]
         energy = float(np.mean(rms))
 
         # Loudness (approximate)
@@ -136,7 +231,9 @@ class MusicAnalyzer:
         valence = max(0.0, min(1.0, valence))
 
         # Musical key detection (simplified)
-        chroma = librosa.feature.chroma_cqt(y=y, sr=sr)
+        # STFT chroma from the shared magnitude; the argmax-over-mean heuristic
+        # in _estimate_key is scale-invariant and needs no CQT resolution
+        chroma = librosa.feature.chroma_stft(S=magnitude**2, sr=sr)
         key = self._estimate_key(chroma)
 
         return AudioFeatures(
@@ -148,45 +245,48 @@ class MusicAnalyzer:
             tempo_stability=tempo_stability,
         )
 
-    def _extract_beats(self, y: np.ndarray, sr: int, bpm: float) -> list[float]:
-        """Extract beat times from audio.
+    def _extract_beats(self, beat_frames: np.ndarray, sr: int) -> list[float]:
+        """Convert tracked beats to beat times.
 
         Args:
-            y: Audio time series
+            beat_frames: Beat positions in frames from beat tracking
             sr: Sample rate
-            bpm: Beats per minute
 
         Returns:
             List of beat times in seconds
         """
-        _, beats = librosa.beat.beat_track(y=y, sr=sr, bpm=bpm)
-        beat_times = librosa.frames_to_time(beats, sr=sr)
+        beat_times = librosa.frames_to_time(
+            beat_frames, sr=sr, hop_length=self.hop_length
+        )
         return beat_times.tolist()
 
-    def _extract_onsets(self, y: np.ndarray, sr: int) -> list[float]:
-        """Extract note onset times from audio.
+    def _extract_onsets(self, onset_envelope: np.ndarray, sr: int) -> list[float]:
+        """Extract note onset times from the onset strength envelope.
 
         Args:
-            y: Audio time series
+            onset_envelope: Onset strength envelope of the audio
             sr: Sample rate
 
         Returns:
             List of onset times in seconds
         """
-        onset_frames = librosa.onset.onset_detect(y=y, sr=sr, units="time")
+        onset_frames = librosa.onset.onset_detect(
+            onset_envelope=onset_envelope,
+            sr=sr,
+            hop_length=self.hop_length,
+            units="time",
+        )
         return onset_frames.tolist()
 
-    def _extract_spectral_centroids(self, y: np.ndarray, sr: int) -> list[float]:
-        """Extract spectral centroids over time.
+    def _extract_spectral_centroids(self, centroids: np.ndarray) -> list[float]:
+        """Convert spectral centroids over time to a list.
 
         Args:
-            y: Audio time series
-            sr: Sample rate
+            centroids: Spectral centroid per frame
 
         Returns:
             List of spectral centroids
         """
-        centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
         return centroids.tolist()
 
     def _estimate_key(self, chroma: np.ndarray) -> str | None:
@@ -2,24 +2,62 @@
 
 from __future__ import annotations
 
-from pathlib import Path
+from functools import lru_cache
+from operator import attrgetter
+from typing import TYPE_CHECKING
 
+import joblib
 import numpy as np
 
+from ._version import __version__
+from .advanced_music_analyzer import DEFAULT_SAMPLE_RATE
 from .advanced_music_analyzer import analyze_for_lighting
+from .analysis_cache import cached_analysis
+from .analysis_cache import file_digest
+from .analysis_cache import resolve_cache_dir
 from .logging import get_logger
 from .models import DMXEvent
 from .models import DMXTimeline
 from .models import SpeedType
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 logger = get_logger(__name__)
 
 
+# Pásma s maximem energie pod touto hranicí se berou jako tichá
+SILENT_BAND_ENERGY = 1e-8
+
+# Intenzity špiček podle percentilového pásma energie (<=50, <=75, <=90, >90)
+PEAK_INTENSITIES = np.array(["low", "medium", "high", "explosive"])
+
+
+@lru_cache(maxsize=4096)
+def _format_tenths(tenths: int) -> str:
+    """Formátuje čas v celých desetinách sekundy do H:MM:SS.f.
+
+    Stejné desetiny se opakují (beaty, transienty, pevné délky), proto cache.
+    """
+    secs, decimal = divmod(tenths, 10)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return f"{hours}:{minutes:02d}:{secs:02d}.{decimal}"
+
+
 class SpectacularTimelineGenerator:
     """Generátor nádherných světelných show na základě pokročilé analýzy."""
 
-    def __init__(self):
-        """Initialize spectacular timeline generator."""
+    def __init__(self, cache: str | Path | None = None):
+        """Initialize spectacular timeline generator.
+
+        Args:
+            cache: Adresář pro analýzy uchované mezi běhy; ``"default"``
+                použije ``~/.dmx_analyzer/cache``, ``None`` je drží jen v paměti
+        """
+        self.cache_dir = resolve_cache_dir(cache)
+
         # Mapování frekvenčních pásem na typy světel
         self.frequency_to_fixtures = {
             "sub_bass": ["LED_Oven"],  # Hluboké basy -> kamna
@@ -38,6 +76,10 @@ class SpectacularTimelineGenerator:
             "aggressive_sad": ["red", "purple", "blue"],
             "melancholic": ["blue", "azure", "white - studená"],
         }
+        # Hlavní (první) barva každé emoce pro _select_emotion_color
+        self._primary_emotion_color = {
+            emotion: colors[0] for emotion, colors in self.emotion_colors.items()
+        }
 
         # Barvy pro různé energie
         self.energy_colors = {
@@ -48,6 +90,47 @@ class SpectacularTimelineGenerator:
             "ambient": ["white - studená"],  # Ambientní
         }
 
+        # Šablony opakovaných událostí; v cyklech se jen kopírují s novým
+        # časem (_event_at) místo validace celého DMXEvent pokaždé znovu
+        self._strong_beat_mh_template = DMXEvent(
+            timeline_index=3,
+            start_time="0:00:00.0",
+            path="Moving_heads/MH_oven_red.scex",
+            length="0:00:00.5",
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+            fade_in=1,
+            fade_out=200,
+        )
+        self._strong_beat_spots_template = DMXEvent(
+            timeline_index=4,
+            start_time="0:00:00.0",
+            path="SPOTS_walls/SPOTS_all/SPOTS_orange.scex",
+            length="0:00:00.3",
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+            fade_in=1,
+            fade_out=1,
+        )
+        self._transient_walls_template = DMXEvent(
+            timeline_index=5,
+            start_time="0:00:00.0",
+            path="LED_walls/Walls_all/Walls_white - studená.scex",
+            length="0:00:00.1",
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+            fade_in=1,
+            fade_out=1,
+        )
+        self._transient_uv_template = DMXEvent(
+            timeline_index=12,
+            start_time="0:00:00.0",
+            path="UV/UV.scex",
+            length="0:00:00.2",
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+        )
+
     def generate_spectacular_timeline(
         self, audio_path: Path, output_path: Path | None = None
     ) -> DMXTimeline:
@@ -62,8 +145,8 @@ class SpectacularTimelineGenerator:
         """
         logger.info(f"Generuji spektakulární timeline pro: {audio_path}")
 
-        # Pokročilá analýza
-        analysis = analyze_for_lighting(audio_path)
+        # Pokročilá analýza (z cache, pokud už byl soubor analyzován)
+        analysis = self.analyze(audio_path)
 
         # Vytvoř timeline
         timeline = DMXTimeline(
@@ -71,28 +154,32 @@ class SpectacularTimelineGenerator:
             audio_length=self._format_duration(analysis["duration"]),
         )
 
-        events = []
-
-        # 1. STRUKTURÁLNÍ EFEKTY (intro, verse, chorus, outro)
-        events.extend(self._generate_structural_effects(analysis))
-
-        # 2. FREKVENČNÍ PÁSMA EFEKTY
-        events.extend(self._generate_frequency_band_effects(analysis))
-
-        # 3. RYTMICKÉ EFEKTY (beaty, synkopace)
-        events.extend(self._generate_rhythm_effects(analysis))
-
-        # 4. DYNAMICKÉ EFEKTY (transients, sustain)
-        events.extend(self._generate_dynamic_effects(analysis))
-
-        # 5. HARMONICKÉ EFEKTY (změny akordů, klíče)
-        events.extend(self._generate_harmonic_effects(analysis))
+        # Nezávislé fáze generování; jen čtou analýzu a vrací nové seznamy
+        stages = (
+            # 1. STRUKTURÁLNÍ EFEKTY (intro, verse, chorus, outro)
+            self._generate_structural_effects,
+            # 2. FREKVENČNÍ PÁSMA EFEKTY
+            self._generate_frequency_band_effects,
+            # 3. RYTMICKÉ EFEKTY (beaty, synkopace)
+            self._generate_rhythm_effects,
+            # 4. DYNAMICKÉ EFEKTY (transients, sustain)
+            self._generate_dynamic_effects,
+            # 5. HARMONICKÉ EFEKTY (změny akordů, klíče)
+            self._generate_harmonic_effects,
+            # 6. EMOCIONÁLNÍ AMBIENTNÍ OSVĚTLENÍ
+            self._generate_emotional_ambient,
+        )
 
-        # 6. EMOCIONÁLNÍ AMBIENTNÍ OSVĚTLENÍ
-        events.extend(self._generate_emotional_ambient(analysis))
+        # Fáze běží paralelně ve vláknech; výsledky drží pořadí fází
+        stage_events = joblib.Parallel(n_jobs=len(stages), prefer="threads")(
+            joblib.delayed(stage)(analysis) for stage in stages
+        )
+        events = [
+            event for events_of_stage in stage_events for event in events_of_stage
+        ]
 
-        # Seřaď events podle času
-        events.sort(key=lambda e: self._time_to_seconds(e.start_time))
+        # Seřaď events podle času (číselný čas uložený při vytvoření události)
+        events.sort(key=attrgetter("start_seconds"))
 
         # Přidej do timeline
         for event in events:
@@ -106,6 +193,21 @@ class SpectacularTimelineGenerator:
 
         return timeline
 
+    def analyze(self, audio_path: Path) -> dict:
+        """Vrátí pokročilou analýzu souboru, z cache pokud už byl analyzován.
+
+        Args:
+            audio_path: Cesta k MP3/WAV souboru
+
+        Returns:
+            Výsledek ``analyze_for_lighting`` pro daný soubor; sdílí ho cache,
+            proto se nesmí měnit
+        """
+        key = f"{file_digest(audio_path)}-{DEFAULT_SAMPLE_RATE}-{__version__}"
+        return cached_analysis(
+            self.cache_dir, key, lambda: analyze_for_lighting(audio_path)
+        )
+
     def _generate_structural_effects(self, analysis: dict) -> list[DMXEvent]:
         """Generuje efekty na základě struktury skladby."""
         events = []
@@ -148,44 +250,42 @@ class SpectacularTimelineGenerator:
         """Efekty založené na analýze frekvenčních pásem."""
         events = []
         bands = analysis["frequency_bands"]
-        sample_rate = analysis["sample_rate"]
         emotion = analysis["emotional_content"]["emotion_category"]
 
-        # Time axis
-        hop_length = 256  # Z analyzátoru
-        times = np.linspace(0, analysis["duration"], len(bands.sub_bass))
+        # Všechna mapovaná pásma s nenulovou energií jako jedna matice
+        # (pásma x snímky); tichá pásma nemají co zvýrazňovat
+        band_names = [
+            name
+            for name in bands._fields
+            if name in self.frequency_to_fixtures
+            and np.max(getattr(bands, name), initial=0.0) >= SILENT_BAND_ENERGY
+        ]
+        if not band_names:
+            return events
+        curves = np.stack([getattr(bands, name) for name in band_names])
+
+        # Najdi peaks v energii všech pásem najednou
+        band_peaks = self._find_energy_peaks(curves, prominence=0.3)
+
+        # Intenzita efektu na základě energie: percentily všech pásem jedním
+        # voláním, right=True zachovává ostré porovnání "energie > percentil"
+        band_thresholds = np.percentile(curves, [50, 75, 90], axis=1).T
 
         # Analyzuj každé frekvenční pásmo
-        for band_name, energy_curve in bands._asdict().items():
-            if band_name not in self.frequency_to_fixtures:
-                continue
-
+        for band_name, energy_curve, peaks, thresholds in zip(
+            band_names, curves, band_peaks, band_thresholds, strict=True
+        ):
             fixture_types = self.frequency_to_fixtures[band_name]
+            intensities = PEAK_INTENSITIES[
+                np.digitize(energy_curve[peaks], thresholds, right=True)
+            ]
 
-            # Najdi peaks v energii
-            peaks = self._find_energy_peaks(energy_curve, prominence=0.3)
-
-            for peak_idx in peaks:
-                if peak_idx >= len(times):
-                    continue
-
-                peak_time = times[peak_idx]
-                peak_energy = energy_curve[peak_idx]
-
-                # Intenzita efektu na základě energie
-                if peak_energy > np.percentile(energy_curve, 90):
-                    intensity = "explosive"
-                elif peak_energy > np.percentile(energy_curve, 75):
-                    intensity = "high"
-                elif peak_energy > np.percentile(energy_curve, 50):
-                    intensity = "medium"
-                else:
-                    intensity = "low"
-
+            peak_times = self._frames_to_seconds(analysis, peaks)
+            for peak_time, intensity in zip(peak_times, intensities, strict=True):
                 # Vytvoř efekt pro dané pásmo
                 events.extend(
                     self._create_frequency_effect(
-                        peak_time, band_name, fixture_types, intensity, emotion
+                        peak_time, band_name, fixture_types, str(intensity), emotion
                     )
                 )
 
@@ -197,43 +297,27 @@ class SpectacularTimelineGenerator:
         rhythm = analysis["rhythm"]
         emotion = analysis["emotional_content"]["emotion_category"]
 
-        # Strong beats (downbeats)
-        for i, beat_time in enumerate(rhythm.downbeats):
-            if i < len(rhythm.beat_strength):
-                strength = rhythm.beat_strength[
-                    min(i * 4, len(rhythm.beat_strength) - 1)
-                ]
-            else:
-                strength = 0.5
-
-            # Silné beaty -> Moving heads + wall spots
-            if strength > 0.7:  # Velmi silný beat
-                events.append(
-                    DMXEvent(
-                        timeline_index=3,
-                        start_time=self._format_time(beat_time),
-                        path="Moving_heads/MH_oven_red.scex",
-                        length="0:00:00.5",
-                        speed=100,
-                        speed_type=SpeedType.PERCENTAGE,
-                        fade_in=1,
-                        fade_out=200,
-                    )
-                )
-
-                # Přidej wall spots flash
-                events.append(
-                    DMXEvent(
-                        timeline_index=4,
-                        start_time=self._format_time(beat_time + 0.1),
-                        path="SPOTS_walls/SPOTS_all/SPOTS_orange.scex",
-                        length="0:00:00.3",
-                        speed=100,
-                        speed_type=SpeedType.PERCENTAGE,
-                        fade_in=1,
-                        fade_out=1,
-                    )
-                )
+        # Strong beats (downbeats): síla downbeatu i je síla beatu 4i (oříznuto
+        # na poslední beat); downbeaty bez odpovídající síly mají 0.5
+        downbeats = np.asarray(rhythm.downbeats)
+        beat_strength = np.asarray(rhythm.beat_strength)
+        strong_times = downbeats[:0]
+        if len(beat_strength):
+            positions = np.arange(len(downbeats))
+            strengths = beat_strength[np.minimum(positions * 4, len(beat_strength) - 1)]
+            strong_mask = (strengths > 0.7) & (positions < len(beat_strength))
+            strong_times = downbeats[strong_mask]
+
+        # Silné beaty -> Moving heads + wall spots flash; každá skupina jedním
+        # list comprehension, pořadí v čase zajistí závěrečné řazení
+        events.extend(
+            self._event_at(self._strong_beat_mh_template, beat_time)
+            for beat_time in strong_times
+        )
+        events.extend(
+            self._event_at(self._strong_beat_spots_template, beat_time + 0.1)
+            for beat_time in strong_times
+        )
 
         # Syncopation effects
         if len(rhythm.syncopation) > 0:
@@ -253,68 +337,47 @@ class SpectacularTimelineGenerator:
         dynamics = analysis["dynamics"]
         emotion = analysis["emotional_content"]["emotion_category"]
 
-        # Transients -> náhlé blesky
-        for transient_time in dynamics.transients:
-            # Rychlý flash všemi světly
-            events.append(
-                DMXEvent(
-                    timeline_index=5,
-                    start_time=self._format_time(transient_time),
-                    path="LED_walls/Walls_all/Walls_white - studená.scex",
-                    length="0:00:00.1",
-                    speed=100,
-                    speed_type=SpeedType.PERCENTAGE,
-                    fade_in=1,
-                    fade_out=1,
-                )
-            )
+        # Transients -> náhlé blesky: rychlý flash všemi světly a UV flash
+        # pro extra efekt
+        events.extend(
+            self._event_at(self._transient_walls_template, transient_time)
+            for transient_time in dynamics.transients
+        )
+        events.extend(
+            self._event_at(self._transient_uv_template, transient_time + 0.05)
+            for transient_time in dynamics.transients
+        )
 
-            # UV flash pro extra efekt
+        # Sustain regions -> plynulé přechody
+        # Hrany sustain regionů jedním np.diff: +1 začátek, -1 první snímek za
+        # koncem; region neukončený do konce skladby se nepočítá
+        edges = np.diff(np.asarray(dynamics.sustain_regions, dtype=np.int8), prepend=0)
+        ends = np.flatnonzero(edges == -1)
+        starts = self._frames_to_seconds(
+            analysis, np.flatnonzero(edges == 1)[: len(ends)]
+        )
+        durations = self._frames_to_seconds(analysis, ends) - starts
+
+        long_enough = durations > 2.0  # Minimálně 2 sekundy
+        for sustain_start, sustain_duration in zip(
+            starts[long_enough], durations[long_enough], strict=True
+        ):
+            # Vytvoř plynulý efekt
+            color = self._select_emotion_color(emotion)
             events.append(
                 DMXEvent(
-                    timeline_index=12,
-                    start_time=self._format_time(transient_time + 0.05),
-                    path="UV/UV.scex",
-                    length="0:00:00.2",
-                    speed=100,
+                    timeline_index=6,
+                    start_time=self._format_time(sustain_start),
+                    start_seconds=sustain_start,
+                    path=f"Bodovky/Bodovky_all/Bodovka_{color}.scex",
+                    length=self._format_duration(sustain_duration),
+                    speed=30,  # Pomalý, hladký efekt
                     speed_type=SpeedType.PERCENTAGE,
+                    fade_in=1000,
+                    fade_out=1000,
                 )
             )
 
-        # Sustain regions -> plynulé přechody
-        hop_length = 256
-        times = np.linspace(0, analysis["duration"], len(dynamics.sustain_regions))
-
-        in_sustain = False
-        sustain_start = 0
-
-        for i, is_sustain in enumerate(dynamics.sustain_regions):
-            if is_sustain and not in_sustain:
-                # Začátek sustain regionu
-                in_sustain = True
-                sustain_start = times[i]
-
-            elif not is_sustain and in_sustain:
-                # Konec sustain regionu
-                in_sustain = False
-                sustain_duration = times[i] - sustain_start
-
-                if sustain_duration > 2.0:  # Minimálně 2 sekundy
-                    # Vytvoř plynulý efekt
-                    color = self._select_emotion_color(emotion)
-                    events.append(
-                        DMXEvent(
-                            timeline_index=6,
-                            start_time=self._format_time(sustain_start),
-                            path=f"Bodovky/Bodovky_all/Bodovka_{color}.scex",
-                            length=self._format_duration(sustain_duration),
-                            speed=30,  # Pomalý, hladký efekt
-                            speed_type=SpeedType.PERCENTAGE,
-                            fade_in=1000,
-                            fade_out=1000,
-                        )
-                    )
-
         return events
 
     def _generate_harmonic_effects(self, analysis: dict) -> list[DMXEvent]:
@@ -325,42 +388,38 @@ class SpectacularTimelineGenerator:
 
         # Detekuj změny v harmonickém obsahu
         if chroma.shape[1] > 1:
-            # Vypočti harmonickou variabilitu
-            chroma_diff = np.diff(chroma, axis=1)
-            harmonic_change = np.sum(np.abs(chroma_diff), axis=0)
-
-            # Najdi významné harmonické změny
-            change_threshold = np.percentile(harmonic_change, 85)
-            change_indices = np.where(harmonic_change > change_threshold)[0]
-
-            hop_length = 256
-            times = np.linspace(0, analysis["duration"], len(harmonic_change))
-
-            for idx in change_indices:
-                if idx >= len(times):
-                    continue
-
-                change_time = times[idx]
-                change_magnitude = harmonic_change[idx]
-
-                # Významnější změny -> dramatičtější efekty
-                if change_magnitude > np.percentile(harmonic_change, 95):
-                    # Velká harmonická změna -> změna barvy všech světel
-                    emotion = analysis["emotional_content"]["emotion_category"]
-                    new_color = self._select_emotion_color(emotion)
-
-                    events.append(
-                        DMXEvent(
-                            timeline_index=7,
-                            start_time=self._format_time(change_time),
-                            path=f"LED_walls/Walls_all/Walls_{new_color}.scex",
-                            length="0:00:03.0",
-                            speed=50,
-                            speed_type=SpeedType.PERCENTAGE,
-                            fade_in=500,
-                            fade_out=500,
-                        )
-                    )
+            # Vypočti harmonickou variabilitu (L1 rozdíl sousedních snímků)
+            # v jednom předalokovaném bufferu bez mezivýsledků diff/abs
+            chroma_diff = np.empty(
+                (chroma.shape[0], chroma.shape[1] - 1), dtype=chroma.dtype
+            )
+            np.subtract(chroma[:, 1:], chroma[:, :-1], out=chroma_diff)
+            np.abs(chroma_diff, out=chroma_diff)
+            harmonic_change = chroma_diff.sum(axis=0)
+
+            # Najdi významné harmonické změny; efekty dostávají jen změny nad
+            # 95. percentilem (podmnožina změn nad 85. percentilem)
+            big_change_threshold = np.percentile(harmonic_change, 95)
+            change_indices = np.flatnonzero(harmonic_change > big_change_threshold)
+
+            emotion = analysis["emotional_content"]["emotion_category"]
+            new_color = self._select_emotion_color(emotion)
+
+            # Velká harmonická změna -> změna barvy všech světel
+            events.extend(
+                DMXEvent(
+                    timeline_index=7,
+                    start_time=self._format_time(change_time),
+                    start_seconds=change_time,
+                    path=f"LED_walls/Walls_all/Walls_{new_color}.scex",
+                    length="0:00:03.0",
+                    speed=50,
+                    speed_type=SpeedType.PERCENTAGE,
+                    fade_in=500,
+                    fade_out=500,
+                )
+                for change_time in self._frames_to_seconds(analysis, change_indices)
+            )
 
         return events
 
@@ -379,6 +438,7 @@ class SpectacularTimelineGenerator:
                 DMXEvent(
                     timeline_index=8,
                     start_time="0:00:05.0",
+                    start_seconds=5.0,
                     path=f"LED_Oven/Oven_{ambient_color}.scex",
                     length=self._format_duration(duration - 10.0),
                     speed=20,
@@ -393,6 +453,7 @@ class SpectacularTimelineGenerator:
             DMXEvent(
                 timeline_index=9,
                 start_time="0:00:03.0",
+                start_seconds=3.0,
                 path=f"LED_lavice/LED_lavice_{ambient_color}.scex",
                 length=self._format_duration(duration - 6.0),
                 speed=25,
@@ -424,6 +485,7 @@ class SpectacularTimelineGenerator:
                 DMXEvent(
                     timeline_index=3 + i,
                     start_time=self._format_time(event_start),
+                    start_seconds=event_start,
                     path=f"{fixture_group}/{fixture_group}_all/{fixture_group}_{color}.scex",
                     length=self._format_duration(duration - delay),
                     speed=30,
@@ -450,6 +512,7 @@ class SpectacularTimelineGenerator:
             DMXEvent(
                 timeline_index=3,
                 start_time=self._format_time(start_time),
+                start_seconds=start_time,
                 path=f"Moving_heads/MH_oven_{main_color}.scex",
                 length=self._format_duration(duration),
                 speed=100,
@@ -464,6 +527,7 @@ class SpectacularTimelineGenerator:
             DMXEvent(
                 timeline_index=4,
                 start_time=self._format_time(start_time + 0.2),
+                start_seconds=start_time + 0.2,
                 path="Special_efects/Walls_flashing_snake/Walls_flashing_snake_red.scex",
                 length=self._format_duration(duration - 0.2),
                 speed=2,  # Rychlé pulzování
@@ -476,6 +540,7 @@ class SpectacularTimelineGenerator:
             DMXEvent(
                 timeline_index=12,
                 start_time=self._format_time(start_time + 0.5),
+                start_seconds=start_time + 0.5,
                 path="UV/UV.scex",
                 length=self._format_duration(duration - 0.5),
                 speed=100,
@@ -486,55 +551,47 @@ class SpectacularTimelineGenerator:
         return events
 
     def _find_energy_peaks(
-        self, energy_curve: np.ndarray, prominence: float = 0.3
-    ) -> np.ndarray:
-        """Najde vrcholy v energetické křivce."""
+        self, curves: np.ndarray, prominence: float = 0.3
+    ) -> list[np.ndarray]:
+        """Najde vrcholy v energetických křivkách (jedna křivka na řádek)."""
         from scipy.signal import find_peaks
 
-        # Normalize
-        if np.max(energy_curve) > 0:
-            normalized = energy_curve / np.max(energy_curve)
-        else:
-            normalized = energy_curve
+        # Normalize: všechny řádky jedním dělením, nulové křivky beze změny
+        peak_values = curves.max(axis=1, keepdims=True)
+        normalized = curves / np.where(peak_values > 0, peak_values, 1)
 
         # Find peaks
-        peaks, _ = find_peaks(normalized, prominence=prominence, distance=10)
-
-        return peaks
+        return [
+            find_peaks(row, prominence=prominence, distance=10)[0] for row in normalized
+        ]
 
     def _select_emotion_color(self, emotion: str) -> str:
-        """Vybere barvu na základě emoce."""
-        if emotion in self.emotion_colors:
-            colors = self.emotion_colors[emotion]
-            # Vybere první barvu jako hlavní
-            return colors[0]
-        return "white - studená"  # Default
+        """Vybere barvu na základě emoce (první barva emoce je hlavní)."""
+        return self._primary_emotion_color.get(emotion, "white - studená")
+
+    def _frames_to_seconds(self, analysis: dict, frames: np.ndarray) -> np.ndarray:
+        """Převede indexy snímků analýzy na čas v sekundách (hop / sr)."""
+        frame_features = analysis["frame_features"]
+        return frames * (frame_features.hop / frame_features.sr)
 
     def _format_time(self, seconds: float) -> str:
         """Formátuje čas do H:MM:SS.f."""
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-        whole_secs = int(secs)
-        decimal = int((secs - whole_secs) * 10)
-
-        return f"{hours}:{minutes:02d}:{whole_secs:02d}.{decimal}"
+        # Celé desetiny sekundy (zaokrouhlení místo useknutí: 0.29999 -> 0.3,
+        # ne 0.2) jsou zároveň klíčem cache
+        return _format_tenths(int(seconds * 10 + 0.5))
 
     def _format_duration(self, seconds: float) -> str:
         """Formátuje trvání do H:MM:SS.f."""
         return self._format_time(seconds)
 
-    def _time_to_seconds(self, time_str: str) -> float:
-        """Převede čas na sekundy."""
-        parts = time_str.split(":")
-        hours = int(parts[0])
-        minutes = int(parts[1])
-
-        sec_parts = parts[2].split(".")
-        seconds = int(sec_parts[0])
-        decimal = int(sec_parts[1]) / 10.0 if len(sec_parts) > 1 else 0.0
-
-        return hours * 3600 + minutes * 60 + seconds + decimal
+    def _event_at(self, template: DMXEvent, seconds: float) -> DMXEvent:
+        """Kopie šablony události posunutá na daný čas."""
+        return template.model_copy(
+            update={
+                "start_time": self._format_time(seconds),
+                "start_seconds": seconds,
+            }
+        )
 
     def _save_timeline(self, timeline: DMXTimeline, output_path: Path) -> None:
         """Uloží timeline do souboru."""
@@ -542,7 +599,7 @@ class SpectacularTimelineGenerator:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write(timeline.to_tml_format())
+                f.writelines(timeline.iter_tml_blocks())
 
             logger.info(f"Spektakulární timeline uložen do: {output_path}")
 
@@ -553,8 +610,11 @@ class SpectacularTimelineGenerator:
 
 # Convenience functions
 def create_spectacular_timeline(
-    audio_path: Path, output_path: Path | None = None
+    audio_path: Path,
+    output_path: Path | None = None,
+    *,
+    cache: str | Path | None = None,
 ) -> DMXTimeline:
     """Vytvoří spektakulární timeline ze souboru."""
-    generator = SpectacularTimelineGenerator()
+    generator = SpectacularTimelineGenerator(cache=cache)
     return generator.generate_spectacular_timeline(audio_path, output_path)
@@ -2,9 +2,17 @@
 
 from __future__ import annotations
 
-import random
+import configparser
+import heapq
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter
 from pathlib import Path
 
+import joblib
+import numpy as np
+from numba import njit
+
 from .logging import get_logger
 from .models import AudioAnalysis
 from .models import DMXEvent
@@ -12,39 +20,141 @@ from .models import DMXFixture
 from .models import DMXTimeline
 from .models import GenerationConfig
 from .models import SpeedType
+from .models import TrackedList
 
 logger = get_logger(__name__)
 
+# Energy tier edges: <=0.4 low, <=0.7 medium, >0.7 high
+ENERGY_TIER_EDGES = (0.4, 0.7)
+
+
+@lru_cache(maxsize=4096)
+def _format_tenths(tenths: int) -> str:
+    """Format a time in whole tenths of a second to H:MM:SS.f format.
+
+    Cached because beats, onsets and fixed durations keep producing the
+    same tenths.
+
+    Args:
+        tenths: Time in tenths of a second
+
+    Returns:
+        Formatted time string
+    """
+    secs, tenth = divmod(tenths, 10)
+    minutes, secs = divmod(secs, 60)
+    hours, minutes = divmod(minutes, 60)
+
+    return f"{hours}:{minutes:02d}:{secs:02d}.{tenth}"
+
+
+@njit(cache=True)
+def _high_energy_moments(  # noqa: PLR0917 - njit takes no keyword-only arguments
+    onset_times: np.ndarray,
+    energy_curve: np.ndarray,
+    duration: float,
+    threshold: float,
+    min_spacing: float,
+    min_level: float,
+    out: np.ndarray,
+) -> int:
+    """Select the onsets that trigger energy events, in one pass.
+
+    An onset is a high-energy moment when its energy exceeds ``threshold``; a
+    moment closer than ``min_spacing`` to the previous one is skipped, and only
+    moments with energy above ``min_level`` are kept.
+
+    Args:
+        onset_times: Onset times in seconds, in time order
+        energy_curve: Normalized energy per frame, spread over ``duration``
+        duration: Duration in seconds
+        threshold: Energy above which an onset is a high-energy moment
+        min_spacing: Minimum time from the previous high-energy moment
+        min_level: Energy a kept moment must exceed
+        out: (2, len(onset_times)) buffer receiving times and energies
+
+    Returns:
+        Number of moments written to the front of ``out``
+    """
+    n_frames = len(energy_curve)
+    count = 0
+    previous_time = 0.0
+    has_previous = False
+
+    for onset_time in onset_times:
+        # Map time to frame index (truncated toward zero like int())
+        index = min(max(int((onset_time / duration) * n_frames), 0), n_frames - 1)
+        level = energy_curve[index]
+        if level <= threshold:
+            continue
+
+        too_close = has_previous and onset_time - previous_time < min_spacing
+        previous_time = onset_time
+        has_previous = True
+        if too_close or level <= min_level:
+            continue
+
+        out[0, count] = onset_time
+        out[1, count] = level
+        count += 1
+
+    return count
+
 
 class TimelineGenerator:
     """Generates DMX lighting timelines from audio analysis."""
 
-    def __init__(self, config: GenerationConfig | None = None):
+    def __init__(
+        self, config: GenerationConfig | None = None, *, seed: int | None = None
+    ):
         """Initialize timeline generator.
 
         Args:
             config: Generation configuration
+            seed: Seed of the random scene choices, for reproducible timelines
         """
         self.config = config or GenerationConfig()
+        # Beat fixture selection and the (fixtures version, fixture edits) it
+        # was made from; reset by assigning fixtures
+        self._beat_fixtures: tuple[bool, list[str]] | None = None
+        self._beat_fixtures_state: tuple[int, int] | None = None
         self.fixtures: list[DMXFixture] = []
 
+        # One generator for all random choices, drawn in batches per event type
+        self._rng = np.random.default_rng(seed)
+
         # Scene mappings based on energy and valence
         self.color_scenes = {
-            "red": ["red", "orange"],
-            "blue": ["blue", "azure"],
-            "green": ["green"],
-            "yellow": ["yellow"],
-            "purple": ["purple"],
-            "white": ["white - studená", "white - teplá"],
+            "red": ("red", "orange"),
+            "blue": ("blue", "azure"),
+            "green": ("green",),
+            "yellow": ("yellow",),
+            "purple": ("purple",),
+            "white": ("white - studená", "white - teplá"),
         }
 
         # Energy-based color selection
         self.energy_colors = {
-            "low": ["blue", "azure", "purple"],
-            "medium": ["green", "white - studená", "white - teplá"],
-            "high": ["red", "orange", "yellow"],
+            "low": ("blue", "azure", "purple"),
+            "medium": ("green", "white - studená", "white - teplá"),
+            "high": ("red", "orange", "yellow"),
         }
 
+        # Palette table indexed by [energy tier, color pick]
+        self._energy_palette = np.array(
+            [self.energy_colors[tier] for tier in ("low", "medium", "high")]
+        )
+
+    @property
+    def fixtures(self) -> list[DMXFixture]:
+        """DMX fixtures the timelines are generated for."""
+        return self._fixtures
+
+    @fixtures.setter
+    def fixtures(self, fixtures: list[DMXFixture]) -> None:
+        self._fixtures = TrackedList(fixtures)
+        self._beat_fixtures = None
+
     def load_fixtures(self, fixtures_path: Path) -> None:
         """Load DMX fixtures configuration from file.
 
@@ -54,28 +164,29 @@ class TimelineGenerator:
         logger.info(f"Loading fixtures from: {fixtures_path}")
 
         try:
-            # Parse fixtures.ini file
-            import configparser
-
+            # Parse fixtures.ini file; strict mode rejects repeated sections
+            # and keys, and a missing file reads as no fixtures
             config = configparser.ConfigParser()
-            config.read(fixtures_path)
+            config.read(fixtures_path, encoding="utf-8")
 
             fixtures = []
             for section in config.sections():
-                if section.startswith("Fixture"):
-                    fixture_data = dict(config[section])
-
-                    fixture = DMXFixture(
-                        id=int(fixture_data.get("id", 0)),
-                        name=fixture_data.get("name", ""),
-                        address=int(fixture_data.get("address", 1)),
-                        model=fixture_data.get("model", ""),
-                        group=fixture_data.get("group", ""),
-                        channels=4,  # Default RGBW
-                    )
-                    fixtures.append(fixture)
+                if not section.startswith("Fixture"):
+                    continue
+                fixture_data = dict(config[section])
+                fixture = DMXFixture(
+                    id=int(fixture_data.get("id", 0)),
+                    name=fixture_data.get("name", ""),
+                    address=int(fixture_data.get("address", 1)),
+                    model=fixture_data.get("model", ""),
+                    group=fixture_data.get("group", ""),
+                    channels=4,  # Default RGBW
+                )
+                fixtures.append(fixture)
 
             self.fixtures = fixtures
+            # Every timeline for these fixtures uses the same beat fixtures
+            self._select_beat_fixtures()
             logger.info(f"Loaded {len(fixtures)} fixtures")
 
         except Exception as e:
@@ -129,28 +240,41 @@ class TimelineGenerator:
         Returns:
             List of generated DMX events
         """
-        events = []
+        streams = []
+
+        # Normalized energy per centroid frame, shared by all energy lookups
+        energy_curve = self._energy_curve(analysis)
 
         # Generate beat-synchronized events
         if self.config.beat_sync and analysis.beats:
-            events.extend(self._generate_beat_events(analysis))
+            streams.append(self._generate_beat_events(analysis, energy_curve))
 
         # Generate energy-based events
-        events.extend(self._generate_energy_events(analysis))
+        streams.append(self._generate_energy_events(analysis, energy_curve))
 
         # Generate ambient/background lighting
-        events.extend(self._generate_ambient_events(analysis))
-
-        # Sort events by start time
-        events.sort(key=lambda e: self._time_to_seconds(e.start_time))
-
-        return events
-
-    def _generate_beat_events(self, analysis: AudioAnalysis) -> list[DMXEvent]:
+        streams.append(self._generate_ambient_events(analysis))
+
+        # With beats and onsets in time order (as the analyzer returns them)
+        # each stream is already sorted, so one merge on the numeric start
+        # time replaces a full sort; ties keep the stream order above. Hand
+        # built analyses may be unsorted and fall back to the full sort
+        by_start = attrgetter("start_seconds")
+        if all(
+            np.all(np.diff(times) >= 0)
+            for times in (analysis.beats, analysis.onset_times)
+        ):
+            return list(heapq.merge(*streams, key=by_start))
+        return sorted(chain.from_iterable(streams), key=by_start)
+
+    def _generate_beat_events(
+        self, analysis: AudioAnalysis, energy_curve: np.ndarray
+    ) -> list[DMXEvent]:
         """Generate events synchronized to beat times.
 
         Args:
             analysis: Audio analysis results
+            energy_curve: Normalized energy per frame from ``_energy_curve``
 
         Returns:
             Beat-synchronized events
@@ -158,112 +282,181 @@ class TimelineGenerator:
         events = []
 
         # Select fixtures for beat sync (moving heads work well)
-        moving_fixtures = [f for f in self.fixtures if "Intimidator" in f.model]
-        wall_spots = [f for f in self.fixtures if "Spot_" in f.name]
+        has_moving_heads, wall_spot_nums = self._select_beat_fixtures()
 
         # Generate events on strong beats (every 4th beat for 4/4 time)
         beat_interval = 60.0 / analysis.features.bpm
         strong_beat_interval = beat_interval * 4
 
-        for i, beat_time in enumerate(analysis.beats):
-            if i % 4 == 0:  # Strong beat
-                # Choose color based on energy at this time
-                energy_level = self._get_energy_at_time(analysis, beat_time)
-                color = self._select_color_by_energy(energy_level)
-
-                # Moving head event
-                if moving_fixtures and random.random() < 0.6:  # 60% chance
-                    fixture = random.choice(moving_fixtures)
-                    event = DMXEvent(
-                        timeline_index=3,  # First light timeline
-                        start_time=self._format_time(beat_time),
-                        path=f"Moving_heads/MH_oven_{color}.scex",
-                        length=self._format_duration(strong_beat_interval * 0.8),
-                        speed=100,
-                        speed_type=SpeedType.PERCENTAGE,
-                    )
-                    events.append(event)
-
-                # Wall spots flash
-                if wall_spots and random.random() < 0.4:  # 40% chance
-                    spot = random.choice(wall_spots)
-                    spot_num = spot.name.split("#")[-1] if "#" in spot.name else "1"
-
-                    event = DMXEvent(
-                        timeline_index=4,
-                        start_time=self._format_time(beat_time),
-                        path=f"SPOTS_walls/SPOTS_single/SPOT_{spot_num}/SPOT_{spot_num}_{color}.scex",
-                        length=self._format_duration(beat_interval * 0.5),
-                        speed=100,
-                        speed_type=SpeedType.PERCENTAGE,
-                        fade_in=1,
-                        fade_out=1,
-                    )
-                    events.append(event)
+        # Strong beats with their energies in one vectorized lookup
+        strong_beats = analysis.beats[::4]
+        strong_energies = self._get_energies_at_times(
+            analysis, energy_curve, strong_beats
+        )
+
+        # Choose colors based on energy at each strong beat
+        strong_colors = self._select_colors_by_energy(strong_energies)
+
+        # Templates of the repeated events: the loop only copies them with a
+        # new time and scene path instead of validating a full DMXEvent
+        moving_head_template = DMXEvent(
+            timeline_index=3,  # First light timeline
+            start_time="0:00:00.0",
+            path="",
+            length=self._format_duration(strong_beat_interval * 0.8),
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+        )
+        wall_spot_template = DMXEvent(
+            timeline_index=4,
+            start_time="0:00:00.0",
+            path="",
+            length=self._format_duration(beat_interval * 0.5),
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+            fade_in=1,
+            fade_out=1,
+        )
+
+        # Roll every strong beat's fixture gates and spot pick up front
+        n_strong = len(strong_beats)
+        moving_head_fires = (self._rng.random(n_strong) < 0.6).tolist()  # 60% chance
+        wall_spot_fires = (self._rng.random(n_strong) < 0.4).tolist()  # 40% chance
+        wall_spot_picks = (
+            np.asarray(wall_spot_nums)[
+                self._rng.integers(len(wall_spot_nums), size=n_strong)
+            ].tolist()
+            if wall_spot_nums
+            else [None] * n_strong
+        )
+
+        for beat_time, color, moving_head_fire, wall_spot_fire, spot_num in zip(
+            strong_beats,
+            strong_colors,
+            moving_head_fires,
+            wall_spot_fires,
+            wall_spot_picks,
+            strict=True,
+        ):
+            # Moving head event
+            if has_moving_heads and moving_head_fire:
+                event = self._event_at(
+                    moving_head_template,
+                    beat_time,
+                    f"Moving_heads/MH_oven_{color}.scex",
+                )
+                events.append(event)
+
+            # Wall spots flash
+            if wall_spot_nums and wall_spot_fire:
+                event = self._event_at(
+                    wall_spot_template,
+                    beat_time,
+                    f"SPOTS_walls/SPOTS_single/SPOT_{spot_num}/SPOT_{spot_num}_{color}.scex",
+                )
+                events.append(event)
 
         return events
 
-    def _generate_energy_events(self, analysis: AudioAnalysis) -> list[DMXEvent]:
+    def _select_beat_fixtures(self) -> tuple[bool, list[str]]:
+        """Select the fixtures used by beat events.
+
+        The selection is kept until ``fixtures`` is assigned, changed in place,
+        or one of the fixtures is edited.
+
+        Returns:
+            Whether there are moving heads, and the numbers of the wall spots
+        """
+        state = (self._fixtures.version, DMXFixture.edits)
+        if self._beat_fixtures is None or self._beat_fixtures_state != state:
+            has_moving_heads = any("Intimidator" in f.model for f in self._fixtures)
+            wall_spot_nums = [
+                f.name.split("#")[-1] if "#" in f.name else "1"
+                for f in self._fixtures
+                if "Spot_" in f.name
+            ]
+            self._beat_fixtures = has_moving_heads, wall_spot_nums
+            self._beat_fixtures_state = state
+        return self._beat_fixtures
+
+    def _generate_energy_events(
+        self, analysis: AudioAnalysis, energy_curve: np.ndarray
+    ) -> list[DMXEvent]:
         """Generate events based on energy changes.
 
         Args:
             analysis: Audio analysis results
+            energy_curve: Normalized energy per frame from ``_energy_curve``
 
         Returns:
             Energy-based events
         """
         events = []
 
-        # Analyze energy over time using onset detection
-        high_energy_times = []
+        # Analyze energy over time using onset detection: find high-energy
+        # moments (onset times with high spectral content) spaced at least
+        # min_event_duration apart, keeping those strong enough for an event
+        onset_times = np.asarray(analysis.onset_times, dtype=np.float64)
+        if not energy_curve.size:
+            # No centroids: every onset has the overall energy
+            energy_curve = np.array([analysis.features.energy], dtype=np.float64)
+        moments = np.empty((2, onset_times.size), dtype=np.float64)
+        count = _high_energy_moments(
+            onset_times,
+            energy_curve,
+            analysis.duration,
+            self.config.energy_threshold,
+            self.config.min_event_duration,
+            0.5,  # Weakest energy of the single wall effects below
+            moments,
+        )
+        event_times = moments[0, :count].tolist()
+        event_levels = moments[1, :count]
+        event_colors = self._select_colors_by_energy(event_levels)
+
+        # Templates of the repeated events, copied per moment like the beat events
+        all_walls_template = DMXEvent(
+            timeline_index=5,
+            start_time="0:00:00.0",
+            path="",
+            length=self._format_duration(self.config.max_event_duration),
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+            fade_in=200,
+            fade_out=300,
+        )
+        single_wall_template = DMXEvent(
+            timeline_index=6,
+            start_time="0:00:00.0",
+            path="",
+            length=self._format_duration(self.config.min_event_duration * 2),
+            speed=100,
+            speed_type=SpeedType.PERCENTAGE,
+        )
 
-        # Find high-energy moments (onset times with high spectral content)
-        for onset_time in analysis.onset_times:
-            energy = self._get_energy_at_time(analysis, onset_time)
-            if energy > self.config.energy_threshold:
-                high_energy_times.append(onset_time)
+        # Single wall number per moment, used by the medium-energy effects
+        wall_nums = self._rng.integers(1, 12, size=len(event_times)).tolist()
 
         # Generate events for high-energy moments
-        for i, energy_time in enumerate(high_energy_times):
-            # Skip if too close to previous event
-            if (
-                i > 0
-                and (energy_time - high_energy_times[i - 1])
-                < self.config.min_event_duration
-            ):
-                continue
-
-            energy_level = self._get_energy_at_time(analysis, energy_time)
-
+        for energy_time, energy_level, color, wall_num in zip(
+            event_times, event_levels.tolist(), event_colors, wall_nums, strict=True
+        ):
             # LED wall effects for high energy
             if energy_level > 0.7:
-                color = self._select_color_by_energy(energy_level)
-
                 # All walls flash
-                event = DMXEvent(
-                    timeline_index=5,
-                    start_time=self._format_time(energy_time),
-                    path=f"LED_Walls/Walls_all/Walls_{color}.scex",
-                    length=self._format_duration(self.config.max_event_duration),
-                    speed=100,
-                    speed_type=SpeedType.PERCENTAGE,
-                    fade_in=200,
-                    fade_out=300,
+                event = self._event_at(
+                    all_walls_template,
+                    energy_time,
+                    f"LED_Walls/Walls_all/Walls_{color}.scex",
                 )
                 events.append(event)
 
             # Individual wall effects for medium energy
-            elif energy_level > 0.5:
-                color = self._select_color_by_energy(energy_level)
-                wall_num = random.randint(1, 11)
-
-                event = DMXEvent(
-                    timeline_index=6,
-                    start_time=self._format_time(energy_time),
-                    path=f"LED_Walls/Walls_single/Walls_{wall_num}/Walls_{wall_num}_{color}.scex",
-                    length=self._format_duration(self.config.min_event_duration * 2),
-                    speed=100,
-                    speed_type=SpeedType.PERCENTAGE,
+            else:
+                event = self._event_at(
+                    single_wall_template,
+                    energy_time,
+                    f"LED_Walls/Walls_single/Walls_{wall_num}/Walls_{wall_num}_{color}.scex",
                 )
                 events.append(event)
 
@@ -280,6 +473,26 @@ class TimelineGenerator:
         """
         events = []
 
+        # Events are added in time order (stove at 5s, ceiling at 10s) so the
+        # list can be merged with the other event streams without sorting
+
+        # LED stove for warmth
+        if analysis.features.valence > 0.6:  # Happy music
+            stove_color = "orange" if analysis.features.energy > 0.5 else "red"
+
+            event = DMXEvent(
+                timeline_index=8,
+                start_time=self._format_time(5.0),
+                start_seconds=5.0,
+                path=f"LED_Oven/Oven_{stove_color}.scex",
+                length=self._format_duration(analysis.duration - 10.0),
+                speed=30,
+                speed_type=SpeedType.PERCENTAGE,
+                fade_in=3000,
+                fade_out=3000,
+            )
+            events.append(event)
+
         # Background lighting based on valence and energy
         base_color = "blue" if analysis.features.valence < 0.5 else "yellow"
 
@@ -291,6 +504,7 @@ class TimelineGenerator:
             event = DMXEvent(
                 timeline_index=7,
                 start_time=self._format_time(ambient_start),
+                start_seconds=ambient_start,
                 path=f"Bodovky/Bodovky_all/Bodovka_{base_color}.scex",
                 length=self._format_duration(ambient_duration),
                 speed=50,  # Slower, ambient speed
@@ -300,65 +514,88 @@ class TimelineGenerator:
             )
             events.append(event)
 
-        # LED stove for warmth
-        if analysis.features.valence > 0.6:  # Happy music
-            stove_color = "orange" if analysis.features.energy > 0.5 else "red"
-
-            event = DMXEvent(
-                timeline_index=8,
-                start_time=self._format_time(5.0),
-                path=f"LED_Oven/Oven_{stove_color}.scex",
-                length=self._format_duration(analysis.duration - 10.0),
-                speed=30,
-                speed_type=SpeedType.PERCENTAGE,
-                fade_in=3000,
-                fade_out=3000,
-            )
-            events.append(event)
-
         return events
 
-    def _get_energy_at_time(self, analysis: AudioAnalysis, time: float) -> float:
-        """Get energy level at specific time.
+    def _energy_curve(self, analysis: AudioAnalysis) -> np.ndarray:
+        """Normalize spectral centroids to an energy estimate per frame.
 
         Args:
             analysis: Audio analysis results
-            time: Time in seconds
 
         Returns:
-            Energy level (0-1)
+            Energy levels (0-1), one per centroid; empty without centroids
         """
-        # Simple interpolation based on spectral centroids
-        if not analysis.spectral_centroids:
-            return analysis.features.energy
+        centroids = np.asarray(analysis.spectral_centroids, dtype=np.float64)
+        if not centroids.size:
+            return centroids
 
-        # Map time to centroid index
-        duration = analysis.duration
-        num_centroids = len(analysis.spectral_centroids)
+        # Normalize spectral centroid to energy estimate
+        max_centroid = centroids.max()
+        if max_centroid <= 0:
+            return np.full_like(centroids, 0.5)
+        return np.minimum(centroids / max_centroid, 1.0)
 
-        index = int((time / duration) * num_centroids)
-        index = max(0, min(index, num_centroids - 1))
+    def _event_at(self, template: DMXEvent, seconds: float, path: str) -> DMXEvent:
+        """Copy an event template to a start time and scene path.
 
-        # Normalize spectral centroid to energy estimate
-        centroid = analysis.spectral_centroids[index]
-        max_centroid = max(analysis.spectral_centroids)
+        Args:
+            template: Validated event carrying the fixed fields
+            seconds: Start time in seconds
+            path: Scene file path
 
-        return min(1.0, centroid / max_centroid) if max_centroid > 0 else 0.5
+        Returns:
+            The new event
+        """
+        return template.model_copy(
+            update={
+                "start_time": self._format_time(seconds),
+                "start_seconds": seconds,
+                "path": path,
+            }
+        )
 
-    def _select_color_by_energy(self, energy: float) -> str:
-        """Select color based on energy level.
+    def _get_energies_at_times(
+        self,
+        analysis: AudioAnalysis,
+        energy_curve: np.ndarray,
+        times: np.ndarray | list[float],
+    ) -> np.ndarray:
+        """Get energy levels at specific times.
 
         Args:
-            energy: Energy level (0-1)
+            analysis: Audio analysis results
+            energy_curve: Normalized energy per frame from ``_energy_curve``
+            times: Times in seconds
 
         Returns:
-            Color name
+            Energy levels (0-1), one per time
         """
-        if energy > 0.7:
-            return random.choice(self.energy_colors["high"])
-        if energy > 0.4:
-            return random.choice(self.energy_colors["medium"])
-        return random.choice(self.energy_colors["low"])
+        times = np.asarray(times, dtype=np.float64)
+
+        # Simple interpolation based on spectral centroids
+        if not energy_curve.size:
+            return np.full(times.shape, analysis.features.energy)
+
+        # Map times to centroid indices (truncated toward zero like int())
+        num_centroids = energy_curve.size
+        indices = ((times / analysis.duration) * num_centroids).astype(np.int64)
+        np.clip(indices, 0, num_centroids - 1, out=indices)
+
+        return energy_curve[indices]
+
+    def _select_colors_by_energy(self, energies: np.ndarray) -> list[str]:
+        """Select a random color of each energy level's tier.
+
+        Args:
+            energies: Energy levels (0-1)
+
+        Returns:
+            Color names, one per energy level
+        """
+        tiers = np.digitize(energies, ENERGY_TIER_EDGES, right=True)
+        picks = self._rng.integers(self._energy_palette.shape[1], size=tiers.size)
+
+        return self._energy_palette[tiers, picks].tolist()
 
     def _format_time(self, seconds: float) -> str:
         """Format time in seconds to H:MM:SS.f format.
@@ -369,15 +606,11 @@ class TimelineGenerator:
         Returns:
             Formatted time string
         """
-        hours = int(seconds // 3600)
-        minutes = int((seconds % 3600) // 60)
-        secs = seconds % 60
-
-        # Split seconds and milliseconds
-        whole_secs = int(secs)
-        millisecs = int((secs - whole_secs) * 10)  # Single decimal place
-
-        return f"{hours}:{minutes:02d}:{whole_secs:02d}.{millisecs}"
+        # Nearest tenth, not truncation: 2.3 * 10 is 22.999..., which would
+        # truncate to "0:00:02.2". So 0.96 s is "0:00:01.0", where the
+        # original formatting wrote "0:00:00.9". The tenths are also the
+        # formatting cache key
+        return _format_tenths(int(seconds * 10 + 0.5))
 
     def _format_duration(self, seconds: float) -> str:
         """Format duration in seconds to H:MM:SS.f format.
@@ -390,25 +623,6 @@ class TimelineGenerator:
         """
         return self._format_time(seconds)
 
-    def _time_to_seconds(self, time_str: str) -> float:
-        """Convert time string to seconds.
-
-        Args:
-            time_str: Time in H:MM:SS.f format
-
-        Returns:
-            Time in seconds
-        """
-        parts = time_str.split(":")
-        hours = int(parts[0])
-        minutes = int(parts[1])
-
-        sec_parts = parts[2].split(".")
-        seconds = int(sec_parts[0])
-        decimal = int(sec_parts[1]) / 10.0 if len(sec_parts) > 1 else 0.0
-
-        return hours * 3600 + minutes * 60 + seconds + decimal
-
     def _save_timeline(self, timeline: DMXTimeline, output_path: Path) -> None:
         """Save timeline to file.
 
@@ -420,7 +634,7 @@ class TimelineGenerator:
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
             with open(output_path, "w", encoding="utf-8") as f:
-                f.write(timeline.to_tml_format())
+                f.writelines(timeline.iter_tml_blocks())
 
             logger.info(f"Timeline saved to: {output_path}")
 
@@ -452,3 +666,47 @@ def generate_dmx_timeline(
         generator.load_fixtures(fixtures_path)
 
     return generator.generate_timeline(analysis, output_path)
+
+
+def generate_dmx_timelines(
+    analyses: list[AudioAnalysis],
+    fixtures_path: Path | None = None,
+    output_paths: list[Path] | None = None,
+    config: GenerationConfig | None = None,
+    *,
+    n_jobs: int = -1,
+) -> list[DMXTimeline]:
+    """Generate DMX timelines for several songs in parallel processes.
+
+    Each song is an independent ``generate_dmx_timeline`` call, so the songs
+    are spread over ``n_jobs`` worker processes (all cores by default).
+
+    Args:
+        analyses: Audio analysis results, one per song
+        fixtures_path: Path to fixtures configuration, shared by all songs
+        output_paths: Output paths for the timeline files, one per song
+        config: Generation configuration, shared by all songs
+        n_jobs: Number of worker processes (-1 for all cores)
+
+    Returns:
+        Generated DMX timelines, in the order of ``analyses``
+
+    Raises:
+        ValueError: If output_paths does not give one path per analysis
+    """
+    song_paths: list[Path | None] = (
+        [None] * len(analyses) if output_paths is None else list(output_paths)
+    )
+    if len(song_paths) != len(analyses):
+        msg = (
+            f"Expected {len(analyses)} output paths, one per analysis, "
+            f"got {len(song_paths)}"
+        )
+        raise ValueError(msg)
+
+    return joblib.Parallel(n_jobs=n_jobs)(
+        joblib.delayed(generate_dmx_timeline)(
+            analysis, fixtures_path, output_path, config
+        )
+        for analysis, output_path in zip(analyses, song_paths, strict=True)
+    )
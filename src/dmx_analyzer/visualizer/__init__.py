@@ -1,7 +1,24 @@
 """DMX Lighting Visualizer - Real-time visualization of lighting timelines."""
 
-from .sauna_renderer import SaunaRenderer
-from .timeline_player import TimelinePlayer
-from .visualizer_app import VisualizerApp
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from dmx_analyzer._lazy import lazy_exports
+
+if TYPE_CHECKING:
+    from .sauna_renderer import SaunaRenderer
+    from .timeline_player import TimelinePlayer
+    from .visualizer_app import VisualizerApp
+
+# Public classes resolved on first access (PEP 562): every submodule imports
+# pygame, so importing one of them must not load the others through here
+_LAZY_ATTRS = {
+    "SaunaRenderer": ".sauna_renderer",
+    "TimelinePlayer": ".timeline_player",
+    "VisualizerApp": ".visualizer_app",
+}
 
 __all__ = ["SaunaRenderer", "TimelinePlayer", "VisualizerApp"]
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _LAZY_ATTRS)
@@ -3,7 +3,10 @@
 from __future__ import annotations
 
 import math
+import re
+from functools import lru_cache
 
+import numpy as np
 import pygame
 
 from ..logging import get_logger
@@ -11,28 +14,285 @@ from ..logging import get_logger
 logger = get_logger(__name__)
 
 
+# Kódy efektů v polích stavů; neznámý efekt se nechová jako žádný efekt
+_EFFECT_CODES = {"strobe": 1, "pulse": 2, "fade": 3}
+_EFFECT_OTHER = 4
+_EFFECT_RATES = (0, 8, 3, 1)  # Hz podle kódu efektu
+
+# Počet popisků v cache textů, po dosažení se cache vyprázdní
+_TEXT_CACHE_SIZE = 1024
+# Počet předkreslených tvarů světel (klíč světlo a barva) v cache
+_SHAPE_CACHE_SIZE = 2048
+
+
+# Rozpoznání barev v názvu scény v pořadí priority (první shoda vyhrává,
+# ne nejlevější výskyt); celé se vyhodnotí v jednom regexu
+_COLOR_PATTERNS = (
+    ("red", "red|červen"),
+    ("blue", "blue|modr"),
+    ("green", "green|zelen"),
+    ("yellow", "yellow|žlut"),
+    ("orange", "orange|oranžov"),
+    ("purple", "purple|fialov"),
+    ("azure", "azure|azurov"),
+    ("white - studená", "white - studená|studena"),
+    ("white - teplá", "white - teplá|tepla"),
+    ("white", "white|bil"),
+)
+_COLOR_NAMES = {f"c{i}": color for i, (color, _) in enumerate(_COLOR_PATTERNS)}
+_COLOR_RE = re.compile(
+    "|".join(
+        f"(?=.*?(?:{pattern}))(?P<c{i}>)"
+        for i, (_, pattern) in enumerate(_COLOR_PATTERNS)
+    ),
+    re.DOTALL,
+)
+
+
+@lru_cache(maxsize=2048)
+def _parse_scene_path(path: str) -> tuple[str, str]:
+    """Parsuje scene path pro určení skupiny světel a barvy."""
+    if path == "OFF":
+        return "all", "off"
+
+    # Extract fixture group and color from path
+    # Examples: "LED_walls/Walls_all/Walls_red.scex"
+    #          "Bodovky/Bodovky_all/Bodovka_blue.scex"
+    #          "LED_Walls/Walls_single/Walls_11/Walls_11_white - studená.scex"
+
+    parts = path.split("/")
+    if len(parts) >= 2:
+        group = parts[0].lower()
+
+        # Rozpoznej jestli je to single nebo all
+        if len(parts) >= 3:
+            if "single" in parts[1].lower():
+                # Pro single light - použij specifický název
+                if len(parts) >= 4:
+                    group = parts[2].lower()  # např. "Walls_11"
+                else:
+                    group = parts[1].lower()
+            elif "all" in parts[1].lower():
+                # Pro all lights - použij základní skupinu
+                group = parts[0].lower()
+            else:
+                group = parts[1].lower()
+
+        filename = parts[-1] if len(parts) > 2 else parts[1]
+
+        # Extract color from filename - první barva podle priority
+        match = _COLOR_RE.match(filename.lower())
+        color = _COLOR_NAMES[match.lastgroup] if match else "white"
+
+        return group, color
+
+    return "unknown", "white"
+
+
+class _FixtureArrays:
+    """Stav všech světel po sloupcích (NumPy), animovaný jedním krokem."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.is_on = np.zeros(0, dtype=bool)
+        self.color = np.zeros((0, 3), dtype=np.int16)
+        self.intensity = np.zeros(0)
+        self.effect = np.zeros(0, dtype=np.int8)
+        self.effect_progress = np.zeros(0)
+        self.target_color = np.zeros((0, 3), dtype=np.int16)
+        self.fade_start_time = np.zeros(0)
+        self.fade_duration = np.zeros(0)
+
+        # Indexy zapnutých světel podle efektu, počítané po změně stavu
+        self._effect_rows: list[tuple[int, np.ndarray]] | None = None
+
+    def add(self) -> int:
+        """Přidá zhasnuté světlo a vrátí jeho index."""
+        for name in (
+            "is_on",
+            "color",
+            "intensity",
+            "effect",
+            "effect_progress",
+            "target_color",
+            "fade_start_time",
+            "fade_duration",
+        ):
+            column = getattr(self, name)
+            row = np.zeros((1, *column.shape[1:]), dtype=column.dtype)
+            setattr(self, name, np.concatenate((column, row)))
+
+        self.invalidate()
+        self.count += 1
+        return self.count - 1
+
+    def invalidate(self) -> None:
+        """Zahodí indexy podle efektů po změně is_on nebo efektu."""
+        self._effect_rows = None
+
+    def update(self, current_time: float, index: int | None = None) -> None:
+        """Aktualizuje animace všech světel, případně jen jednoho."""
+        # Fade animation
+        fading = np.flatnonzero(self.fade_duration > 0)
+        if index is not None:
+            fading = fading[fading == index]
+
+        if fading.size:
+            progress = (
+                current_time - self.fade_start_time[fading]
+            ) / self.fade_duration[fading]
+            progress = np.clip(progress, 0.0, 1.0)
+
+            # Interpolate color
+            start_color = self.color[fading]
+            target_color = self.target_color[fading]
+            self.color[fading] = (
+                start_color + (target_color - start_color) * progress[:, None]
+            ).astype(np.int16)
+
+            self.fade_duration[fading[progress >= 1.0]] = 0
+
+        # Effect animations - fáze závisí jen na čase a efektu, takže všechna
+        # světla se stejným efektem dostanou jednu hodnotu najednou
+        for code, rows in self._rows_by_effect(index):
+            if code == 0:
+                # Pro světla bez efektů, ale zapnutá, plná intenzita
+                self.intensity[rows] = 1.0
+                continue
+
+            effect_progress = (current_time * _EFFECT_RATES[code]) % 1.0
+            if code == 1:
+                # Strobe effect - rychlé blikání
+                intensity = 1.0 if effect_progress < 0.3 else 0.1
+            elif code == 2:
+                # Pulse effect - pomalé pulzování
+                intensity = 0.3 + 0.7 * abs(math.sin(effect_progress * 2 * math.pi))
+            else:
+                # Fade effect - pozvolné změny
+                sin_value = math.sin(effect_progress * 2 * math.pi)
+                intensity = 0.2 + 0.8 * (sin_value + 1) / 2
+
+            self.effect_progress[rows] = effect_progress
+            self.intensity[rows] = intensity
+
+    def render_colors(self) -> list[tuple[int, int, int]]:
+        """Vrátí barvy všech světel s intenzitou, jako LightFixture.get_render_color."""
+        # Kanály jsou kladné, astype tedy ořezává stejně jako int()
+        colors = (self.color * self.intensity[:, None]).astype(np.int16)
+        colors[~self.is_on | (self.intensity <= 0)] = 10  # Tmavě šedá když je vypnuto
+        return [tuple(color) for color in colors.tolist()]
+
+    def _rows_by_effect(self, index: int | None) -> list[tuple[int, object]]:
+        """Vrátí (kód efektu, indexy) zapnutých světel s animovaným efektem."""
+        if index is not None:
+            code = int(self.effect[index])
+            if self.is_on[index] and code != _EFFECT_OTHER:
+                return [(code, index)]
+            return []
+
+        if self._effect_rows is None:
+            animated = self.is_on & (self.effect != _EFFECT_OTHER)
+            self._effect_rows = []
+            for code in range(len(_EFFECT_RATES)):
+                rows = np.flatnonzero(animated & (self.effect == code))
+                if rows.size:
+                    self._effect_rows.append((code, rows))
+
+        return self._effect_rows
+
+
 class LightFixture:
     """Reprezentace světelného zařízení."""
 
     def __init__(
-        self, name: str, position: tuple[int, int], fixture_type: str, size: int = 20
+        self,
+        name: str,
+        position: tuple[int, int],
+        fixture_type: str,
+        size: int = 20,
+        arrays: _FixtureArrays | None = None,
     ):
         self.name = name
         self.position = position
         self.fixture_type = fixture_type
         self.size = size
 
-        # Light state
-        self.is_on = False
-        self.color = (0, 0, 0)  # RGB
-        self.intensity = 0.0  # 0.0 - 1.0
-        self.effect = None  # strobe, pulse, fade, etc.
-        self.effect_progress = 0.0
-
-        # Animation
-        self.target_color = (0, 0, 0)
-        self.fade_start_time = 0
-        self.fade_duration = 0
+        # Light state - řádek ve sdílených polích renderu (nebo ve vlastních)
+        self._arrays = arrays if arrays is not None else _FixtureArrays()
+        self._index = self._arrays.add()
+        self._effect = None  # strobe, pulse, fade, etc.
+
+    @property
+    def is_on(self) -> bool:
+        """Zda světlo svítí."""
+        return bool(self._arrays.is_on[self._index])
+
+    @is_on.setter
+    def is_on(self, value: bool) -> None:
+        self._arrays.is_on[self._index] = value
+        self._arrays.invalidate()
+
+    @property
+    def color(self) -> tuple[int, int, int]:
+        """Aktuální barva RGB."""
+        return tuple(self._arrays.color[self._index].tolist())
+
+    @color.setter
+    def color(self, value: tuple[int, int, int]) -> None:
+        self._arrays.color[self._index] = value
+
+    @property
+    def intensity(self) -> float:
+        """Intenzita 0.0 - 1.0."""
+        return float(self._arrays.intensity[self._index])
+
+    @intensity.setter
+    def intensity(self, value: float) -> None:
+        self._arrays.intensity[self._index] = value
+
+    @property
+    def effect(self) -> str | None:
+        """Efekt (strobe, pulse, fade) nebo None."""
+        return self._effect
+
+    @effect.setter
+    def effect(self, value: str | None) -> None:
+        self._effect = value
+        code = _EFFECT_CODES.get(value, _EFFECT_OTHER) if value else 0
+        self._arrays.effect[self._index] = code
+        self._arrays.invalidate()
+
+    @property
+    def effect_progress(self) -> float:
+        """Fáze efektu v posledním snímku."""
+        return float(self._arrays.effect_progress[self._index])
+
+    @property
+    def target_color(self) -> tuple[int, int, int]:
+        """Cílová barva fade animace."""
+        return tuple(self._arrays.target_color[self._index].tolist())
+
+    @target_color.setter
+    def target_color(self, value: tuple[int, int, int]) -> None:
+        self._arrays.target_color[self._index] = value
+
+    @property
+    def fade_start_time(self) -> float:
+        """Čas začátku fade animace."""
+        return float(self._arrays.fade_start_time[self._index])
+
+    @fade_start_time.setter
+    def fade_start_time(self, value: float) -> None:
+        self._arrays.fade_start_time[self._index] = value
+
+    @property
+    def fade_duration(self) -> float:
+        """Délka fade animace (0 = bez fade)."""
+        return float(self._arrays.fade_duration[self._index])
+
+    @fade_duration.setter
+    def fade_duration(self, value: float) -> None:
+        self._arrays.fade_duration[self._index] = value
 
     def set_color(
         self, color: tuple[int, int, int], intensity: float = 1.0, effect: str = None
@@ -46,49 +306,7 @@ class LightFixture:
 
     def update(self, current_time: float) -> None:
         """Aktualizuje animace světla."""
-        # Fade animation
-        if self.fade_duration > 0:
-            progress = (current_time - self.fade_start_time) / self.fade_duration
-            progress = max(0.0, min(1.0, progress))
-
-            # Interpolate color
-            start_color = self.color
-            target_color = self.target_color
-
-            self.color = (
-                int(start_color[0] + (target_color[0] - start_color[0]) * progress),
-                int(start_color[1] + (target_color[1] - start_color[1]) * progress),
-                int(start_color[2] + (target_color[2] - start_color[2]) * progress),
-            )
-
-            if progress >= 1.0:
-                self.fade_duration = 0
-
-        # Effect animations
-        if self.effect == "strobe" and self.is_on:
-            # Strobe effect - rychlé blikání
-            strobe_rate = 8  # Hz
-            self.effect_progress = (current_time * strobe_rate) % 1.0
-            if self.effect_progress < 0.3:
-                self.intensity = 1.0
-            else:
-                self.intensity = 0.1
-
-        elif self.effect == "pulse" and self.is_on:
-            # Pulse effect - pomalé pulzování
-            pulse_rate = 3  # Hz
-            self.effect_progress = (current_time * pulse_rate) % 1.0
-            self.intensity = 0.3 + 0.7 * abs(math.sin(self.effect_progress * 2 * math.pi))
-
-        elif self.effect == "fade" and self.is_on:
-            # Fade effect - pozvolné změny
-            fade_rate = 1  # Hz
-            self.effect_progress = (current_time * fade_rate) % 1.0
-            self.intensity = 0.2 + 0.8 * (math.sin(self.effect_progress * 2 * math.pi) + 1) / 2
-
-        # Pro světla bez efektů, ale zapnutá, ujisti se že mají plnou intenzitu
-        elif self.is_on and not self.effect:
-            self.intensity = 1.0
+        self._arrays.update(current_time, self._index)
 
     def get_render_color(self) -> tuple[int, int, int]:
         """Vrátí barvu pro vykreslení s intenzitou."""
@@ -125,6 +343,7 @@ class SaunaRenderer:
         self.font_small = pygame.font.Font(None, 20)
         self.font_medium = pygame.font.Font(None, 24)
         self.font_large = pygame.font.Font(None, 32)
+        self._text_cache: dict[tuple, pygame.Surface] = {}
 
         # Colors
         self.bg_color = (20, 20, 25)
@@ -135,9 +354,26 @@ class SaunaRenderer:
         # Sauna layout (proportions)
         self.sauna_rect = pygame.Rect(50, 50, width - 300, height - 100)
 
+        # Plochy záře podle poloměru, znovu použité v každém snímku; mimo
+        # kotouč záře zůstávají černé, takže se jen překreslí barva kotouče.
+        # Blity se odesílají najednou, proto má každé použití v snímku svou
+        self._glow_cache: dict[int, list[pygame.Surface]] = {}
+
         # Initialize fixtures
         self.fixtures: dict[str, LightFixture] = {}
+        self._fixture_arrays = _FixtureArrays()
         self._create_sauna_fixtures()
+        self._group_cache: dict[str, list[str]] = {}
+
+        # Polygony diamantů a hvězd - pozice i velikost světel jsou pevné
+        self._fixture_points = {
+            key: self._polygon_points(fixture)
+            for key, fixture in self.fixtures.items()
+            if fixture.fixture_type in ("moving_head", "uv")
+        }
+
+        # Předkreslené tvary světel podle (klíč světla, barva)
+        self._shape_sprites: dict[tuple, tuple[pygame.Surface, tuple[int, int]]] = {}
 
         # Color mapping
         self.color_map = {
@@ -153,8 +389,21 @@ class SaunaRenderer:
             "white": (255, 255, 255),
         }
 
+        # Statické pozadí (stěny, lavice, kamna) se vykreslí jen jednou
+        self.screen.fill(self.bg_color)
+        self._draw_sauna_structure()
+        self._static_bg = self.screen.copy()
+
+        # Stav světel z minulého snímku (barva, poloměr záře); na displej se
+        # posílají jen oblasti světel, která se změnila, a UI panel
+        self._fixture_render_state: dict[str, tuple] = {}
+        self._ui_dirty_rect = pygame.Rect(width - 280, 20, 260, height - 40)
+        self._full_redraw = True
+
     def _create_sauna_fixtures(self) -> None:
         """Vytvoří světelná zařízení podle layoutu sauny."""
+        arrays = self._fixture_arrays
+
         # Ceiling spots (Bodovky) - 12 světel ve stropě
         ceiling_y = self.sauna_rect.top + 30
         ceiling_spacing = self.sauna_rect.width // 4
@@ -165,7 +414,7 @@ class SaunaRenderer:
             y = ceiling_y + row * 40
 
             self.fixtures[f"bodovka_{i + 1}"] = LightFixture(
-                f"Bodovka {i + 1}", (x, y), "ceiling_spot", size=25
+                f"Bodovka {i + 1}", (x, y), "ceiling_spot", size=25, arrays=arrays
             )
 
         # Wall spots (8 světel na stěnách)
@@ -185,7 +434,7 @@ class SaunaRenderer:
 
         for i, pos in enumerate(wall_spots_positions):
             self.fixtures[f"wall_spot_{i + 1}"] = LightFixture(
-                f"Wall Spot {i + 1}", pos, "wall_spot", size=20
+                f"Wall Spot {i + 1}", pos, "wall_spot", size=20, arrays=arrays
             )
 
         # LED strips na lavicích (11 segmentů)
@@ -194,7 +443,7 @@ class SaunaRenderer:
         for i in range(11):
             x = self.sauna_rect.left + bench_spacing // 2 + i * bench_spacing
             self.fixtures[f"led_lavice_{i + 1}"] = LightFixture(
-                f"LED Lavice {i + 1}", (x, bench_y), "led_strip", size=30
+                f"LED Lavice {i + 1}", (x, bench_y), "led_strip", size=30, arrays=arrays
             )
 
         # LED kamna (2 světla u kamen)
@@ -202,7 +451,11 @@ class SaunaRenderer:
         stove_y = self.sauna_rect.bottom - 120
         for i in range(2):
             self.fixtures[f"led_kamna_{i + 1}"] = LightFixture(
-                f"LED Kamna {i + 1}", (stove_x + i * 30, stove_y), "led_oven", size=25
+                f"LED Kamna {i + 1}",
+                (stove_x + i * 30, stove_y),
+                "led_oven",
+                size=25,
+                arrays=arrays,
             )
 
         # Moving heads (5 světel)
@@ -216,7 +469,7 @@ class SaunaRenderer:
 
         for i, pos in enumerate(moving_positions):
             self.fixtures[f"moving_head_{i + 1}"] = LightFixture(
-                f"Moving Head {i + 1}", pos, "moving_head", size=18
+                f"Moving Head {i + 1}", pos, "moving_head", size=18, arrays=arrays
             )
 
         # UV světla (2 světla)
@@ -227,7 +480,7 @@ class SaunaRenderer:
 
         for i, pos in enumerate(uv_positions):
             self.fixtures[f"uv_{i + 1}"] = LightFixture(
-                f"UV {i + 1}", pos, "uv", size=15
+                f"UV {i + 1}", pos, "uv", size=15, arrays=arrays
             )
 
         logger.info(f"Created {len(self.fixtures)} light fixtures")
@@ -249,69 +502,13 @@ class SaunaRenderer:
             elif action == "update":
                 self._update_fixture_group(fixture_group, progress, event)
 
-        # Update all fixture animations
-        for fixture in self.fixtures.values():
-            fixture.update(current_time)
+        # Update all fixture animations - jeden vektorový krok pro všechna světla
+        self._fixture_arrays.update(current_time)
 
     def _parse_scene_path(self, path: str) -> tuple[str, str]:
         """Parsuje scene path pro určení skupiny světel a barvy."""
-        if path == "OFF":
-            return "all", "off"
-
-        # Extract fixture group and color from path
-        # Examples: "LED_walls/Walls_all/Walls_red.scex"
-        #          "Bodovky/Bodovky_all/Bodovka_blue.scex"
-        #          "LED_Walls/Walls_single/Walls_11/Walls_11_white - studená.scex"
-
-        parts = path.split("/")
-        if len(parts) >= 2:
-            group = parts[0].lower()
-
-            # Rozpoznej jestli je to single nebo all
-            if len(parts) >= 3:
-                if "single" in parts[1].lower():
-                    # Pro single light - použij specifický název
-                    if len(parts) >= 4:
-                        group = parts[2].lower()  # např. "Walls_11"
-                    else:
-                        group = parts[1].lower()
-                elif "all" in parts[1].lower():
-                    # Pro all lights - použij základní skupinu
-                    group = parts[0].lower()
-                else:
-                    group = parts[1].lower()
-
-            filename = parts[-1] if len(parts) > 2 else parts[1]
-
-            # Extract color from filename - zlepšené rozpoznávání
-            color = "white"
-            filename_lower = filename.lower()
-
-            # Rozpoznání barev v různých formátech
-            if "red" in filename_lower or "červen" in filename_lower:
-                color = "red"
-            elif "blue" in filename_lower or "modr" in filename_lower:
-                color = "blue"
-            elif "green" in filename_lower or "zelen" in filename_lower:
-                color = "green"
-            elif "yellow" in filename_lower or "žlut" in filename_lower:
-                color = "yellow"
-            elif "orange" in filename_lower or "oranžov" in filename_lower:
-                color = "orange"
-            elif "purple" in filename_lower or "fialov" in filename_lower:
-                color = "purple"
-            elif "azure" in filename_lower or "azurov" in filename_lower:
-                color = "azure"
-            elif "white - studená" in filename_lower or "studena" in filename_lower:
-                color = "white - studená"
-            elif "white - teplá" in filename_lower or "tepla" in filename_lower:
-                color = "white - teplá"
-            elif "white" in filename_lower or "bil" in filename_lower:
-                color = "white"
-
-            return group, color
-
-        return "unknown", "white"
+        # Cesty scén se v timeline opakují, výsledek je cachovaný
+        return _parse_scene_path(path)
 
     def _activate_fixture_group(
         self, group: str, color: str, event, current_time: float
@@ -371,6 +568,17 @@ class SaunaRenderer:
 
     def _get_fixtures_for_group(self, group: str) -> list[str]:
         """Vrátí klíče světel pro danou skupinu."""
+        # Světla se po inicializaci nemění, výsledek pro skupinu se tedy
+        # spočítá jen jednou (volá se při každém startu/konci/update eventu)
+        fixture_keys = self._group_cache.get(group)
+        if fixture_keys is None:
+            fixture_keys = self._match_fixtures_for_group(group)
+            self._group_cache[group] = fixture_keys
+
+        return fixture_keys
+
+    def _match_fixtures_for_group(self, group: str) -> list[str]:
+        """Najde klíče světel pro danou skupinu podle jejího názvu."""
         group_lower = group.lower()
 
         # Základní skupiny
@@ -446,20 +654,22 @@ class SaunaRenderer:
         self, current_time: float, duration: float, active_events: list = None
     ) -> None:
         """Vykreslí celou scénu."""
-        # Clear screen
-        self.screen.fill(self.bg_color)
-
-        # Draw sauna structure
-        self._draw_sauna_structure()
+        # Clear screen + sauna structure
+        self.screen.blit(self._static_bg, (0, 0))
 
         # Draw light fixtures
-        self._draw_light_fixtures()
+        dirty_rects = self._draw_light_fixtures()
 
         # Draw UI panel
         self._draw_ui_panel(current_time, duration, active_events)
+        dirty_rects.append(self._ui_dirty_rect)
 
-        # Update display
-        pygame.display.flip()
+        # Update display - celé okno jen poprvé a po odkrytí okna
+        if self._full_redraw:
+            pygame.display.flip()
+            self._full_redraw = False
+        else:
+            pygame.display.update(dirty_rects)
 
     def _draw_sauna_structure(self) -> None:
         """Vykreslí strukturu sauny."""
@@ -488,84 +698,64 @@ class SaunaRenderer:
         bench_text = self.font_small.render("LAVICE", True, self.text_color)
         self.screen.blit(bench_text, (bench_rect.x + 10, bench_rect.y - 25))
 
-    def _draw_light_fixtures(self) -> None:
-        """Vykreslí světelná zařízení."""
+    def _draw_light_fixtures(self) -> list[pygame.Rect]:
+        """Vykreslí světelná zařízení, vrátí oblasti změněné od minula."""
         active_count = 0
-        for fixture in self.fixtures.values():
-            color = fixture.get_render_color()
+        dirty_rects = []
+        blit_sequence = []
+        glow_uses: dict[int, int] = {}
+
+        # Stav všech světel najednou ze sdílených polí (pořadí jako self.fixtures)
+        arrays = self._fixture_arrays
+        for (key, fixture), is_on, intensity, color in zip(
+            self.fixtures.items(),
+            arrays.is_on.tolist(),
+            arrays.intensity.tolist(),
+            arrays.render_colors(),
+            strict=True,
+        ):
             pos = fixture.position
             size = fixture.size
+            glow_radius = 0
 
             # Debug: počítej aktivní světla
-            if fixture.is_on and fixture.intensity > 0.1:
+            if is_on and intensity > 0.1:
                 active_count += 1
 
-            # Draw light fixture
-            if fixture.fixture_type == "ceiling_spot":
-                # Kruh pro bodovky
-                pygame.draw.circle(self.screen, color, pos, size // 2)
-                pygame.draw.circle(self.screen, (100, 100, 100), pos, size // 2, 2)
-
-            elif fixture.fixture_type == "wall_spot":
-                # Čtverec pro wall spoty
-                rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, (100, 100, 100), rect, 2)
-
-            elif fixture.fixture_type == "led_strip":
-                # Obdélník pro LED pásky
-                rect = pygame.Rect(pos[0] - size // 2, pos[1] - 10, size, 20)
-                pygame.draw.rect(self.screen, color, rect)
-                pygame.draw.rect(self.screen, (100, 100, 100), rect, 1)
-
-            elif fixture.fixture_type == "led_oven":
-                # Kruh pro LED kamna
-                pygame.draw.circle(self.screen, color, pos, size // 2)
-                pygame.draw.circle(self.screen, (150, 100, 100), pos, size // 2, 2)
-
-            elif fixture.fixture_type == "moving_head":
-                # Diamant pro moving heads
-                points = [
-                    (pos[0], pos[1] - size // 2),
-                    (pos[0] + size // 2, pos[1]),
-                    (pos[0], pos[1] + size // 2),
-                    (pos[0] - size // 2, pos[1]),
-                ]
-                pygame.draw.polygon(self.screen, color, points)
-                pygame.draw.polygon(self.screen, (100, 100, 100), points, 2)
-
-            elif fixture.fixture_type == "uv":
-                # Hvězda pro UV
-                star_points = []
-                for i in range(8):
-                    angle = i * math.pi / 4
-                    radius = size // 2 if i % 2 == 0 else size // 4
-                    x = pos[0] + radius * math.cos(angle)
-                    y = pos[1] + radius * math.sin(angle)
-                    star_points.append((x, y))
-                pygame.draw.polygon(self.screen, color, star_points)
-                pygame.draw.polygon(self.screen, (150, 0, 255), star_points, 1)
+            # Draw light fixture - předkreslený tvar v aktuální barvě
+            blit_sequence.append(self._get_shape_sprite(key, fixture, color))
 
             # Draw light glow effect if intensity > 0
-            if fixture.intensity > 0.3:
-                glow_radius = int(size * 1.5 * fixture.intensity)
-                glow_color = (*color, int(30 * fixture.intensity))
-
-                # Create glow surface with alpha
-                glow_surf = pygame.Surface(
-                    (glow_radius * 2, glow_radius * 2), pygame.SRCALPHA
+            if intensity > 0.3:
+                glow_radius = int(size * 1.5 * intensity)
+
+                # BLEND_ADD přičítá jen RGB (alfa se ignoruje), záře je tedy
+                # kotouč barvy světla: jeden kruh do připravené plochy
+                slot = glow_uses.get(glow_radius, 0)
+                glow_uses[glow_radius] = slot + 1
+                glow_surf = self._get_glow_surface(glow_radius, slot)
+                pygame.draw.circle(
+                    glow_surf, color, (glow_radius, glow_radius), glow_radius
                 )
-                glow_center = (glow_radius, glow_radius)
-
-                for r in range(glow_radius, 0, -2):
-                    alpha = int(
-                        20 * fixture.intensity * (glow_radius - r) / glow_radius
-                    )
-                    glow_color_alpha = (*color, alpha)
-                    pygame.draw.circle(glow_surf, glow_color_alpha, glow_center, r)
 
                 glow_pos = (pos[0] - glow_radius, pos[1] - glow_radius)
-                self.screen.blit(glow_surf, glow_pos, special_flags=pygame.BLEND_ADD)
+                blit_sequence.append((glow_surf, glow_pos, None, pygame.BLEND_ADD))
+
+            # Změněné světlo: oblast pokrývá tvar i starou a novou záři
+            state = (color, glow_radius)
+            prev_state = self._fixture_render_state.get(key)
+            if state != prev_state:
+                self._fixture_render_state[key] = state
+                half = max(size // 2 + 2, 12, glow_radius)
+                if prev_state is not None:
+                    half = max(half, prev_state[1])
+                side = 2 * half + 1
+                dirty_rects.append(
+                    pygame.Rect(pos[0] - half, pos[1] - half, side, side)
+                )
+
+        # Tvary i záře v původním pořadí jedním voláním
+        self.screen.blits(blit_sequence, doreturn=False)
 
         # Debug log each few frames
         if hasattr(self, '_frame_count'):
@@ -576,6 +766,112 @@ class SaunaRenderer:
         if self._frame_count % 60 == 0 and active_count > 0:  # Every second
             logger.info(f"🎨 Rendering {active_count} active lights")
 
+        return dirty_rects
+
+    def _get_shape_sprite(
+        self, key: str, fixture: LightFixture, color: tuple[int, int, int]
+    ) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Vrátí předkreslený tvar světla v dané barvě a jeho pozici."""
+        sprite = self._shape_sprites.get((key, color))
+        if sprite is None:
+            # Pulzující světla mění barvu plynule, cache se občas vyprázdní
+            if len(self._shape_sprites) >= _SHAPE_CACHE_SIZE:
+                self._shape_sprites.clear()
+
+            pos = fixture.position
+            half = fixture.size // 2 + 2
+            origin = (pos[0] - half, pos[1] - half)
+            # Colorkey je rychlejší než alfa; stačí barva, kterou tvar nemá
+            colorkey = (0, 0, 1) if color != (0, 0, 1) else (0, 0, 2)
+            surface = pygame.Surface((2 * half + 1, 2 * half + 1)).convert()
+            surface.fill(colorkey)
+            self._draw_fixture_shape(surface, key, fixture, color, origin)
+            surface.set_colorkey(colorkey)
+            sprite = (surface, origin)
+            self._shape_sprites[(key, color)] = sprite
+
+        return sprite
+
+    def _draw_fixture_shape(
+        self,
+        surface: pygame.Surface,
+        key: str,
+        fixture: LightFixture,
+        color: tuple[int, int, int],
+        origin: tuple[int, int] = (0, 0),
+    ) -> None:
+        """Vykreslí tvar světla v dané barvě (bez záře), posunutý o origin."""
+        pos = (fixture.position[0] - origin[0], fixture.position[1] - origin[1])
+        size = fixture.size
+
+        if fixture.fixture_type == "ceiling_spot":
+            # Kruh pro bodovky
+            pygame.draw.circle(surface, color, pos, size // 2)
+            pygame.draw.circle(surface, (100, 100, 100), pos, size // 2, 2)
+
+        elif fixture.fixture_type == "wall_spot":
+            # Čtverec pro wall spoty
+            rect = pygame.Rect(pos[0] - size // 2, pos[1] - size // 2, size, size)
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, (100, 100, 100), rect, 2)
+
+        elif fixture.fixture_type == "led_strip":
+            # Obdélník pro LED pásky
+            rect = pygame.Rect(pos[0] - size // 2, pos[1] - 10, size, 20)
+            pygame.draw.rect(surface, color, rect)
+            pygame.draw.rect(surface, (100, 100, 100), rect, 1)
+
+        elif fixture.fixture_type == "led_oven":
+            # Kruh pro LED kamna
+            pygame.draw.circle(surface, color, pos, size // 2)
+            pygame.draw.circle(surface, (150, 100, 100), pos, size // 2, 2)
+
+        elif fixture.fixture_type == "moving_head":
+            # Diamant pro moving heads
+            points = [
+                (x - origin[0], y - origin[1]) for x, y in self._fixture_points[key]
+            ]
+            pygame.draw.polygon(surface, color, points)
+            pygame.draw.polygon(surface, (100, 100, 100), points, 2)
+
+        elif fixture.fixture_type == "uv":
+            # Hvězda pro UV
+            star_points = [
+                (x - origin[0], y - origin[1]) for x, y in self._fixture_points[key]
+            ]
+            pygame.draw.polygon(surface, color, star_points)
+            pygame.draw.polygon(surface, (150, 0, 255), star_points, 1)
+
+    def _polygon_points(self, fixture: LightFixture) -> list[tuple[float, float]]:
+        """Spočítá body polygonu pro moving head (diamant) nebo UV (hvězda)."""
+        pos = fixture.position
+        size = fixture.size
+
+        if fixture.fixture_type == "moving_head":
+            return [
+                (pos[0], pos[1] - size // 2),
+                (pos[0] + size // 2, pos[1]),
+                (pos[0], pos[1] + size // 2),
+                (pos[0] - size // 2, pos[1]),
+            ]
+
+        star_points = []
+        for i in range(8):
+            angle = i * math.pi / 4
+            radius = size // 2 if i % 2 == 0 else size // 4
+            x = pos[0] + radius * math.cos(angle)
+            y = pos[1] + radius * math.sin(angle)
+            star_points.append((x, y))
+        return star_points
+
+    def _get_glow_surface(self, radius: int, slot: int = 0) -> pygame.Surface:
+        """Vrátí slot-tou plochu záře pro daný poloměr, mimo kotouč černou."""
+        glow_surfs = self._glow_cache.setdefault(radius, [])
+        if slot == len(glow_surfs):
+            glow_surfs.append(pygame.Surface((radius * 2, radius * 2)).convert())
+
+        return glow_surfs[slot]
+
     def _draw_ui_panel(
         self, current_time: float, duration: float, active_events: list = None
     ) -> None:
@@ -593,13 +889,13 @@ class SaunaRenderer:
         y_offset = panel_y + 20
 
         # Title
-        title = self.font_large.render("DMX Visualizer", True, self.text_color)
+        title = self._text(self.font_large, "DMX Visualizer", self.text_color)
         self.screen.blit(title, (panel_x + 10, y_offset))
         y_offset += 50
 
         # Time info
         time_text = f"Time: {current_time:.1f}s / {duration:.1f}s"
-        time_surface = self.font_medium.render(time_text, True, self.text_color)
+        time_surface = self._text(self.font_medium, time_text, self.text_color)
         self.screen.blit(time_surface, (panel_x + 10, y_offset))
         y_offset += 30
 
@@ -615,7 +911,7 @@ class SaunaRenderer:
         y_offset += 40
 
         # Active events
-        events_title = self.font_medium.render("Active Events:", True, self.text_color)
+        events_title = self._text(self.font_medium, "Active Events:", self.text_color)
         self.screen.blit(events_title, (panel_x + 10, y_offset))
         y_offset += 30
 
@@ -624,21 +920,17 @@ class SaunaRenderer:
                 event_text = (
                     f"TL{event.timeline_index}: {event.path.split('/')[-1][:20]}"
                 )
-                event_surface = self.font_small.render(
-                    event_text, True, (200, 200, 200)
-                )
+                event_surface = self._text(self.font_small, event_text, (200, 200, 200))
                 self.screen.blit(event_surface, (panel_x + 15, y_offset))
                 y_offset += 20
         else:
-            no_events = self.font_small.render(
-                "No active events", True, (150, 150, 150)
-            )
+            no_events = self._text(self.font_small, "No active events", (150, 150, 150))
             self.screen.blit(no_events, (panel_x + 15, y_offset))
 
         y_offset += 40
 
         # Light fixtures status
-        fixtures_title = self.font_medium.render("Light Status:", True, self.text_color)
+        fixtures_title = self._text(self.font_medium, "Light Status:", self.text_color)
         self.screen.blit(fixtures_title, (panel_x + 10, y_offset))
         y_offset += 30
 
@@ -656,16 +948,36 @@ class SaunaRenderer:
         for fixture_type, (active, total) in active_counts.items():
             status_text = f"{fixture_type}: {active}/{total}"
             color = (100, 255, 100) if active > 0 else (150, 150, 150)
-            status_surface = self.font_small.render(status_text, True, color)
+            status_surface = self._text(self.font_small, status_text, color)
             self.screen.blit(status_surface, (panel_x + 15, y_offset))
             y_offset += 20
 
+    def _text(
+        self, font: pygame.font.Font, text: str, color: tuple[int, int, int]
+    ) -> pygame.Surface:
+        """Vrátí vykreslený text, stejné popisky se rasterizují jen jednou."""
+        key = (font, text, color)
+        surface = self._text_cache.get(key)
+        if surface is None:
+            # Čas se mění po desetinách, cache se proto občas vyprázdní
+            if len(self._text_cache) >= _TEXT_CACHE_SIZE:
+                self._text_cache.clear()
+
+            surface = font.render(text, True, color).convert_alpha()
+            self._text_cache[key] = surface
+
+        return surface
+
     def handle_events(self) -> bool:
         """Zpracuje pygame eventy. Vrátí False pokud má aplikace skončit."""
         for event in pygame.event.get():
             if event.type == pygame.QUIT:
                 return False
 
+            # Odkryté okno se musí překreslit celé
+            if event.type in (pygame.VIDEOEXPOSE, pygame.WINDOWEXPOSED):
+                self._full_redraw = True
+
             # Další eventy můžeme přidat později (klávesy, myš, etc.)
 
         return True
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import time
+from bisect import bisect_right
 from pathlib import Path
 from threading import Event
 from threading import Thread
@@ -35,6 +36,9 @@ class TimelinePlayer:
         # Timeline data
         self.timeline: DMXTimeline | None = None
         self.events: list[DMXEvent] = []
+        # Začátky a konce událostí v sekundách, paralelně k self.events
+        self._event_starts: list[float] = []
+        self._event_ends: list[float] = []
         self.active_events: dict[int, DMXEvent] = {}  # timeline_index -> event
 
         # Playback state
@@ -64,6 +68,16 @@ class TimelinePlayer:
             # Seřaď události podle času
             self.events.sort(key=lambda e: self._time_to_seconds(e.start_time))
 
+            # Časy se parsují jen jednou při načtení, ne v každém snímku;
+            # události bez délky trvají výchozích 5 s
+            self._event_starts = [
+                self._time_to_seconds(e.start_time) for e in self.events
+            ]
+            self._event_ends = [
+                start + (self._time_to_seconds(e.length) if e.length else 5.0)
+                for start, e in zip(self._event_starts, self.events, strict=True)
+            ]
+
             logger.info(f"Loaded timeline with {len(self.events)} events")
 
         except Exception as e:
@@ -216,18 +230,15 @@ class TimelinePlayer:
         new_active_events = {}
         light_changes = {}
 
-        for event in self.events:
-            event_start = self._time_to_seconds(event.start_time)
-
-            # Calculate event end time
-            if event.length:
-                event_duration = self._time_to_seconds(event.length)
-                event_end = event_start + event_duration
-            else:
-                event_end = event_start + 5.0  # Default duration
+        # Události jsou seřazené podle začátku: ty, které začínají po
+        # aktuálním čase, nemohou být aktivní
+        started = bisect_right(self._event_starts, self.current_time)
 
+        for event, event_start, event_end in zip(
+            self.events[:started], self._event_starts, self._event_ends, strict=False
+        ):
             # Check if event is active at current time
-            if event_start <= self.current_time <= event_end:
+            if self.current_time <= event_end:
                 new_active_events[event.timeline_index] = event
 
                 # Check if this is a new event
@@ -266,6 +277,21 @@ class TimelinePlayer:
     def _time_to_seconds(self, time_str: str) -> float:
         """Převede čas string na sekundy."""
         try:
+            # Rychlá cesta pro pevný formát H:MM:SS.f, který zapisují generátory:
+            # pozice polí jsou dané první dvojtečkou, bez split a seznamů
+            i = time_str.index(":")
+            if (
+                len(time_str) == i + 8
+                and time_str[i + 3] == ":"
+                and time_str[i + 6] == "."
+            ):
+                return (
+                    int(time_str[:i]) * 3600
+                    + int(time_str[i + 1 : i + 3]) * 60
+                    + int(time_str[i + 4 : i + 6])
+                    + int(time_str[i + 7]) / 10.0
+                )
+
             parts = time_str.split(":")
             hours = int(parts[0])
             minutes = int(parts[1])
@@ -0,0 +1,45 @@
+"""Shared fixtures for the test suite."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from dmx_analyzer.analysis_cache import clear_memory_cache
+
+
+@pytest.fixture(autouse=True)
+def _fresh_memory_cache() -> None:
+    """Start every test without analyses cached by earlier tests."""
+    clear_memory_cache()
+
+
+@pytest.fixture
+def audio_file(tmp_path: Path) -> Path:
+    """Create a stand-in audio file."""
+    audio_file = tmp_path / "song.wav"
+    audio_file.write_bytes(b"RIFF" + bytes(64))
+    return audio_file
+
+
+@pytest.fixture
+def record_calls(
+    monkeypatch: pytest.MonkeyPatch,
+) -> Callable[[object, str, Callable[..., object]], list[tuple]]:
+    """Return a patcher replacing an attribute with a call recorder.
+
+    The patcher installs a fake that records its positional arguments and
+    returns ``result(*args)``; it returns the list of recorded calls.
+    """
+
+    def patch(target: object, name: str, result: Callable[..., object]) -> list[tuple]:
+        calls: list[tuple] = []
+
+        def fake(*args: object) -> object:
+            calls.append(args)
+            return result(*args)
+
+        monkeypatch.setattr(target, name, fake)
+        return calls
+
+    return patch
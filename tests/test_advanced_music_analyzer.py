@@ -0,0 +1,136 @@
+"""Tests for the advanced music analyzer."""
+
+from pathlib import Path
+
+import librosa
+import numpy as np
+import pytest
+from scipy.ndimage import gaussian_filter1d
+
+from dmx_analyzer.advanced_music_analyzer import DEFAULT_SAMPLE_RATE
+from dmx_analyzer.advanced_music_analyzer import AdvancedMusicAnalyzer
+from dmx_analyzer.advanced_music_analyzer import analyze_for_lighting
+
+
+@pytest.fixture
+def signal(monkeypatch: pytest.MonkeyPatch) -> np.ndarray:
+    """Serve three seconds of two tones over noise instead of a real file."""
+    sr = DEFAULT_SAMPLE_RATE
+    t = np.arange(3 * sr) / sr
+    rng = np.random.default_rng(0)
+    y = (
+        0.5 * np.sin(2 * np.pi * 220 * t)
+        + 0.2 * np.sin(2 * np.pi * 3000 * t)
+        + 0.05 * rng.standard_normal(t.size)
+    ).astype(np.float32)
+
+    monkeypatch.setattr(librosa, "load", lambda *_args, **_kwargs: (y, sr))
+    return y
+
+
+class TestSpectralFeatures:
+    """Test the features computed from the shared STFT."""
+
+    def test_features_match_waveform_computation(
+        self, audio_file: Path, signal: np.ndarray
+    ) -> None:
+        """Test that shared-STFT features equal librosa's own from the signal."""
+        analyzer = AdvancedMusicAnalyzer()
+        sr, n_fft, hop = analyzer.sample_rate, analyzer.n_fft, analyzer.hop_length
+
+        analysis = analyzer.analyze_comprehensive(audio_file)
+
+        features = analysis["spectral_features"]
+        for name in ("centroid", "bandwidth", "rolloff"):
+            expected = getattr(librosa.feature, f"spectral_{name}")(
+                y=signal, sr=sr, n_fft=n_fft, hop_length=hop
+            )[0]
+            np.testing.assert_allclose(
+                getattr(features, f"spectral_{name}"), expected, rtol=1e-4
+            )
+        np.testing.assert_allclose(
+            features.spectral_contrast,
+            librosa.feature.spectral_contrast(
+                y=signal, sr=sr, n_fft=n_fft, hop_length=hop
+            ),
+            rtol=1e-4,
+        )
+
+    def test_band_energies_are_mean_magnitudes(
+        self, audio_file: Path, signal: np.ndarray
+    ) -> None:
+        """Test that band energies average the magnitude inside each band."""
+        analyzer = AdvancedMusicAnalyzer()
+        magnitude = np.abs(
+            librosa.stft(signal, n_fft=analyzer.n_fft, hop_length=analyzer.hop_length)
+        )
+        freqs = librosa.fft_frequencies(sr=analyzer.sample_rate, n_fft=analyzer.n_fft)
+
+        bands = analyzer.analyze_comprehensive(audio_file)["frequency_bands"]
+
+        for name, (low, high) in analyzer.frequency_bands.items():
+            mask = (freqs >= low) & (freqs <= high)
+            expected = gaussian_filter1d(magnitude[mask].mean(axis=0), sigma=1.0)
+            np.testing.assert_allclose(getattr(bands, name), expected, rtol=1e-4)
+
+
+class TestHarmonicContent:
+    """Test the harmonic/percussive split on the shared STFT."""
+
+    def test_strengths_are_spectral_rms_ratios(
+        self, audio_file: Path, signal: np.ndarray
+    ) -> None:
+        """Test that the strengths are RMS ratios of the split spectrogram."""
+        analyzer = AdvancedMusicAnalyzer()
+        stft = librosa.stft(
+            signal, n_fft=analyzer.n_fft, hop_length=analyzer.hop_length
+        )
+        harmonic_part, percussive_part = librosa.decompose.hpss(stft)
+        total_energy = np.sum(np.abs(stft) ** 2)
+
+        harmonic = analyzer.analyze_comprehensive(audio_file)["harmonic"]
+
+        assert sorted(harmonic) == [
+            "chroma",
+            "estimated_key",
+            "harmonic_strength",
+            "key_profile",
+            "percussive_strength",
+        ]
+        for name, part in (
+            ("harmonic_strength", harmonic_part),
+            ("percussive_strength", percussive_part),
+        ):
+            expected = np.sqrt(np.sum(np.abs(part) ** 2) / total_energy)
+            assert harmonic[name] == pytest.approx(expected, rel=1e-4)
+
+
+class TestLoadErrors:
+    """Test how failures while loading audio are reported."""
+
+    def test_unreadable_file_is_a_value_error(
+        self, audio_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a load failure is reported as an unusable input file."""
+
+        def fail_load(*_args: object, **_kwargs: object) -> None:
+            raise EOFError
+
+        monkeypatch.setattr(librosa, "load", fail_load)
+
+        with pytest.raises(ValueError, match="Could not load audio file: EOFError"):
+            analyze_for_lighting(audio_file)
+
+    def test_analysis_bug_propagates(
+        self, audio_file: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that errors outside loading keep their own type."""
+
+        def broken_load(*_args: object, **_kwargs: object) -> None:
+            msg = "sr"
+            raise KeyError(msg)
+
+        monkeypatch.setattr(librosa, "load", broken_load)
+
+        with pytest.raises(KeyError):
+            analyze_for_lighting(audio_file)
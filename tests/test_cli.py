@@ -0,0 +1,117 @@
+"""Tests for the command line interface."""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from dmx_analyzer.__main__ import cli
+
+HEAVY_MODULES = ("dmx_analyzer.music_analyzer", "librosa", "numpy")
+
+
+def heavy_modules_after(args: list[str]) -> list[str]:
+    """Run the CLI in a fresh interpreter and list heavy modules it imported."""
+    code = (
+        "import sys\n"
+        "from dmx_analyzer.__main__ import cli\n"
+        "try:\n"
+        f"    cli({args!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"print('loaded:', *[m for m in {HEAVY_MODULES!r} if m in sys.modules])\n"
+    )
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Log records may be flushed after the marker line, so search for it
+    marker = next(
+        line for line in result.stdout.splitlines() if line.startswith("loaded:")
+    )
+    return marker.split()[1:]
+
+
+class TestCli:
+    """Test CLI commands that do not need real audio analysis."""
+
+    def test_analyze_dry_run(self, tmp_path: Path) -> None:
+        """Test that dry run reports the planned analysis."""
+        audio_file = tmp_path / "song.wav"
+        audio_file.touch()
+
+        result = CliRunner().invoke(cli, ["analyze", "--dry-run", str(audio_file)])
+
+        assert result.exit_code == 0
+        assert f"Would analyze {audio_file} -> auto-generated" in result.output
+
+    def test_quiet_suppresses_progress(self, tmp_path: Path) -> None:
+        """Test that --quiet silences progress output."""
+        audio_file = tmp_path / "song.wav"
+        audio_file.touch()
+
+        result = CliRunner().invoke(
+            cli, ["--quiet", "spectacular", "--dry-run", str(audio_file)]
+        )
+
+        assert result.exit_code == 0
+        assert result.output == ""
+
+    def test_missing_audio_file(self, tmp_path: Path) -> None:
+        """Test that a missing input file is rejected during parsing."""
+        audio_file = tmp_path / "missing.wav"
+
+        result = CliRunner().invoke(cli, ["analyze", "--dry-run", str(audio_file)])
+
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+
+    def test_directory_audio_file(self, tmp_path: Path) -> None:
+        """Test that a directory is rejected where an audio file is expected."""
+        result = CliRunner().invoke(cli, ["analyze", "--dry-run", str(tmp_path)])
+
+        assert result.exit_code == 2
+        assert "is a directory" in result.output
+
+    def test_dmx_config_is_checked(self, audio_file: Path) -> None:
+        """Test that the fixtures option gets the same existing-file checks."""
+        result = CliRunner().invoke(
+            cli, ["analyze", "--dry-run", str(audio_file), "--dmx-config", "nope"]
+        )
+
+        assert result.exit_code == 2
+        assert "does not exist" in result.output
+
+    # librosa warns that the audioread fallback it tries last is deprecated
+    @pytest.mark.filterwarnings("ignore::FutureWarning")
+    def test_spectacular_reports_corrupt_audio(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that an undecodable input is reported as a user error."""
+        monkeypatch.setenv("HOME", str(tmp_path))
+        audio_file = tmp_path / "corrupt.wav"
+        audio_file.write_bytes(b"not audio" * 100)
+
+        result = CliRunner().invoke(cli, ["spectacular", str(audio_file)])
+
+        assert result.exit_code == 1
+        assert (
+            "Error creating spectacular show: Could not load audio file"
+            in result.output
+        )
+
+    def test_version_skips_heavy_imports(self) -> None:
+        """Test that --version does not import the analysis stack."""
+        assert heavy_modules_after(["--version"]) == []
+
+    def test_dry_run_skips_heavy_imports(self, tmp_path: Path) -> None:
+        """Test that dry runs return before importing the analyzers."""
+        audio_file = tmp_path / "song.wav"
+        audio_file.touch()
+
+        for command in ("analyze", "spectacular"):
+            assert heavy_modules_after([command, "--dry-run", str(audio_file)]) == []
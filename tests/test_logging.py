@@ -1,11 +1,19 @@
 """Tests for logging utilities."""
 
 import logging
+import subprocess
+import sys
+from logging.handlers import MemoryHandler
 from pathlib import Path
 
-from your_package.logging import clear_logger_cache
-from your_package.logging import get_logger
-from your_package.logging import setup_logging
+import pytest
+
+from dmx_analyzer.logging import BUFFER_CAPACITY
+from dmx_analyzer.logging import clear_logger_cache
+from dmx_analyzer.logging import flush_logs
+from dmx_analyzer.logging import get_logger
+from dmx_analyzer.logging import setup_logging
+from dmx_analyzer.logging import validate_log_level
 
 
 class TestLogging:
@@ -53,6 +61,16 @@ class TestLogging:
         assert initial_handler_count == final_handler_count
         assert initial_handler_count > 0  # Should have at least one handler
 
+    def test_get_logger_cached_configuration(self) -> None:
+        """Test that repeated calls reuse the configured handlers."""
+        logger1 = get_logger("test.module")
+        handlers = list(logger1.handlers)
+
+        logger2 = get_logger("test.module")
+
+        assert logger2.handlers == handlers
+        assert all(a is b for a, b in zip(logger2.handlers, handlers, strict=True))
+
     def test_get_logger_with_file(self, tmp_path: Path) -> None:
         """Test logger with file output."""
         log_file = tmp_path / "test.log"
@@ -70,6 +88,69 @@ class TestLogging:
         assert "Test message" in content
         assert "test.module" in content
 
+    def test_get_logger_buffers_until_flush(self, tmp_path: Path) -> None:
+        """Test that records are batched until flushed or an error."""
+        log_file = tmp_path / "buffered.log"
+        logger = get_logger("test.buffered", log_file=log_file)
+
+        assert all(
+            isinstance(handler, MemoryHandler)
+            and handler.capacity == BUFFER_CAPACITY
+            and handler.flushLevel == logging.ERROR
+            for handler in logger.handlers
+        )
+
+        logger.info("Buffered message")
+        assert "Buffered message" not in log_file.read_text()
+
+        flush_logs()
+        assert "Buffered message" in log_file.read_text()
+
+        logger.warning("Warning message")
+        assert "Warning message" not in log_file.read_text()
+
+        logger.error("Error message")
+        assert "Warning message\n" in log_file.read_text()
+        assert "Error message" in log_file.read_text()
+
+    def test_get_logger_unbuffered(self, tmp_path: Path) -> None:
+        """Test that records are written immediately when buffering is off."""
+        log_file = tmp_path / "unbuffered.log"
+        logger = get_logger("test.unbuffered", log_file=log_file, buffered=False)
+
+        logger.info("Immediate message")
+
+        assert "Immediate message" in log_file.read_text()
+
+    def test_shared_buffer_keeps_order(self, tmp_path: Path) -> None:
+        """Test that loggers with the same outputs keep record order."""
+        log_file = tmp_path / "ordered.log"
+        first = get_logger("test.first", log_file=log_file, rich_console=False)
+        second = get_logger("test.second", log_file=log_file, rich_console=False)
+
+        first.info("one")
+        second.info("two")
+        assert log_file.read_text() == ""
+
+        first.error("three")
+
+        lines = log_file.read_text().splitlines()
+        assert [line.rsplit(" - ", 1)[1] for line in lines] == ["one", "two", "three"]
+
+    def test_reconfigure_replaces_handlers(self, tmp_path: Path) -> None:
+        """Test that a new configuration replaces the previous handlers."""
+        log_file = tmp_path / "reconfigured.log"
+        logger = get_logger("test.reconfigure", log_file=log_file)
+        logger.info("Before reconfiguration")
+        old_count = len(logger.handlers)
+
+        logger = get_logger("test.reconfigure", level="DEBUG")
+
+        # Pending records were flushed when the old handlers were detached
+        assert "Before reconfiguration" in log_file.read_text()
+        assert len(logger.handlers) == old_count - 1
+        assert logger.propagate is False
+
     def test_get_logger_levels(self) -> None:
         """Test different logging levels."""
         debug_logger = get_logger("test.debug", level="DEBUG")
@@ -80,6 +161,35 @@ class TestLogging:
         assert info_logger.level == logging.INFO
         assert warning_logger.level == logging.WARNING
 
+    def test_level_cache_follows_reconfiguration(self) -> None:
+        """Test that cached level checks are refreshed when the level changes."""
+        logger = get_logger("test.levels")
+        assert not logger.isEnabledFor(logging.DEBUG)
+
+        logger = get_logger("test.levels", level="DEBUG")
+
+        assert logger.isEnabledFor(logging.DEBUG)
+
+    def test_get_logger_keeps_level_without_argument(self) -> None:
+        """Test that a plain lookup does not reset an explicitly set level."""
+        get_logger("test.keep", level="DEBUG")
+
+        logger = get_logger("test.keep")
+
+        assert logger.level == logging.DEBUG
+
+    def test_get_logger_numeric_level(self) -> None:
+        """Test that numeric levels are accepted as-is."""
+        logger = get_logger("test.numeric", level=logging.ERROR)
+
+        assert logger.level == logging.ERROR
+
+    @pytest.mark.parametrize("level", ["LOUD", -1])
+    def test_validate_log_level_rejects_invalid(self, level: str | int) -> None:
+        """Test that unknown level names and negative numbers are rejected."""
+        with pytest.raises(ValueError, match="Invalid log level"):
+            validate_log_level(level)
+
     def test_no_propagation(self) -> None:
         """Test that loggers don't propagate to prevent duplicates."""
         logger = get_logger("test.module")
@@ -102,3 +212,19 @@ class TestLogging:
         # After clearing cache, should get a fresh logger
         # Note: They might have the same name but could be reconfigured
         assert logger1.name == logger2.name
+
+    def test_console_handler_created_lazily(self) -> None:
+        """Test that configuring a logger does not import Rich until it emits."""
+        code = (
+            "import sys; from dmx_analyzer.logging import get_logger; "
+            "get_logger('lazy').debug('dropped'); "
+            "print('rich' in sys.modules)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,138 @@
+"""Tests for the timeline data models."""
+
+import pytest
+from pydantic import ValidationError
+
+from dmx_analyzer.models import DMXEvent
+from dmx_analyzer.models import DMXTimeline
+
+
+class TestDMXEvent:
+    """Test event validation."""
+
+    @pytest.mark.parametrize("start_time", ["0:00:00", "0:01:30.5", "23:59:59.999"])
+    def test_valid_start_time(self, start_time: str) -> None:
+        """Test that H:MM:SS times with optional fractions are accepted."""
+        event = DMXEvent(timeline_index=3, start_time=start_time, path="a.scex")
+
+        assert event.start_time == start_time
+
+    @pytest.mark.parametrize(
+        "start_time", ["24:00:00", "0:60:00", "0:00:60", "0:00:00.1234", "0:00", "x"]
+    )
+    def test_invalid_start_time(self, start_time: str) -> None:
+        """Test that malformed or out-of-range times are rejected."""
+        with pytest.raises(ValidationError, match="Invalid time format"):
+            DMXEvent(timeline_index=3, start_time=start_time, path="a.scex")
+
+    def test_start_seconds_is_not_serialized(self) -> None:
+        """Test that the numeric sort time stays out of dumped event data."""
+        event = DMXEvent(
+            timeline_index=3, start_time="0:00:01.2", start_seconds=1.23, path="a.scex"
+        )
+
+        assert event.start_seconds == 1.23
+        assert "start_seconds" not in event.model_dump()
+
+
+class TestDMXTimeline:
+    """Test timeline lookups and serialization."""
+
+    def test_get_events_at_time(self) -> None:
+        """Test that lookups follow every change to the events list."""
+        first = DMXEvent(timeline_index=3, start_time="0:00:01.0", path="a.scex")
+        second = DMXEvent(timeline_index=4, start_time="0:00:01.0", path="b.scex")
+        timeline = DMXTimeline(events=[first])
+
+        assert timeline.get_events_at_time("0:00:01.0") == [first]
+        assert timeline.get_events_at_time("0:00:02.0") == []
+
+        timeline.add_event(second)
+        assert timeline.get_events_at_time("0:00:01.0") == [first, second]
+
+        timeline.events.append(second)
+        assert len(timeline.get_events_at_time("0:00:01.0")) == 3
+
+        timeline.events = [second]
+        assert timeline.get_events_at_time("0:00:01.0") == [second]
+
+        # In-place edits that keep the list length are seen as well
+        later = DMXEvent(timeline_index=5, start_time="0:00:02.0", path="c.scex")
+        timeline.events[0] = later
+        assert timeline.get_events_at_time("0:00:01.0") == []
+        assert timeline.get_events_at_time("0:00:02.0") == [later]
+
+        later.start_time = "0:00:03.0"
+        assert timeline.get_events_at_time("0:00:03.0") == [later]
+
+        timeline.events.extend([first, first])
+        del timeline.events[0]
+        assert timeline.get_events_at_time("0:00:03.0") == []
+        assert timeline.get_events_at_time("0:00:01.0") == [first, first]
+
+    def test_unvalidated_events_are_still_found(self) -> None:
+        """Test lookups on a timeline built without validation."""
+        event = DMXEvent(timeline_index=3, start_time="0:00:01.0", path="a.scex")
+        timeline = DMXTimeline.model_construct(events=[event])
+
+        assert timeline.get_events_at_time("0:00:01.0") == [event]
+
+        timeline.events.clear()
+        assert timeline.get_events_at_time("0:00:01.0") == []
+
+    def test_to_tml_format(self) -> None:
+        """Test the .tml layout of the header, audio and DMX events."""
+        timeline = DMXTimeline(
+            light_timelines=1,
+            audio_file="song.mp3",
+            audio_length="0:03:00.0",
+            events=[
+                DMXEvent(timeline_index=3, start_time="0:00:01.5", path="a.scex"),
+                DMXEvent(
+                    timeline_index=4,
+                    start_time="0:00:02.0",
+                    path="b.scex",
+                    length="0:00:01.0",
+                    fade_in=500,
+                    volume=0,
+                ),
+            ],
+        )
+
+        assert timeline.to_tml_format().splitlines() == [
+            "[Params]",
+            "Version = 0.2",
+            "CommentTimeLine = 0",
+            "LightTimeLines = 1",
+            "MediaTimeLines = 1",
+            "ShowWaveForm = 1",
+            "MaxTime = 0:30:00",
+            "Zoom = 0",
+            "TimeLine_1 = V I D E O   P I C T U R E   T I M E L I N E",
+            "TimeLine_2 = A U D I O   T I M E L I N E",
+            "TimeLine_3 = L I G H T   S C E N E   T I M E L I N E   #   1",
+            "[Event_0]",
+            "TimeLineIndex = 2",
+            "StartTime = 0:00:00.0",
+            "Path = song.mp3",
+            "Length = 0:03:00.0",
+            "[Event_1]",
+            "TimeLineIndex = 3",
+            "StartTime = 0:00:01.5",
+            "Path = a.scex",
+            "Speed = 100",
+            "SpeedType = 2",
+            "[Event_2]",
+            "TimeLineIndex = 4",
+            "StartTime = 0:00:02.0",
+            "Path = b.scex",
+            "Length = 0:00:01.0",
+            "FadeIn = 500",
+            "Volume = 0",
+            "Speed = 100",
+            "SpeedType = 2",
+        ]
+
+    def test_to_tml_format_has_no_trailing_newline(self) -> None:
+        """Test that the output ends with the last line of the last block."""
+        assert not DMXTimeline().to_tml_format().endswith("\n")
@@ -0,0 +1,133 @@
+"""Tests for the music analyzer."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import pytest
+
+from dmx_analyzer import analysis_cache
+from dmx_analyzer.analysis_cache import clear_memory_cache
+from dmx_analyzer.models import AudioAnalysis
+from dmx_analyzer.models import AudioFeatures
+from dmx_analyzer.music_analyzer import MusicAnalyzer
+
+
+class TestAnalysisCache:
+    """Test the in-memory and on-disk caches of file analyses."""
+
+    @pytest.fixture
+    def calls(self, record_calls: Callable[..., list[tuple]]) -> list[tuple]:
+        """Replace the full analysis with a recorder returning a fixed result."""
+
+        def fake_analyze(
+            _analyzer: MusicAnalyzer, audio_path: Path, override_bpm: float | None
+        ) -> AudioAnalysis:
+            features = AudioFeatures(
+                bpm=override_bpm or 120.0,
+                energy=0.5,
+                valence=0.5,
+                loudness=-20.0,
+                tempo_stability=1.0,
+            )
+            return AudioAnalysis(
+                file_path=audio_path,
+                duration=1.0,
+                features=features,
+                beats=[0.5],
+                spectral_centroids=[1000.0],
+                onset_times=[0.1],
+            )
+
+        return record_calls(MusicAnalyzer, "_analyze", fake_analyze)
+
+    def test_unchanged_file_is_analyzed_once(
+        self, tmp_path: Path, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that a later run with the same cache directory hits the disk."""
+        first = MusicAnalyzer(cache=tmp_path / "cache").analyze_file(audio_file)
+        clear_memory_cache()
+        second = MusicAnalyzer(cache=tmp_path / "cache").analyze_file(audio_file)
+
+        assert len(calls) == 1
+        assert second == first
+
+    def test_key_follows_contents_and_bpm(
+        self, tmp_path: Path, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that changed contents or another BPM override is re-analyzed."""
+        analyzer = MusicAnalyzer(cache=tmp_path / "cache")
+
+        analyzer.analyze_file(audio_file)
+        analyzer.analyze_file(audio_file, 128.0)
+        audio_file.write_bytes(b"RIFF" + bytes(65))
+        analyzer.analyze_file(audio_file)
+
+        assert [bpm for _, _, bpm in calls] == [None, 128.0, None]
+
+    @pytest.mark.usefixtures("calls")
+    def test_copied_file_keeps_its_path(self, tmp_path: Path, audio_file: Path) -> None:
+        """Test that a hit for a copied file reports the copy's path."""
+        analyzer = MusicAnalyzer(cache=tmp_path / "cache")
+        copy = tmp_path / "copy.wav"
+        copy.write_bytes(audio_file.read_bytes())
+
+        analyzer.analyze_file(audio_file)
+
+        assert analyzer.analyze_file(copy).file_path == copy
+
+    def test_default_cache_stays_in_memory(
+        self, tmp_path: Path, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that without a cache directory analyses are only kept in memory."""
+        first = MusicAnalyzer().analyze_file(audio_file)
+        second = MusicAnalyzer().analyze_file(audio_file)
+        clear_memory_cache()
+        MusicAnalyzer().analyze_file(audio_file)
+
+        assert len(calls) == 2
+        assert second == first
+        assert sorted(tmp_path.iterdir()) == [audio_file]
+
+    def test_memory_keeps_recent_analyses(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        tmp_path: Path,
+        audio_file: Path,
+        calls: list[tuple],
+    ) -> None:
+        """Test that the least recently used analysis is dropped when full."""
+        monkeypatch.setattr(analysis_cache, "MEMORY_CACHE_SIZE", 2)
+        other = tmp_path / "other.wav"
+        other.write_bytes(b"RIFF" + bytes(65))
+        analyzer = MusicAnalyzer()
+
+        analyzer.analyze_file(audio_file)
+        analyzer.analyze_file(other)
+        analyzer.analyze_file(audio_file)
+        analyzer.analyze_file(audio_file, 128.0)
+        analyzer.analyze_file(audio_file)
+        analyzer.analyze_file(other)
+
+        assert [(path.name, bpm) for _, path, bpm in calls] == [
+            ("song.wav", None),
+            ("other.wav", None),
+            ("song.wav", 128.0),
+            ("other.wav", None),
+        ]
+
+    @pytest.mark.usefixtures("calls")
+    def test_memory_hit_is_not_modified(self, tmp_path: Path, audio_file: Path) -> None:
+        """Test that reporting a copy's path leaves the cached analysis alone."""
+        analyzer = MusicAnalyzer()
+        copy = tmp_path / "copy.wav"
+        copy.write_bytes(audio_file.read_bytes())
+
+        analyzer.analyze_file(copy)
+
+        assert analyzer.analyze_file(audio_file).file_path == audio_file
+        assert analyzer.analyze_file(copy).file_path == copy
+
+    def test_missing_file(self, tmp_path: Path) -> None:
+        """Test that a missing file raises FileNotFoundError."""
+        with pytest.raises(FileNotFoundError, match="Audio file not found"):
+            MusicAnalyzer().analyze_file(tmp_path / "missing.wav")
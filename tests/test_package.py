@@ -0,0 +1,62 @@
+"""Tests for the package import surface."""
+
+import subprocess
+import sys
+
+import dmx_analyzer
+from dmx_analyzer import api
+from dmx_analyzer.models import DMXEvent
+
+
+class TestLazyImports:
+    """Test PEP 562 lazy attribute loading in the package root."""
+
+    def test_import_does_not_load_analyzers(self) -> None:
+        """Test that importing the package skips the heavy analysis modules."""
+        code = (
+            "import sys, dmx_analyzer; "
+            "print('dmx_analyzer.music_analyzer' in sys.modules, "
+            "'librosa' in sys.modules)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_lazy_attribute_resolves(self) -> None:
+        """Test that public classes are importable from the package root."""
+        assert dmx_analyzer.DMXEvent is DMXEvent
+        assert "DMXEvent" in dir(dmx_analyzer)
+
+    def test_version_exposed(self) -> None:
+        """Test that the version is available without lazy loading."""
+        assert dmx_analyzer.__version__ == "0.1.0"
+
+
+class TestApiModule:
+    """Test the CLI-free programmatic API module."""
+
+    def test_api_does_not_load_cli(self) -> None:
+        """Test that the API module never imports the CLI or Click."""
+        code = (
+            "import sys, dmx_analyzer.api; "
+            "print('dmx_analyzer.__main__' in sys.modules, 'click' in sys.modules)"
+        )
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+
+        assert result.stdout.split() == ["False", "False"]
+
+    def test_api_matches_package_exports(self) -> None:
+        """Test that the API module exposes the same classes as the package."""
+        assert api.__all__ == dmx_analyzer.__all__
+        for name in api.__all__:
+            assert getattr(api, name) is getattr(dmx_analyzer, name)
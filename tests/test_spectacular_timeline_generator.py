@@ -0,0 +1,79 @@
+"""Tests for the spectacular timeline generator."""
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dmx_analyzer import spectacular_timeline_generator
+from dmx_analyzer.analysis_cache import clear_memory_cache
+from dmx_analyzer.spectacular_timeline_generator import SpectacularTimelineGenerator
+
+
+class TestAnalysisCache:
+    """Test the in-memory and on-disk caches of advanced analyses."""
+
+    @pytest.fixture
+    def calls(self, record_calls: Callable[..., list[tuple]]) -> list[tuple]:
+        """Replace the analysis with a recorder returning a small result."""
+        return record_calls(
+            spectacular_timeline_generator,
+            "analyze_for_lighting",
+            lambda _audio_path: {
+                "duration": 1.5,
+                "curve": np.arange(4, dtype=np.float32),
+            },
+        )
+
+    def test_second_run_is_loaded_from_cache(
+        self, tmp_path: Path, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that a later run with the same cache directory hits the disk."""
+        generator = SpectacularTimelineGenerator(cache=tmp_path / "cache")
+
+        first = generator.analyze(audio_file)
+        clear_memory_cache()
+        second = generator.analyze(audio_file)
+
+        assert calls == [(audio_file,)]
+        assert [path.suffix for path in (tmp_path / "cache").iterdir()] == [".joblib"]
+        assert second["duration"] == first["duration"]
+        np.testing.assert_array_equal(second["curve"], first["curve"])
+
+    def test_changed_file_is_analyzed_again(
+        self, tmp_path: Path, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that the cache key follows the file contents."""
+        generator = SpectacularTimelineGenerator(cache=tmp_path / "cache")
+
+        generator.analyze(audio_file)
+        audio_file.write_bytes(b"RIFF" + bytes(65))
+        generator.analyze(audio_file)
+
+        assert len(calls) == 2
+
+    def test_default_cache_writes_nothing(
+        self, tmp_path: Path, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that without a cache directory nothing is written to disk."""
+        generator = SpectacularTimelineGenerator()
+
+        generator.analyze(audio_file)
+        generator.analyze(audio_file)
+        clear_memory_cache()
+        generator.analyze(audio_file)
+
+        assert len(calls) == 2
+        assert sorted(tmp_path.iterdir()) == [audio_file]
+
+    def test_unwritable_cache_keeps_analysis(
+        self, audio_file: Path, calls: list[tuple]
+    ) -> None:
+        """Test that a failed cache write still returns the analysis."""
+        generator = SpectacularTimelineGenerator(cache=audio_file / "cache")
+
+        analysis = generator.analyze(audio_file)
+
+        assert calls == [(audio_file,)]
+        assert analysis["duration"] == 1.5
@@ -0,0 +1,269 @@
+"""Tests for the basic timeline generator."""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from dmx_analyzer.models import AudioAnalysis
+from dmx_analyzer.models import AudioFeatures
+from dmx_analyzer.models import DMXFixture
+from dmx_analyzer.timeline_generator import TimelineGenerator
+from dmx_analyzer.timeline_generator import generate_dmx_timelines
+
+FIXTURES_INI = """\
+; Sauna fixtures
+[General]
+name = ignored
+
+[Fixture1]
+ID = 1
+name = Spot_#3
+address: 10
+model = RGBW spot
+
+# moving head
+[Fixture2]
+id=2
+name = MH oven
+address = 20
+model = Intimidator Spot 360
+group = heads
+"""
+
+
+class TestFormatTime:
+    """Test the formatting of event times."""
+
+    @pytest.mark.parametrize(
+        ("seconds", "expected"),
+        [
+            (0.04, "0:00:00.0"),
+            (2.3, "0:00:02.3"),
+            (0.96, "0:00:01.0"),
+            (0.94, "0:00:00.9"),
+            (59.96, "0:01:00.0"),
+            (3723.45, "1:02:03.5"),
+        ],
+    )
+    def test_rounds_to_nearest_tenth(self, seconds: float, expected: str) -> None:
+        """Test that times round to the nearest tenth and carry into minutes."""
+        analysis = AudioAnalysis(
+            file_path=Path("song.wav"),
+            duration=seconds,
+            features=AudioFeatures(
+                bpm=120.0, energy=0.5, valence=0.5, loudness=-20.0, tempo_stability=1.0
+            ),
+            beats=[],
+            spectral_centroids=[1000.0],
+            onset_times=[],
+        )
+
+        timeline = TimelineGenerator().generate_timeline(analysis)
+
+        assert timeline.audio_length == expected
+
+
+class TestLoadFixtures:
+    """Test parsing of fixtures.ini files."""
+
+    def test_fixture_sections_are_loaded(self, tmp_path: Path) -> None:
+        """Test that fixture sections, keys and separators are read."""
+        fixtures_path = tmp_path / "fixtures.ini"
+        fixtures_path.write_text(FIXTURES_INI, encoding="utf-8")
+        generator = TimelineGenerator()
+
+        generator.load_fixtures(fixtures_path)
+
+        spot, head = generator.fixtures
+        assert (spot.id, spot.name, spot.address, spot.model, spot.group) == (
+            1,
+            "Spot_#3",
+            10,
+            "RGBW spot",
+            "",
+        )
+        assert (head.id, head.address, head.model, head.group) == (
+            2,
+            20,
+            "Intimidator Spot 360",
+            "heads",
+        )
+
+    def test_malformed_line_is_rejected(self, tmp_path: Path) -> None:
+        """Test that a fixture line without a separator fails to load."""
+        fixtures_path = tmp_path / "fixtures.ini"
+        fixtures_path.write_text("[Fixture1]\nid 1\n", encoding="utf-8")
+        generator = TimelineGenerator()
+
+        with pytest.raises(ValueError, match="Could not load fixtures"):
+            generator.load_fixtures(fixtures_path)
+
+    @pytest.mark.parametrize(
+        ("text", "message"),
+        [
+            ("[Fixture1]\nid = 1\n[Fixture1]\nid = 2\n", "section 'Fixture1'"),
+            ("[Fixture1]\nid = 1\nID: 2\n", "option 'id'"),
+        ],
+    )
+    def test_duplicates_are_rejected(
+        self, tmp_path: Path, text: str, message: str
+    ) -> None:
+        """Test that a repeated section or key fails to load, as in configparser."""
+        fixtures_path = tmp_path / "fixtures.ini"
+        fixtures_path.write_text(text, encoding="utf-8")
+        generator = TimelineGenerator()
+
+        with pytest.raises(
+            ValueError, match=f"Could not load fixtures.*{message} .*already exists"
+        ):
+            generator.load_fixtures(fixtures_path)
+
+    @pytest.mark.parametrize(
+        ("text", "expected"),
+        [
+            # [DEFAULT] values are inherited by every section
+            ("[DEFAULT]\ngroup = ceiling\n[Fixture1]\nid = 1\n", (1, "", "ceiling")),
+            # Indented lines continue the previous value
+            ("[Fixture1]\nid = 1\nname = Spot\n  left\n", (1, "Spot\nleft", "")),
+            # Text after a section header's closing bracket is ignored
+            ("[Fixture1] ; front\nid = 1\n", (1, "", "")),
+            # A key without a value reads as empty
+            ("[Fixture1]\nid = 1\nname =\n", (1, "", "")),
+        ],
+    )
+    def test_configparser_syntax_is_accepted(
+        self, tmp_path: Path, text: str, expected: tuple[int, str, str]
+    ) -> None:
+        """Test that fixtures.ini files keep their configparser meaning."""
+        fixtures_path = tmp_path / "fixtures.ini"
+        fixtures_path.write_text(text, encoding="utf-8")
+        generator = TimelineGenerator()
+
+        generator.load_fixtures(fixtures_path)
+
+        (fixture,) = generator.fixtures
+        assert (fixture.id, fixture.name, fixture.group) == expected
+
+    def test_missing_file_has_no_fixtures(self, tmp_path: Path) -> None:
+        """Test that a missing fixtures file loads no fixtures."""
+        generator = TimelineGenerator()
+
+        generator.load_fixtures(tmp_path / "missing.ini")
+
+        assert generator.fixtures == []
+
+
+class TestGenerateTimeline:
+    """Test event generation from an analysis."""
+
+    @pytest.fixture
+    def analysis(self) -> AudioAnalysis:
+        """Create a 60 s analysis with steady beats and varying energy."""
+        frames = np.arange(600)
+        return AudioAnalysis(
+            file_path=Path("song.wav"),
+            duration=60.0,
+            features=AudioFeatures(
+                bpm=120.0, energy=0.6, valence=0.7, loudness=-12.0, tempo_stability=0.9
+            ),
+            beats=np.arange(0.0, 60.0, 0.5).tolist(),
+            spectral_centroids=(2000 + 1500 * np.sin(frames / 20)).tolist(),
+            onset_times=np.arange(0.25, 60.0, 0.6).tolist(),
+        )
+
+    def _generate(self, analysis: AudioAnalysis, seed: int) -> list[dict]:
+        generator = TimelineGenerator(seed=seed)
+        generator.fixtures = [
+            DMXFixture(
+                id=1, name="Spot_#3", address=1, model="RGBW", group="w", channels=4
+            ),
+            DMXFixture(
+                id=2, name="MH", address=5, model="Intimidator", group="m", channels=4
+            ),
+        ]
+        timeline = generator.generate_timeline(analysis)
+        return [event.model_dump() for event in timeline.events]
+
+    def test_seed_reproduces_timeline(self, analysis: AudioAnalysis) -> None:
+        """Test that equal seeds give equal events of every kind."""
+        events = self._generate(analysis, seed=7)
+
+        assert events == self._generate(analysis, seed=7)
+        assert events != self._generate(analysis, seed=8)
+        assert {event["timeline_index"] for event in events} >= {3, 4, 5, 6, 7, 8}
+
+    @pytest.mark.parametrize(
+        "edit",
+        ["replace", "rename", "assign", "clear"],
+    )
+    def test_fixture_edits_reach_beat_events(
+        self, analysis: AudioAnalysis, edit: str
+    ) -> None:
+        """Test that every kind of fixture change reaches the beat events."""
+        generator = TimelineGenerator(seed=7)
+        generator.fixtures = [
+            DMXFixture(
+                id=1, name="MH", address=1, model="Intimidator", group="m", channels=4
+            )
+        ]
+        generator.generate_timeline(analysis)
+
+        spot = DMXFixture(
+            id=1, name="Spot_#3", address=1, model="RGBW", group="w", channels=4
+        )
+        if edit == "replace":
+            generator.fixtures[0] = spot
+        elif edit == "rename":
+            generator.fixtures[0].name = "Spot_#3"
+            generator.fixtures[0].model = "RGBW"
+        elif edit == "assign":
+            generator.fixtures = [spot]
+        else:
+            generator.fixtures.clear()
+            generator.fixtures.append(spot)
+        paths = [event.path for event in generator.generate_timeline(analysis).events]
+
+        assert not any(path.startswith("Moving_heads/") for path in paths)
+        assert any(
+            path.startswith("SPOTS_walls/SPOTS_single/SPOT_3/") for path in paths
+        )
+
+    def test_unsorted_analysis_gives_sorted_events(
+        self, analysis: AudioAnalysis
+    ) -> None:
+        """Test that beats and onsets out of time order still sort the events."""
+        shuffled = analysis.model_copy(
+            update={
+                "beats": analysis.beats[::-1],
+                "onset_times": analysis.onset_times[::-1],
+            }
+        )
+
+        starts = [event["start_time"] for event in self._generate(shuffled, 7)]
+
+        assert starts == sorted(starts)
+
+    def test_batch_generation_keeps_song_order(
+        self, analysis: AudioAnalysis, tmp_path: Path
+    ) -> None:
+        """Test that parallel batch generation returns one timeline per song."""
+        short = analysis.model_copy(update={"duration": 30.0})
+        output_paths = [tmp_path / "long.tml", tmp_path / "short.tml"]
+
+        timelines = generate_dmx_timelines(
+            [analysis, short], output_paths=output_paths, n_jobs=2
+        )
+
+        assert [timeline.audio_length for timeline in timelines] == [
+            "0:01:00.0",
+            "0:00:30.0",
+        ]
+        assert all(path.exists() for path in output_paths)
+
+    def test_batch_generation_checks_output_paths(
+        self, analysis: AudioAnalysis, tmp_path: Path
+    ) -> None:
+        """Test that the output paths must match the analyses one to one."""
+        with pytest.raises(ValueError, match="Expected 2 output paths"):
+            generate_dmx_timelines([analysis, analysis], output_paths=[tmp_path])